@@ -1,12 +1,57 @@
 """Alerting system for MITS Validator."""
 
+import asyncio
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Most recent alerts kept in AlertManager.alert_history; older ones are dropped
+_ALERT_HISTORY_SIZE = 1000
+
+# (metric, threshold key, alert type, message template, severity), checked in order
+_THRESHOLD_CHECKS = (
+    (
+        "error_rate_percent",
+        "error_rate_percent",
+        "HIGH_ERROR_RATE",
+        "Error rate is {value:.1f}% (threshold: {threshold}%)",
+        "error",
+    ),
+    (
+        "avg_response_time_seconds",
+        "response_time_seconds",
+        "HIGH_RESPONSE_TIME",
+        "Average response time is {value:.2f}s (threshold: {threshold}s)",
+        "warning",
+    ),
+    (
+        "memory_usage_percent",
+        "memory_usage_percent",
+        "HIGH_MEMORY_USAGE",
+        "Memory usage is {value:.1f}% (threshold: {threshold}%)",
+        "warning",
+    ),
+    (
+        "disk_usage_percent",
+        "disk_usage_percent",
+        "HIGH_DISK_USAGE",
+        "Disk usage is {value:.1f}% (threshold: {threshold}%)",
+        "warning",
+    ),
+    (
+        "consecutive_failures",
+        "consecutive_failures",
+        "CONSECUTIVE_FAILURES",
+        "Consecutive failures: {value} (threshold: {threshold})",
+        "critical",
+    ),
+)
+
 
 class AlertManager:
     """Manages alerts and notifications for the validation system."""
@@ -25,7 +70,7 @@ class AlertManager:
             "consecutive_failures": 5,
         }
         self.active_alerts: dict[str, dict[str, Any]] = {}
-        self.alert_history: list[dict[str, Any]] = []
+        self.alert_history: deque[dict[str, Any]] = deque(maxlen=_ALERT_HISTORY_SIZE)
         self.alert_cooldown = 300  # 5 minutes cooldown between same alerts
 
     async def check_alerts(self, metrics: dict[str, Any]) -> list[dict[str, Any]]:
@@ -39,67 +84,16 @@ class AlertManager:
         """
         triggered_alerts = []
 
-        # Check error rate
-        if "error_rate_percent" in metrics:
-            if metrics["error_rate_percent"] > self.alert_thresholds["error_rate_percent"]:
-                error_rate = metrics["error_rate_percent"]
-                threshold = self.alert_thresholds["error_rate_percent"]
-                alert = await self._create_alert(
-                    "HIGH_ERROR_RATE",
-                    f"Error rate is {error_rate:.1f}% (threshold: {threshold}%)",
-                    "error",
-                    metrics,
-                )
-                triggered_alerts.append(alert)
-
-        # Check response time
-        if "avg_response_time_seconds" in metrics:
-            response_time = metrics["avg_response_time_seconds"]
-            threshold = self.alert_thresholds["response_time_seconds"]
-            if response_time > threshold:
-                alert = await self._create_alert(
-                    "HIGH_RESPONSE_TIME",
-                    f"Average response time is {response_time:.2f}s (threshold: {threshold}s)",
-                    "warning",
-                    metrics,
-                )
-                triggered_alerts.append(alert)
-
-        # Check memory usage
-        if "memory_usage_percent" in metrics:
-            memory_usage = metrics["memory_usage_percent"]
-            threshold = self.alert_thresholds["memory_usage_percent"]
-            if memory_usage > threshold:
-                alert = await self._create_alert(
-                    "HIGH_MEMORY_USAGE",
-                    f"Memory usage is {memory_usage:.1f}% (threshold: {threshold}%)",
-                    "warning",
-                    metrics,
-                )
-                triggered_alerts.append(alert)
-
-        # Check disk usage
-        if "disk_usage_percent" in metrics:
-            disk_usage = metrics["disk_usage_percent"]
-            threshold = self.alert_thresholds["disk_usage_percent"]
-            if disk_usage > threshold:
-                alert = await self._create_alert(
-                    "HIGH_DISK_USAGE",
-                    f"Disk usage is {disk_usage:.1f}% (threshold: {threshold}%)",
-                    "warning",
-                    metrics,
-                )
-                triggered_alerts.append(alert)
-
-        # Check consecutive failures
-        if "consecutive_failures" in metrics:
-            failures = metrics["consecutive_failures"]
-            threshold = self.alert_thresholds["consecutive_failures"]
-            if failures > threshold:
+        for metric, threshold_key, alert_type, template, severity in _THRESHOLD_CHECKS:
+            value = metrics.get(metric)
+            if value is None:
+                continue
+            threshold = self.alert_thresholds[threshold_key]
+            if value > threshold:
                 alert = await self._create_alert(
-                    "CONSECUTIVE_FAILURES",
-                    f"Consecutive failures: {failures} (threshold: {threshold})",
-                    "critical",
+                    alert_type,
+                    template.format(value=value, threshold=threshold),
+                    severity,
                     metrics,
                 )
                 triggered_alerts.append(alert)
@@ -179,7 +173,7 @@ class AlertManager:
         Returns:
             List of recent alerts
         """
-        return self.alert_history[-limit:]
+        return list(self.alert_history)[-limit:]
 
     def get_alert_stats(self) -> dict[str, Any]:
         """Get alert statistics."""
@@ -215,9 +209,9 @@ class AlertNotifier:
 
     def __init__(self):
         """Initialize alert notifier."""
-        self.notification_handlers: list[callable] = []
+        self.notification_handlers: list[Callable[[dict[str, Any]], Awaitable[None]]] = []
 
-    def register_handler(self, handler: callable) -> None:
+    def register_handler(self, handler: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
         """Register a notification handler.
 
         Args:
@@ -231,11 +225,18 @@ class AlertNotifier:
         Args:
             alert: Alert to notify about
         """
-        for handler in self.notification_handlers:
-            try:
-                await handler(alert)
-            except Exception as e:
-                logger.error("Notification handler failed", error=str(e))
+        # Handlers do network I/O, so run them together; a failing handler is
+        # logged and does not stop the others
+        await asyncio.gather(*(self._run_handler(h, alert) for h in self.notification_handlers))
+
+    async def _run_handler(
+        self, handler: Callable[[dict[str, Any]], Awaitable[None]], alert: dict[str, Any]
+    ) -> None:
+        """Run one notification handler, logging rather than raising its failure."""
+        try:
+            await handler(alert)
+        except Exception as e:
+            logger.error("Notification handler failed", error=str(e))
 
     async def send_email_notification(self, alert: dict[str, Any]) -> None:
         """Send email notification (placeholder).
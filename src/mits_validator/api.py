@@ -3,14 +3,14 @@ from __future__ import annotations
 import os
 import time
 import uuid
+from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import UTC, datetime
 from typing import Any
 
-import fastapi
 import httpx
-import lxml
 from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from mits_validator import __version__
 from mits_validator.alerting import get_alert_manager
@@ -21,7 +21,11 @@ from mits_validator.metrics import get_metrics_collector
 from mits_validator.models import FindingLevel, ValidationRequest, ValidationResponse
 from mits_validator.profiles import get_profile
 from mits_validator.streaming_parser import MemoryOptimizedValidator
-from mits_validator.validation_engine import ValidationEngine, build_v1_envelope
+from mits_validator.validation_engine import (
+    ENGINE_VERSIONS,
+    build_v1_envelope,
+    get_engine,
+)
 
 # Create default values to avoid B008 error
 DEFAULT_FILE = File(None)
@@ -32,9 +36,26 @@ DEFAULT_SIZE = Form(10)
 MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", "10485760"))  # 10MB default
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))  # 30 seconds default
 
+# orjson is an optional extra; without it responses use the stdlib encoder
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    EnvelopeResponse: type[JSONResponse] = JSONResponse
+else:
+    EnvelopeResponse = ORJSONResponse
+
+# Content types accepted when a profile does not restrict them
+DEFAULT_ACCEPTABLE_CONTENT_TYPES = (
+    "application/xml",
+    "text/xml",
+    "application/octet-stream",  # Allow with warning
+    "text/plain",  # Allow with warning
+)
+
 app = FastAPI(
     title="MITS Validator API",
     version=__version__,
+    default_response_class=EnvelopeResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     description="Professional validator for MITS (Property Marketing / ILS) XML feeds",
@@ -51,7 +72,7 @@ app = FastAPI(
 )
 
 # Initialize validation engine
-validation_engine = ValidationEngine()
+validation_engine = get_engine()
 
 
 def _create_error_response(
@@ -85,7 +106,7 @@ def _create_error_response(
         "metadata": {
             "request_id": str(uuid.uuid4()),
             "timestamp": datetime.now(UTC).isoformat(),
-            "engine": {"fastapi": fastapi.__version__, "lxml": lxml.__version__},
+            "engine": dict(ENGINE_VERSIONS),
         },
     }
 
@@ -94,7 +115,7 @@ def _create_error_response(
         "X-Request-Id": request_id,
         "Cache-Control": "no-store",
     }
-    return JSONResponse(
+    return EnvelopeResponse(
         content=response_data,
         status_code=status_code,
         headers=headers,
@@ -155,7 +176,7 @@ async def validate_async(
     url: str = Query(None, description="URL to fetch XML from"),
     profile: str = Query("default", description="Validation profile to use"),
     max_memory_mb: int = Query(100, description="Maximum memory usage in MB"),
-):
+) -> JSONResponse:
     """Async validation endpoint for large files."""
     # Validate input
     if file is None and url is None:
@@ -181,6 +202,7 @@ async def validate_async(
     validation_request = ValidationRequest(
         content=content.decode("utf-8") if isinstance(content, bytes) else content,
         content_type=content_type,
+        source="file" if file is not None else "url",
     )
 
     # Generate validation ID
@@ -191,8 +213,7 @@ async def validate_async(
         validator = MemoryOptimizedValidator(max_memory_mb=max_memory_mb)
         result = await validator.validate_large_file(content)
 
-        # Convert to ValidationResponse format
-        return ValidationResponse(
+        return _async_response(
             summary={
                 "valid": result["valid"],
                 "total_findings": len(result["findings"]),
@@ -212,27 +233,60 @@ async def validate_async(
         async_engine = get_async_validation_engine()
         result = await async_engine.validate_async(validation_request, validation_id, profile)
 
-        # Convert to ValidationResponse format
-        return ValidationResponse(
-            summary={
-                "valid": result.valid,
-                "total_findings": len(result.findings),
-                "errors": len([f for f in result.findings if f.level == FindingLevel.ERROR]),
-                "warnings": len([f for f in result.findings if f.level == FindingLevel.WARNING]),
-            },
-            findings=[
+        errors = 0
+        warnings = 0
+        findings = []
+        for f in result.findings:
+            if f.level == FindingLevel.ERROR:
+                errors += 1
+            elif f.level == FindingLevel.WARNING:
+                warnings += 1
+            findings.append(
                 {
                     "level": f.level.value,
                     "code": f.code,
                     "message": f.message,
-                    "location": f.location.__dict__ if f.location else None,
+                    "location": asdict(f.location) if f.location else None,
                 }
-                for f in result.findings
-            ],
-            metadata=result.metadata,
+            )
+
+        return _async_response(
+            summary={
+                "valid": errors == 0,
+                "total_findings": len(findings),
+                "errors": errors,
+                "warnings": warnings,
+            },
+            findings=findings,
+            metadata={
+                "validation_id": validation_id,
+                "profile": profile,
+                "duration_ms": result.duration_ms,
+            },
         )
 
 
+def _async_response(
+    summary: dict[str, Any], findings: list[dict[str, Any]], metadata: dict[str, Any]
+) -> JSONResponse:
+    """Return an async validation payload in the ValidationResponse shape.
+
+    The payload is returned as a ready-made response so FastAPI does not
+    re-validate it against the response model.
+    """
+    return EnvelopeResponse(
+        content={
+            "api_version": "1.0",
+            "validator": None,
+            "input": None,
+            "summary": summary,
+            "findings": findings,
+            "derived": None,
+            "metadata": metadata,
+        }
+    )
+
+
 @app.get(
     "/alerts",
     tags=["monitoring"],
@@ -335,11 +389,7 @@ async def _validate_file_upload(
         )
         return _create_error_response(error_finding, 415, "file")
 
-    # Generate warning for suspicious content types
-    suspicious_types = ["application/octet-stream", "text/plain"]
-    if content_type.lower() in suspicious_types:
-        # This warning will be added to the validation results
-        pass  # Warning will be generated during validation
+    # Suspicious content types are reported as warnings by the WellFormed level
 
     # Read and check file size with profile limits
     content = await file.read()
@@ -362,20 +412,21 @@ async def _validate_file_upload(
         size_bytes=size_bytes,
     )
 
-    # Initialize validation engine with profile
-    engine = ValidationEngine(profile=profile)
+    # Reuse the process-wide engine for this profile
+    engine = get_engine(profile)
 
     # Perform validation with all levels in profile
     results = engine.validate(content, content_type=content_type)
 
     # Build v1 envelope
-    duration_ms = int((time.time() - start_time) * 1000)
+    end_time = time.time()
+    duration_ms = int((end_time - start_time) * 1000)
     response_data = build_v1_envelope(
-        validation_request, results, profile or "default", duration_ms
+        validation_request, results, profile or "default", duration_ms, now=end_time
     )
 
     # Add request ID header
-    return JSONResponse(
+    return EnvelopeResponse(
         content=response_data,
         headers={
             "X-Request-Id": response_data["metadata"]["request_id"],
@@ -412,16 +463,17 @@ async def _validate_url(
             size_bytes=size_bytes,
         )
 
-        # Initialize validation engine with profile
-        engine = ValidationEngine(profile=profile)
+        # Reuse the process-wide engine for this profile
+        engine = get_engine(profile)
 
         # Perform validation with all levels in profile
         results = engine.validate(content, content_type=content_type)
 
         # Build v1 envelope
-        duration_ms = int((time.time() - start_time) * 1000)
+        end_time = time.time()
+        duration_ms = int((end_time - start_time) * 1000)
         response_data = build_v1_envelope(
-            validation_request, results, profile or "default", duration_ms
+            validation_request, results, profile or "default", duration_ms, now=end_time
         )
 
     except Exception as e:
@@ -429,7 +481,7 @@ async def _validate_url(
         error_finding = create_finding("NETWORK:FETCH_ERROR", f"Failed to fetch URL: {str(e)}")
         return _create_error_response(error_finding, 502, "url")
 
-    return JSONResponse(
+    return EnvelopeResponse(
         content=response_data,
         headers={
             "X-Request-Id": response_data["metadata"]["request_id"],
@@ -455,6 +507,13 @@ async def _fetch_url_content(url: str, max_size_mb: int) -> tuple[bytes, str, in
                 # Get content type
                 content_type = response.headers.get("content-type", "application/octet-stream")
 
+                # Reject oversized bodies before downloading them
+                content_length = response.headers.get("content-length", "")
+                if content_length.isdigit() and int(content_length) > max_size_bytes:
+                    raise httpx.RequestError(
+                        f"Content size exceeds limit of {max_size_bytes} bytes"
+                    )
+
                 # Stream content with size limit
                 content = b""
                 async for chunk in response.aiter_bytes():
@@ -476,13 +535,11 @@ async def _fetch_url_content(url: str, max_size_mb: int) -> tuple[bytes, str, in
             raise Exception(f"NETWORK:REQUEST_ERROR - {str(e)}") from e
 
 
-def _is_acceptable_content_type(content_type: str, allowed_types: list[str] | None = None) -> bool:
+def _is_acceptable_content_type(
+    content_type: str, allowed_types: Sequence[str] | None = None
+) -> bool:
     """Check if content type is acceptable for XML validation."""
     if allowed_types is None:
-        allowed_types = [
-            "application/xml",
-            "text/xml",
-            "application/octet-stream",  # Allow with warning
-            "text/plain",  # Allow with warning
-        ]
-    return any(ct in content_type.lower() for ct in allowed_types)
+        allowed_types = DEFAULT_ACCEPTABLE_CONTENT_TYPES
+    content_type = content_type.lower()
+    return any(ct in content_type for ct in allowed_types)
@@ -2,6 +2,8 @@
 
 import asyncio
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import structlog
@@ -15,9 +17,13 @@ from mits_validator.models import (
     ValidationRequest,
     ValidationResult,
 )
+from mits_validator.validation.parsing import parse_document
 
 logger = structlog.get_logger(__name__)
 
+# How long cancel_validation waits for a cancelled validation to finish unwinding
+_CANCEL_WAIT_SECONDS = 1.0
+
 
 class AsyncValidationEngine:
     """Async validation engine for processing large XML files efficiently."""
@@ -29,9 +35,35 @@ class AsyncValidationEngine:
             max_concurrent_validations: Maximum number of concurrent validations
         """
         self.max_concurrent_validations = max_concurrent_validations
-        self.semaphore = asyncio.Semaphore(max_concurrent_validations)
+        # A counter under a condition rather than a semaphore, so the limit can
+        # be changed while validations are waiting
+        self._running = 0
+        self._slot_freed = asyncio.Condition()
         self.active_validations: dict[str, asyncio.Task] = {}
 
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Hold one of the concurrent validation slots."""
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._running < self.max_concurrent_validations)
+            self._running += 1
+        try:
+            yield
+        finally:
+            async with self._slot_freed:
+                self._running -= 1
+                self._slot_freed.notify()
+
+    async def set_max_concurrent_validations(self, limit: int) -> None:
+        """Change the concurrency limit; running validations are not interrupted.
+
+        Args:
+            limit: New maximum number of concurrent validations
+        """
+        async with self._slot_freed:
+            self.max_concurrent_validations = limit
+            self._slot_freed.notify_all()
+
     async def validate_async(
         self,
         request: ValidationRequest,
@@ -49,7 +81,26 @@ class AsyncValidationEngine:
             ValidationResult with findings and metadata
         """
         start_time = time.time()
-        async with self.semaphore:
+        # Registered before waiting for a slot so queued validations can be
+        # cancelled too, and dropped as soon as this one finishes either way
+        task = asyncio.current_task()
+        if task is not None:
+            self.active_validations[validation_id] = task
+        try:
+            return await self._validate_in_slot(request, validation_id, profile, start_time)
+        finally:
+            if self.active_validations.get(validation_id) is task:
+                del self.active_validations[validation_id]
+
+    async def _validate_in_slot(
+        self,
+        request: ValidationRequest,
+        validation_id: str,
+        profile: str,
+        start_time: float,
+    ) -> ValidationResult:
+        """Run one validation once a concurrency slot is free."""
+        async with self._slot():
             try:
                 # Create validation logger
                 validation_logger = create_validation_logger(validation_id, "Async", profile)
@@ -128,11 +179,8 @@ class AsyncValidationEngine:
         Returns:
             Parsed XML element
         """
-        if isinstance(content, str):
-            content = content.encode("utf-8")
-
         try:
-            return etree.fromstring(content)
+            return parse_document(content)
         except etree.XMLSyntaxError as e:
             raise ValueError(f"Invalid XML syntax: {str(e)}") from e
 
@@ -252,9 +300,12 @@ class AsyncValidationEngine:
             True if validation was cancelled, False if not found
         """
         if validation_id in self.active_validations:
-            task = self.active_validations[validation_id]
+            task = self.active_validations.pop(validation_id)
             task.cancel()
-            del self.active_validations[validation_id]
+            # Let the validation unwind so its slot is free once this returns;
+            # a task cancelling itself cannot wait for its own completion
+            if task is not asyncio.current_task():
+                await asyncio.wait({task}, timeout=_CANCEL_WAIT_SECONDS)
             return True
         return False
 
@@ -267,7 +318,7 @@ class AsyncValidationEngine:
         return {
             "max_concurrent_validations": self.max_concurrent_validations,
             "active_validations": len(self.active_validations),
-            "available_slots": self.semaphore._value,
+            "available_slots": max(0, self.max_concurrent_validations - self._running),
         }
 
 
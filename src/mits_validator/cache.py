@@ -3,8 +3,12 @@
 import asyncio
 import hashlib
 import json
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import redis.asyncio as aioredis
 import structlog
@@ -12,6 +16,24 @@ from lxml import etree
 
 logger = structlog.get_logger(__name__)
 
+# orjson is an optional extra; without it values are encoded with the stdlib
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode("utf-8")
+
+else:
+
+    def _dumps(value: Any) -> bytes:
+        return cast(bytes, orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+
+# Keys asked of Redis per SCAN step, and keys removed per UNLINK, by clear()
+_SCAN_COUNT = 500
+_UNLINK_BATCH = 1000
+
 
 class CacheManager:
     """Manages caching for XSD schemas, Schematron rules, and validation results."""
@@ -33,7 +55,10 @@ class CacheManager:
         self.default_ttl = default_ttl
         self.max_memory_mb = max_memory_mb
         self._redis: aioredis.Redis | None = None
-        self._memory_cache: dict[str, Any] = {}
+        # Least recently used first, so eviction pops from the front
+        self._memory_cache: OrderedDict[str, Any] = OrderedDict()
+        # Encoded size of each memory cache entry, measured once when it is set
+        self._memory_sizes: dict[str, int] = {}
         self._memory_usage = 0
 
     async def initialize(self) -> None:
@@ -63,7 +88,7 @@ class CacheManager:
     def _calculate_memory_usage(self, data: Any) -> int:
         """Calculate approximate memory usage of data."""
         try:
-            return len(json.dumps(data, default=str).encode("utf-8"))
+            return len(_dumps(data))
         except (TypeError, ValueError):
             return len(str(data).encode("utf-8"))
 
@@ -80,7 +105,10 @@ class CacheManager:
                 logger.warning("Failed to get from Redis cache", key=cache_key, error=str(e))
 
         # Fallback to memory cache
-        return self._memory_cache.get(cache_key)
+        value = self._memory_cache.get(cache_key)
+        if value is not None:
+            self._memory_cache.move_to_end(cache_key)
+        return value
 
     async def set(self, prefix: str, key: str, value: Any, ttl: int | None = None) -> None:
         """Set item in cache."""
@@ -89,8 +117,7 @@ class CacheManager:
 
         if self._redis:
             try:
-                data = json.dumps(value, default=str)
-                await self._redis.setex(cache_key, ttl, data)
+                await self._redis.setex(cache_key, ttl, _dumps(value))
                 logger.debug("Cached item in Redis", key=cache_key, ttl=ttl)
             except Exception as e:
                 logger.warning("Failed to set in Redis cache", key=cache_key, error=str(e))
@@ -99,22 +126,46 @@ class CacheManager:
         else:
             self._set_memory_cache(cache_key, value)
 
+    async def set_many(self, prefix: str, items: dict[str, Any], ttl: int | None = None) -> None:
+        """Set several items in cache, sending all Redis writes in one round trip."""
+        ttl = ttl or self.default_ttl
+
+        if self._redis:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(self._get_cache_key(prefix, key), ttl, _dumps(value))
+                    await pipe.execute()
+                logger.debug("Cached items in Redis", prefix=prefix, count=len(items), ttl=ttl)
+                return
+            except Exception as e:
+                logger.warning("Failed to set in Redis cache", prefix=prefix, error=str(e))
+
+        # No Redis, or the batch failed: fall back to memory cache
+        for key, value in items.items():
+            self._set_memory_cache(self._get_cache_key(prefix, key), value)
+
     def _set_memory_cache(self, cache_key: str, value: Any) -> None:
         """Set item in memory cache with size limits."""
         value_size = self._calculate_memory_usage(value)
+        self._pop_memory_cache(cache_key)
 
-        # Check if adding this item would exceed memory limit
-        if self._memory_usage + value_size > self.max_memory_mb * 1024 * 1024:
-            # Remove oldest items (simple FIFO)
-            if self._memory_cache:
-                oldest_key = next(iter(self._memory_cache))
-                old_value = self._memory_cache.pop(oldest_key)
-                self._memory_usage -= self._calculate_memory_usage(old_value)
+        # Evict least recently used items until this one fits
+        max_bytes = self.max_memory_mb * 1024 * 1024
+        while self._memory_cache and self._memory_usage + value_size > max_bytes:
+            self._pop_memory_cache(next(iter(self._memory_cache)))
 
         self._memory_cache[cache_key] = value
+        self._memory_sizes[cache_key] = value_size
         self._memory_usage += value_size
         logger.debug("Cached item in memory", key=cache_key, size=value_size)
 
+    def _pop_memory_cache(self, cache_key: str) -> None:
+        """Remove an item from memory cache, if present, releasing its recorded size."""
+        if cache_key in self._memory_cache:
+            del self._memory_cache[cache_key]
+            self._memory_usage -= self._memory_sizes.pop(cache_key, 0)
+
     async def delete(self, prefix: str, key: str) -> None:
         """Delete item from cache."""
         cache_key = self._get_cache_key(prefix, key)
@@ -126,19 +177,24 @@ class CacheManager:
                 logger.warning("Failed to delete from Redis cache", key=cache_key, error=str(e))
 
         # Also remove from memory cache
-        if cache_key in self._memory_cache:
-            old_value = self._memory_cache.pop(cache_key)
-            self._memory_usage -= self._calculate_memory_usage(old_value)
+        self._pop_memory_cache(cache_key)
 
     async def clear(self, prefix: str | None = None) -> None:
         """Clear cache items, optionally filtered by prefix."""
         if self._redis:
             try:
                 if prefix:
+                    # SCAN rather than KEYS so Redis is never blocked walking the
+                    # whole keyspace; matches are unlinked a batch per command
                     pattern = self._get_cache_key(prefix, "*")
-                    keys = await self._redis.keys(pattern)
-                    if keys:
-                        await self._redis.delete(*keys)
+                    batch = []
+                    async for key in self._redis.scan_iter(match=pattern, count=_SCAN_COUNT):
+                        batch.append(key)
+                        if len(batch) >= _UNLINK_BATCH:
+                            await self._redis.unlink(*batch)
+                            batch = []
+                    if batch:
+                        await self._redis.unlink(*batch)
                 else:
                     await self._redis.flushdb()
             except Exception as e:
@@ -149,10 +205,10 @@ class CacheManager:
             pattern = self._get_cache_key(prefix, "")
             keys_to_remove = [k for k in self._memory_cache.keys() if k.startswith(pattern)]
             for key in keys_to_remove:
-                old_value = self._memory_cache.pop(key)
-                self._memory_usage -= self._calculate_memory_usage(old_value)
+                self._pop_memory_cache(key)
         else:
             self._memory_cache.clear()
+            self._memory_sizes.clear()
             self._memory_usage = 0
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -165,39 +221,92 @@ class CacheManager:
         }
 
 
+# Parsed schemas kept in process by SchemaCache, most recently used last
+_HOT_CACHE_SIZE = 64
+
+
 class SchemaCache:
-    """Specialized cache for XSD schemas and Schematron rules."""
+    """Specialized cache for XSD schemas and Schematron rules.
+
+    The cache manager stores schema source text; the parsed XMLSchema and XSLT
+    objects built from it are also kept in process, so a repeated hit skips
+    both the store round trip and the re-parse.
+    """
 
     def __init__(self, cache_manager: CacheManager):
         """Initialize schema cache."""
         self.cache = cache_manager
+        self._hot: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._parse_lock = asyncio.Lock()
+
+    def _get_hot(self, prefix: str, cache_key: str) -> Any | None:
+        """Get a parsed schema kept in process, marking it recently used."""
+        parsed = self._hot.get((prefix, cache_key))
+        if parsed is not None:
+            self._hot.move_to_end((prefix, cache_key))
+        return parsed
+
+    def _set_hot(self, prefix: str, cache_key: str, parsed: Any) -> None:
+        """Keep a parsed schema in process, evicting the least recently used."""
+        self._hot[(prefix, cache_key)] = parsed
+        self._hot.move_to_end((prefix, cache_key))
+        if len(self._hot) > _HOT_CACHE_SIZE:
+            self._hot.popitem(last=False)
+
+    async def _get_parsed(
+        self,
+        prefix: str,
+        cache_key: str,
+        source_field: str,
+        build: Callable[[etree._Element], Any],
+    ) -> Any | None:
+        """Get a parsed schema, re-parsing its cached source at most once per miss.
+
+        Hits on the in-process tier take no lock; misses are serialized so that
+        concurrent requests for the same schema do not each parse it.
+        """
+        parsed = self._get_hot(prefix, cache_key)
+        if parsed is not None:
+            return parsed
+
+        async with self._parse_lock:
+            parsed = self._get_hot(prefix, cache_key)
+            if parsed is not None:
+                return parsed
+
+            cached_data = await self.cache.get(prefix, cache_key)
+            if cached_data:
+                try:
+                    # Reconstruct schema from cached source
+                    parsed = build(etree.fromstring(cached_data[source_field]))
+                    self._set_hot(prefix, cache_key, parsed)
+                    return parsed
+                except Exception as e:
+                    logger.warning(
+                        "Failed to reconstruct cached schema", prefix=prefix, error=str(e)
+                    )
+                    await self.cache.delete(prefix, cache_key)
+
+        return None
 
     def _get_schema_key(self, schema_path: Path, schema_type: str) -> str:
         """Generate cache key for schema."""
-        # Use file path and modification time for cache invalidation
+        # Use file path and modification time for cache invalidation; only this
+        # short string is hashed, never the file, so a 128-bit BLAKE2b suffices
         stat = schema_path.stat()
-        key_data = f"{schema_path}:{stat.st_mtime}:{stat.st_size}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        key_data = f"{schema_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     async def get_xsd_schema(self, schema_path: Path) -> etree.XMLSchema | None:
         """Get cached XSD schema."""
-        cache_key = self._get_schema_key(schema_path, "xsd")
-        cached_data = await self.cache.get("xsd_schema", cache_key)
-
-        if cached_data:
-            try:
-                # Reconstruct schema from cached data
-                schema_doc = etree.fromstring(cached_data["schema_xml"])
-                return etree.XMLSchema(schema_doc)
-            except Exception as e:
-                logger.warning("Failed to reconstruct cached XSD schema", error=str(e))
-                await self.cache.delete("xsd_schema", cache_key)
-
-        return None
+        return await self._get_parsed(
+            "xsd_schema", self._get_schema_key(schema_path, "xsd"), "schema_xml", etree.XMLSchema
+        )
 
     async def set_xsd_schema(self, schema_path: Path, schema: etree.XMLSchema) -> None:
         """Cache XSD schema."""
         cache_key = self._get_schema_key(schema_path, "xsd")
+        self._set_hot("xsd_schema", cache_key, schema)
 
         # Read the original schema file for caching
         with open(schema_path, encoding="utf-8") as f:
@@ -213,23 +322,17 @@ class SchemaCache:
 
     async def get_schematron_rules(self, rules_path: Path) -> etree.XSLT | None:
         """Get cached Schematron rules."""
-        cache_key = self._get_schema_key(rules_path, "schematron")
-        cached_data = await self.cache.get("schematron_rules", cache_key)
-
-        if cached_data:
-            try:
-                # Reconstruct XSLT from cached data
-                xslt_doc = etree.fromstring(cached_data["xslt_xml"])
-                return etree.XSLT(xslt_doc)
-            except Exception as e:
-                logger.warning("Failed to reconstruct cached Schematron rules", error=str(e))
-                await self.cache.delete("schematron_rules", cache_key)
-
-        return None
+        return await self._get_parsed(
+            "schematron_rules",
+            self._get_schema_key(rules_path, "schematron"),
+            "xslt_xml",
+            etree.XSLT,
+        )
 
     async def set_schematron_rules(self, rules_path: Path, xslt: etree.XSLT) -> None:
         """Cache Schematron rules."""
         cache_key = self._get_schema_key(rules_path, "schematron")
+        self._set_hot("schematron_rules", cache_key, xslt)
 
         # Read the original rules file for caching
         with open(rules_path, encoding="utf-8") as f:
@@ -247,24 +350,53 @@ class SchemaCache:
 # Global cache instance
 _cache_manager: CacheManager | None = None
 _schema_cache: SchemaCache | None = None
+# Only taken while the instances are first created; initialize() awaits, so
+# without them concurrent first callers could each build their own. An
+# asyncio.Lock belongs to one event loop, so each running loop gets its own.
+_cache_manager_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+_schema_cache_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+_init_locks_guard = threading.Lock()
+
+
+def _loop_lock(
+    locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock],
+) -> asyncio.Lock:
+    """Get the lock in locks that belongs to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _init_locks_guard:
+        lock = locks.get(loop)
+        if lock is None:
+            lock = locks[loop] = asyncio.Lock()
+        return lock
 
 
 async def get_cache_manager() -> CacheManager:
     """Get or create global cache manager."""
     global _cache_manager
-    if _cache_manager is None:
-        redis_url = None  # TODO: Get from environment variables
-        _cache_manager = CacheManager(redis_url=redis_url)
-        await _cache_manager.initialize()
+    if _cache_manager is not None:
+        return _cache_manager
+    async with _loop_lock(_cache_manager_locks):
+        if _cache_manager is None:
+            redis_url = None  # TODO: Get from environment variables
+            cache_manager = CacheManager(redis_url=redis_url)
+            await cache_manager.initialize()
+            _cache_manager = cache_manager
     return _cache_manager
 
 
 async def get_schema_cache() -> SchemaCache:
     """Get or create global schema cache."""
     global _schema_cache
-    if _schema_cache is None:
-        cache_manager = await get_cache_manager()
-        _schema_cache = SchemaCache(cache_manager)
+    if _schema_cache is not None:
+        return _schema_cache
+    async with _loop_lock(_schema_cache_locks):
+        if _schema_cache is None:
+            cache_manager = await get_cache_manager()
+            _schema_cache = SchemaCache(cache_manager)
     return _schema_cache
 
 
@@ -10,6 +10,7 @@ from typing import Any
 import jsonschema
 from jsonschema import Draft202012Validator
 
+from mits_validator.catalogs import _schema_validator, load_json
 from mits_validator.models import Finding, FindingLevel
 
 
@@ -67,7 +68,6 @@ class CatalogLoader:
 
     def __init__(self, base_path: Path | None = None) -> None:
         self.base_path = base_path or Path("rules")
-        self.schemas: dict[str, dict[str, Any]] = {}
 
     def load_catalogs(self, version: str = "mits-5.0") -> tuple[CatalogRegistry, list[Finding]]:
         """Load catalogs for the specified version."""
@@ -109,14 +109,13 @@ class CatalogLoader:
                 )
                 return findings
 
-            with open(charge_classes_path) as f:
-                data = json.load(f)
+            data = load_json(charge_classes_path)
 
             # Validate against schema
-            schema = self._get_schema("charge-classes")
-            if schema:
+            validator = self._get_validator("charge-classes")
+            if validator:
                 try:
-                    Draft202012Validator(schema).validate(data)
+                    validator.validate(data)
                 except jsonschema.ValidationError as e:
                     findings.append(
                         Finding(
@@ -199,14 +198,13 @@ class CatalogLoader:
         findings: list[Finding] = []
 
         try:
-            with open(enum_file) as f:
-                data = json.load(f)
+            data = load_json(enum_file)
 
             # Validate against enum schema
-            schema = self._get_schema("enum")
-            if schema:
+            validator = self._get_validator("enum")
+            if validator:
                 try:
-                    Draft202012Validator(schema).validate(data)
+                    validator.validate(data)
                 except jsonschema.ValidationError as e:
                     findings.append(
                         Finding(
@@ -290,14 +288,13 @@ class CatalogLoader:
         findings: list[Finding] = []
 
         try:
-            with open(spec_file) as f:
-                data = json.load(f)
+            data = load_json(spec_file)
 
             # Validate against appropriate schema
-            schema = self._get_schema(spec_name)
-            if schema:
+            validator = self._get_validator(spec_name)
+            if validator:
                 try:
-                    Draft202012Validator(schema).validate(data)
+                    validator.validate(data)
                 except jsonschema.ValidationError as e:
                     findings.append(
                         Finding(
@@ -326,20 +323,15 @@ class CatalogLoader:
 
         return findings
 
-    def _get_schema(self, schema_name: str) -> dict[str, Any] | None:
-        """Get schema by name, loading if necessary."""
-        if schema_name not in self.schemas:
-            schema_path = self.base_path / "mits-5.0" / "schemas" / f"{schema_name}.schema.json"
-            try:
-                if schema_path.exists():
-                    with open(schema_path) as f:
-                        self.schemas[schema_name] = json.load(f)
-                else:
-                    return None
-            except (json.JSONDecodeError, FileNotFoundError):
+    def _get_validator(self, schema_name: str) -> Draft202012Validator | None:
+        """Get the shared validator for the named schema, or None when it can't be read."""
+        schema_path = self.base_path / "mits-5.0" / "schemas" / f"{schema_name}.schema.json"
+        try:
+            if not schema_path.exists():
                 return None
-
-        return self.schemas.get(schema_name)
+            return _schema_validator(schema_path)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
 
 
 # Global loader instance
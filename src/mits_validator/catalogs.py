@@ -7,6 +7,7 @@ MITS 5.0 catalogs for use in validation levels.
 from __future__ import annotations
 
 import json
+import threading
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,6 +18,19 @@ from jsonschema import Draft202012Validator
 
 from mits_validator.models import Finding, FindingLevel
 
+# orjson is an optional extra; both parsers raise json.JSONDecodeError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    _loads = json.loads
+else:
+    _loads = orjson.loads
+
+
+def load_json(path: Path) -> Any:
+    """Read and parse a JSON file, decoding its bytes in the parser."""
+    return _loads(path.read_bytes())
+
 
 class CatalogEntry:
     """Base class for catalog entries."""
@@ -58,6 +72,50 @@ class CatalogRegistry:
         self.metadata: dict[str, Any] = {}
 
 
+# Loaded catalogs keyed by (rules_dir, version), with the fingerprint of the
+# files they were read from; edited catalogs replace their stale entry
+_CATALOG_CACHE: dict[
+    tuple[str, str], tuple[tuple[tuple[str, int], ...], CatalogRegistry, list[Finding]]
+] = {}
+_CATALOG_CACHE_LOCK = threading.Lock()
+
+# Compiled schema validators keyed by schema path, with the mtime_ns they were
+# built from; an edited schema is recompiled and replaces its entry. Both
+# catalog loaders share it.
+_VALIDATOR_CACHE: dict[str, tuple[int, Draft202012Validator]] = {}
+_VALIDATOR_CACHE_LOCK = threading.Lock()
+
+
+def _schema_validator(schema_file: Path) -> Draft202012Validator:
+    """Get a validator for a JSON schema file, compiling it only when the file changes."""
+    key = str(schema_file)
+    mtime_ns = schema_file.stat().st_mtime_ns
+    cached = _VALIDATOR_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    validator = Draft202012Validator(load_json(schema_file))
+    with _VALIDATOR_CACHE_LOCK:
+        _VALIDATOR_CACHE[key] = (mtime_ns, validator)
+    return validator
+
+
+def _catalog_fingerprint(version_dir: Path) -> tuple[tuple[str, int], ...]:
+    """Get the mtime_ns of the version directory and everything the catalogs load from.
+
+    Directory mtimes change when files are added or removed, so a missing
+    file or directory that later appears also changes the fingerprint.
+    """
+    entries = []
+    for path in (version_dir, version_dir / "catalogs", version_dir / "schemas"):
+        try:
+            entries.append((str(path), path.stat().st_mtime_ns))
+            if path is not version_dir:
+                entries.extend((str(p), p.stat().st_mtime_ns) for p in path.rglob("*"))
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
 class CatalogLoader:
     """Loader for MITS 5.0 catalogs with validation."""
 
@@ -66,7 +124,28 @@ class CatalogLoader:
         self.registry = CatalogRegistry()
 
     def load_catalogs(self, version: str = "mits-5.0") -> tuple[CatalogRegistry, list[Finding]]:
-        """Load and validate catalogs for the specified version."""
+        """Load and validate catalogs for the specified version.
+
+        Catalogs are read once per process and reused until one of their files
+        changes, so every validator built for the same rules shares one load.
+        """
+        key = (str(self.rules_dir.resolve()), version)
+        fingerprint = _catalog_fingerprint(self.rules_dir / version)
+        cached = _CATALOG_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self.registry = cached[1]
+            return self.registry, list(cached[2])
+
+        self.registry = CatalogRegistry()
+        registry, findings = self._load_catalogs(version)
+        # A crash may be transient, so only clean or data-error loads are kept
+        if not any(f.code == "ENGINE:LEVEL_CRASH" for f in findings):
+            with _CATALOG_CACHE_LOCK:
+                _CATALOG_CACHE[key] = (fingerprint, registry, findings)
+        return registry, list(findings)
+
+    def _load_catalogs(self, version: str) -> tuple[CatalogRegistry, list[Finding]]:
+        """Read and validate every catalog file for the version."""
         findings: list[Finding] = []
         start_time = time.time()
 
@@ -134,14 +213,10 @@ class CatalogLoader:
                 return findings
 
             # Load and validate against schema
-            with open(charge_classes_file) as f:
-                data = json.load(f)
+            data = load_json(charge_classes_file)
 
             if schema_file.exists():
-                with open(schema_file) as f:
-                    schema = json.load(f)
-                validator = Draft202012Validator(schema)
-                validator.validate(data)
+                _schema_validator(schema_file).validate(data)
 
             # Load entries and check for duplicates
             codes_seen = set()
@@ -209,21 +284,16 @@ class CatalogLoader:
             return findings
 
         # Load schema if available
-        schema = None
-        if schema_file.exists():
-            with open(schema_file) as f:
-                schema = json.load(f)
+        validator = _schema_validator(schema_file) if schema_file.exists() else None
 
         # Load each enum file
         for enum_file in enums_dir.glob("*.json"):
             enum_name = enum_file.stem
             try:
-                with open(enum_file) as f:
-                    data = json.load(f)
+                data = load_json(enum_file)
 
                 # Validate against schema
-                if schema:
-                    validator = Draft202012Validator(schema)
+                if validator:
                     validator.validate(data)
 
                 # Load entries and check for duplicates
@@ -299,15 +369,11 @@ class CatalogLoader:
             schema_file = version_dir / "schemas" / f"{spec_name}.schema.json"
 
             try:
-                with open(spec_file) as f:
-                    data = json.load(f)
+                data = load_json(spec_file)
 
                 # Validate against schema if available
                 if schema_file.exists():
-                    with open(schema_file) as f:
-                        schema = json.load(f)
-                    validator = Draft202012Validator(schema)
-                    validator.validate(data)
+                    _schema_validator(schema_file).validate(data)
 
                 entry = ItemSpecialization(data)
                 self.registry.specializations[spec_name] = entry
@@ -9,7 +9,7 @@ import typer
 
 from mits_validator import __version__
 from mits_validator.models import ValidationRequest
-from mits_validator.validation_engine import ValidationEngine, build_v1_envelope
+from mits_validator.validation_engine import build_v1_envelope, get_engine
 
 app = typer.Typer(name="mits-validate", add_completion=False, help="MITS XML feed validator CLI")
 
@@ -76,7 +76,7 @@ def _validate_file(file_path: Path, profile: str, mode: str, json_output: bool)
     )
 
     # Initialize validation engine
-    engine = ValidationEngine(profile=profile)
+    engine = get_engine(profile)
 
     # Perform validation
     results = engine.validate(content, content_type=content_type)
@@ -117,7 +117,7 @@ def _validate_url(url: str, profile: str, mode: str, json_output: bool) -> None:
             )
 
             # Initialize validation engine
-            engine = ValidationEngine(profile=profile)
+            engine = get_engine(profile)
 
             # Perform validation
             results = engine.validate(content, content_type=content_type)
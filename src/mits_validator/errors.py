@@ -173,6 +173,14 @@ ERROR_CATALOG: dict[str, ErrorDefinition] = {
         remediation="Check rule configuration and file paths",
         level="engine",
     ),
+    "ENGINE:LEVEL_SKIPPED": ErrorDefinition(
+        code="ENGINE:LEVEL_SKIPPED",
+        severity=FindingLevel.INFO,
+        title="Validation level skipped",
+        description="A rule level was not run because XSD validation reported errors",
+        remediation="Fix the XSD errors, or disable stop_on_error in the profile",
+        level="engine",
+    ),
     # Network errors
     "NETWORK:TIMEOUT": ErrorDefinition(
         code="NETWORK:TIMEOUT",
@@ -222,6 +230,14 @@ ERROR_CATALOG: dict[str, ErrorDefinition] = {
         remediation="Check URL and DNS configuration",
         level="network",
     ),
+    "NETWORK:TOO_LARGE": ErrorDefinition(
+        code="NETWORK:TOO_LARGE",
+        severity=FindingLevel.ERROR,
+        title="Content too large",
+        description="Advertised content length exceeds size limit",
+        remediation="Reduce content size or increase limit",
+        level="network",
+    ),
     "NETWORK:TOO_LARGE_DURING_STREAM": ErrorDefinition(
         code="NETWORK:TOO_LARGE_DURING_STREAM",
         severity=FindingLevel.ERROR,
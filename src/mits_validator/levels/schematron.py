@@ -6,42 +6,60 @@ from pathlib import Path
 import lxml.etree as ET
 
 from mits_validator.models import Finding, FindingLevel, ValidationResult
+from mits_validator.validation.parsing import get_document_parser
+from mits_validator.validation.schematron import (
+    CompiledSchematron,
+    load_rules,
+)
 
 
 class SchematronValidator:
     """Validates XML against Schematron rules."""
 
-    def __init__(self, rules_dir: Path | None = None, version: str = "mits-5.0"):
+    def __init__(
+        self,
+        rules_dir: Path | None = None,
+        version: str = "mits-5.0",
+        rules: list[CompiledSchematron] | None = None,
+    ):
         self.rules_dir = rules_dir or Path("rules")
         self.version = version
         self.rules_path = self.rules_dir / version / "schematron"
-        self._rules_available = False
-        self._check_rules()
+        self._load_error: str | None = None
+        self._rules = rules if rules is not None else self._load_rules()
+        self._rules_available = bool(self._rules)
 
-    def _check_rules(self) -> None:
-        """Check if Schematron rules are available."""
-        if not self.rules_path.exists():
-            return
-
-        # Check for any .sch files in the schematron directory
-        if any(self.rules_path.glob("*.sch")):
-            self._rules_available = True
-
-    def _load_rules(self) -> list[Path]:
-        """Load available Schematron rule files."""
+    def _load_rules(self) -> list[CompiledSchematron]:
+        """Compile available Schematron rule files."""
         if not self.rules_path.exists():
             return []
 
-        return list(self.rules_path.glob("*.sch"))
+        try:
+            return [load_rules(path) for path in sorted(self.rules_path.glob("*.sch"))]
+        except Exception as e:
+            # Reported on every validation rather than failing engine construction;
+            # only the message is kept so no traceback outlives this call
+            self._load_error = str(e)
+            return []
 
-    def validate(self, content: bytes) -> ValidationResult:
-        """Validate XML against Schematron rules."""
-        start_time = time.time()
+    def validate(self, content: bytes, xml_doc: ET._Element | None = None) -> ValidationResult:
+        """Validate XML against Schematron rules, reusing xml_doc when already parsed."""
+        start_ns = time.perf_counter_ns()
         findings: list[Finding] = []
 
         try:
+            if self._load_error is not None:
+                findings.append(
+                    Finding(
+                        level=FindingLevel.ERROR,
+                        code="ENGINE:LEVEL_CRASH",
+                        message=f"Failed to load Schematron rules: {self._load_error}",
+                        rule_ref="internal://Schematron",
+                    )
+                )
+
             # Check if rules are available
-            if not self._rules_available:
+            elif not self._rules_available:
                 findings.append(
                     Finding(
                         level=FindingLevel.INFO,
@@ -52,19 +70,10 @@ class SchematronValidator:
                 )
             else:
                 try:
-                    # Parse XML (placeholder for future rule execution)
-                    _ = ET.fromstring(content)
-
-                    # For this milestone, we'll simulate rule execution
-                    # In a full implementation, this would run the compiled Schematron rules
-                    # and report any failures as findings
-
-                    # Simulate a rule check (placeholder)
-                    # This would be replaced with actual Schematron execution
-                    rule_files = self._load_rules()
-                    if rule_files:
-                        # Placeholder: in the future, this would validate against the rules
-                        pass
+                    if xml_doc is None:
+                        xml_doc = ET.fromstring(content, get_document_parser())
+                    for compiled in self._rules:
+                        findings.extend(compiled.findings(xml_doc))
 
                 except ET.XMLSyntaxError as e:
                     # XML parsing error - this should be caught by WellFormed level
@@ -89,7 +98,7 @@ class SchematronValidator:
                 )
             )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return ValidationResult(level=self.get_name(), findings=findings, duration_ms=duration_ms)
 
     def get_name(self) -> str:
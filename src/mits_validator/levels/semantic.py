@@ -3,10 +3,58 @@
 from __future__ import annotations
 
 import time
+from io import BytesIO
 from pathlib import Path
 
+from lxml import etree
+
 from mits_validator.catalogs import get_catalog_loader
-from mits_validator.models import Finding, FindingLevel, ValidationResult
+from mits_validator.models import Finding, FindingLevel, Location, ValidationResult
+from mits_validator.validation.parsing import get_document_parser
+
+# Catalog-checked elements: local name -> (finding code, label, rule reference)
+_VALUE_RULES: dict[str, tuple[str, str, str]] = {
+    "ChargeClassification": (
+        "SEMANTIC:INVALID_CHARGE_CLASS",
+        "Charge classification",
+        "semantic://charge-classification",
+    ),
+    "PaymentFrequency": (
+        "SEMANTIC:INVALID_PAYMENT_FREQUENCY",
+        "Payment frequency",
+        "semantic://payment-frequency",
+    ),
+    "Refundability": (
+        "SEMANTIC:INVALID_REFUNDABILITY",
+        "Refundability",
+        "semantic://refundability",
+    ),
+    "TermBasis": (
+        "SEMANTIC:INVALID_TERM_BASIS",
+        "Term basis",
+        "semantic://term-basis",
+    ),
+}
+
+# Enum catalog backing each enum-checked element
+_VALUE_ENUMS = {
+    "PaymentFrequency": "payment-frequency",
+    "Refundability": "refundability",
+    "TermBasis": "term-basis",
+}
+
+_MITS_NS = "{http://www.mits.org/schema/PropertyMarketing/ILS/5.0}"
+
+# ChargeOfferItem children read by the business-logic checks
+_CHARGE_CLASSIFICATION = f"{_MITS_NS}ChargeClassification"
+_REQUIREMENT = f"{_MITS_NS}Requirement"
+_PAYMENT_FREQUENCY = f"{_MITS_NS}PaymentFrequency"
+
+# Checked element names as tags that match in any namespace
+_ANY_NS_TAGS = {name: f"{{*}}{name}" for name in (*_VALUE_RULES, "ChargeOfferItem")}
+
+# Elements visited by validate_stream
+_STREAM_TAGS = list(_ANY_NS_TAGS.values())
 
 
 class SemanticValidator:
@@ -18,6 +66,8 @@ class SemanticValidator:
         self.catalog_loader = get_catalog_loader(self.rules_dir)
         self._catalogs_loaded = False
         self._catalog_registry = None
+        # Accepted codes and aliases per checked element, built once per load
+        self._code_sets: dict[str, frozenset[str] | None] = {}
 
     def _load_catalogs(self) -> list[Finding]:
         """Load catalogs for semantic validation."""
@@ -26,11 +76,13 @@ class SemanticValidator:
 
         try:
             self._catalog_registry, findings = self.catalog_loader.load_catalogs(self.version)
+            self._code_sets = {name: self._valid_codes(name) for name in _VALUE_RULES}
             self._catalogs_loaded = True
             return findings
         except Exception as e:
             # Catalogs failed to load
             self._catalog_registry = None
+            self._code_sets = {}
             self._catalogs_loaded = False
             return [
                 Finding(
@@ -41,28 +93,34 @@ class SemanticValidator:
                 )
             ]
 
-    def validate(self, content: bytes) -> ValidationResult:
-        """Validate content using semantic rules and catalogs."""
-        start_time = time.time()
+    def validate(self, content: bytes, xml_doc: etree._Element | None = None) -> ValidationResult:
+        """Validate content using semantic rules and catalogs, reusing xml_doc when parsed."""
+        start_ns = time.perf_counter_ns()
         findings: list[Finding] = []
 
         try:
+            # Parse XML content first, so malformed input never loads catalogs
+            if xml_doc is None:
+                try:
+                    xml_doc = etree.fromstring(content, get_document_parser())
+                except etree.XMLSyntaxError as parse_error:
+                    findings.append(self._parse_error_finding(parse_error))
+                    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                    return ValidationResult(
+                        level=self.get_name(), findings=findings, duration_ms=duration_ms
+                    )
+
             # Load catalogs
             catalog_findings = self._load_catalogs()
             findings.extend(catalog_findings)
 
             if not self._catalogs_loaded or not self._catalog_registry:
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 return ValidationResult(
                     level=self.get_name(), findings=findings, duration_ms=duration_ms
                 )
 
-            # Parse XML content for semantic validation
             try:
-                from lxml import etree
-
-                xml_doc = etree.fromstring(content)
-
                 # Validate charge classifications against catalog
                 findings.extend(self._validate_charge_classifications(xml_doc))
 
@@ -79,14 +137,7 @@ class SemanticValidator:
                 findings.extend(self._validate_business_logic(xml_doc))
 
             except Exception as parse_error:
-                findings.append(
-                    Finding(
-                        level=FindingLevel.ERROR,
-                        code="SEMANTIC:XML_PARSE_ERROR",
-                        message=f"Failed to parse XML for semantic validation: {parse_error}",
-                        rule_ref="internal://Semantic",
-                    )
-                )
+                findings.append(self._parse_error_finding(parse_error))
 
         except Exception as e:
             findings.append(
@@ -98,193 +149,185 @@ class SemanticValidator:
                 )
             )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return ValidationResult(level=self.get_name(), findings=findings, duration_ms=duration_ms)
 
-    def _validate_charge_classifications(self, xml_doc) -> list[Finding]:
-        """Validate charge classifications against catalog."""
-        findings = []
-
-        if not self._catalog_registry or not self._catalog_registry.charge_classes:
-            return findings
+    def _parse_error_finding(self, error: Exception) -> Finding:
+        """Report content that could not be parsed or checked."""
+        return Finding(
+            level=FindingLevel.ERROR,
+            code="SEMANTIC:XML_PARSE_ERROR",
+            message=f"Failed to parse XML for semantic validation: {error}",
+            rule_ref="internal://Semantic",
+        )
+
+    def validate_stream(self, content: bytes) -> ValidationResult:
+        """Validate content element by element without holding the whole tree.
+
+        Produces the same findings as validate. Each charge offer item is
+        discarded once checked, so memory stays bounded by the largest item
+        rather than the document. Raises etree.XMLSyntaxError when the
+        content is not well-formed.
+        """
+        start_ns = time.perf_counter_ns()
+        findings = self._load_catalogs()
+
+        if self._catalogs_loaded and self._catalog_registry:
+            valid_codes = self._code_sets
+            # Grouped per check so findings come out in the same order as validate
+            grouped: dict[str, list[Finding]] = {
+                name: [] for name in (*_VALUE_RULES, "ChargeOfferItem")
+            }
+
+            local_names: dict[str, str] = {}
+            for _, elem in etree.iterparse(
+                BytesIO(content),
+                events=("end",),
+                tag=_STREAM_TAGS,
+                no_network=True,
+                resolve_entities=False,
+                huge_tree=False,
+            ):
+                # Few distinct tags occur, so resolve each local name only once
+                local_name = local_names.get(elem.tag)
+                if local_name is None:
+                    local_name = local_names[elem.tag] = elem.tag.rpartition("}")[2]
+                if local_name != "ChargeOfferItem":
+                    codes = valid_codes[local_name]
+                    finding = self._check_value(elem, local_name, codes) if codes else None
+                    if finding:
+                        grouped[local_name].append(finding)
+                    continue
+
+                grouped[local_name].extend(self._check_charge_item(elem))
+                # Everything inside and before a finished item has been checked
+                elem.clear()
+                parent = elem.getparent()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+            for group in grouped.values():
+                findings.extend(group)
+
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        return ValidationResult(level=self.get_name(), findings=findings, duration_ms=duration_ms)
 
-        # Get valid charge class codes from catalog
-        valid_codes = set(self._catalog_registry.charge_classes)
-
-        # Find all charge classifications in the XML
-        charge_classifications = xml_doc.xpath("//*[local-name()='ChargeClassification']")
-
-        for elem in charge_classifications:
-            value = elem.text.strip() if elem.text else ""
-            if value and value not in valid_codes:
-                findings.append(
-                    Finding(
-                        level=FindingLevel.ERROR,
-                        code="SEMANTIC:INVALID_CHARGE_CLASS",
-                        message=(
-                            f"Charge classification '{value}' is not valid according to catalog"
-                        ),
-                        rule_ref="semantic://charge-classification",
-                        location={"xpath": self._get_xpath(elem), "value": value},
-                    )
-                )
+    def _valid_codes(self, local_name: str) -> frozenset[str] | None:
+        """Get the catalog codes accepted for an element, or None when not checked."""
+        if not self._catalog_registry:
+            return None
+
+        if local_name == "ChargeClassification":
+            if not self._catalog_registry.charge_classes:
+                return None
+            return frozenset(self._catalog_registry.charge_classes)
+
+        if not self._catalog_registry.enums:
+            return None
+        enum = self._catalog_registry.enums.get(_VALUE_ENUMS[local_name])
+        if not enum:
+            return None
+
+        return frozenset(
+            [item.code for item in enum] + [alias for item in enum for alias in item.aliases]
+        )
+
+    def _check_value(
+        self, elem: etree._Element, local_name: str, valid_codes: frozenset[str]
+    ) -> Finding | None:
+        """Check a single element's text against the catalog codes."""
+        value = elem.text.strip() if elem.text else ""
+        if not value or value in valid_codes:
+            return None
+
+        code, label, rule_ref = _VALUE_RULES[local_name]
+        return Finding(
+            level=FindingLevel.ERROR,
+            code=code,
+            message=f"{label} '{value}' is not valid according to catalog",
+            rule_ref=rule_ref,
+            location=Location(xpath=self._get_xpath(elem)),
+        )
+
+    def _validate_values(self, xml_doc: etree._Element, local_name: str) -> list[Finding]:
+        """Validate every element with the given local name against its catalog."""
+        valid_codes = self._code_sets.get(local_name)
+        if not valid_codes:
+            return []
 
+        findings = []
+        # Tag iteration walks the tree in C without compiling an XPath per call
+        for elem in xml_doc.iter(_ANY_NS_TAGS[local_name]):
+            finding = self._check_value(elem, local_name, valid_codes)
+            if finding:
+                findings.append(finding)
         return findings
 
+    def _validate_charge_classifications(self, xml_doc) -> list[Finding]:
+        """Validate charge classifications against catalog."""
+        return self._validate_values(xml_doc, "ChargeClassification")
+
     def _validate_payment_frequencies(self, xml_doc) -> list[Finding]:
         """Validate payment frequencies against catalog."""
-        findings = []
-
-        if not self._catalog_registry or not self._catalog_registry.enums:
-            return findings
-
-        # Get valid payment frequency codes from catalog
-        payment_freq_enum = self._catalog_registry.enums.get("payment-frequency")
-        if not payment_freq_enum:
-            return findings
-
-        valid_codes = {item.code for item in payment_freq_enum}
-        valid_codes.update({alias for item in payment_freq_enum for alias in item.aliases})
-
-        # Find all payment frequencies in the XML
-        payment_frequencies = xml_doc.xpath("//*[local-name()='PaymentFrequency']")
-
-        for elem in payment_frequencies:
-            value = elem.text.strip() if elem.text else ""
-            if value and value not in valid_codes:
-                findings.append(
-                    Finding(
-                        level=FindingLevel.ERROR,
-                        code="SEMANTIC:INVALID_PAYMENT_FREQUENCY",
-                        message=f"Payment frequency '{value}' is not valid according to catalog",
-                        rule_ref="semantic://payment-frequency",
-                        location={"xpath": self._get_xpath(elem), "value": value},
-                    )
-                )
-
-        return findings
+        return self._validate_values(xml_doc, "PaymentFrequency")
 
     def _validate_refundability(self, xml_doc) -> list[Finding]:
         """Validate refundability values against catalog."""
-        findings = []
-
-        if not self._catalog_registry or not self._catalog_registry.enums:
-            return findings
-
-        # Get valid refundability codes from catalog
-        refundability_enum = self._catalog_registry.enums.get("refundability")
-        if not refundability_enum:
-            return findings
-
-        valid_codes = {item.code for item in refundability_enum}
-        valid_codes.update({alias for item in refundability_enum for alias in item.aliases})
-
-        # Find all refundability values in the XML
-        refundability_values = xml_doc.xpath("//*[local-name()='Refundability']")
-
-        for elem in refundability_values:
-            value = elem.text.strip() if elem.text else ""
-            if value and value not in valid_codes:
-                findings.append(
-                    Finding(
-                        level=FindingLevel.ERROR,
-                        code="SEMANTIC:INVALID_REFUNDABILITY",
-                        message=f"Refundability '{value}' is not valid according to catalog",
-                        rule_ref="semantic://refundability",
-                        location={"xpath": self._get_xpath(elem), "value": value},
-                    )
-                )
-
-        return findings
+        return self._validate_values(xml_doc, "Refundability")
 
     def _validate_term_basis(self, xml_doc) -> list[Finding]:
         """Validate term basis values against catalog."""
-        findings = []
+        return self._validate_values(xml_doc, "TermBasis")
 
-        if not self._catalog_registry or not self._catalog_registry.enums:
-            return findings
-
-        # Get valid term basis codes from catalog
-        term_basis_enum = self._catalog_registry.enums.get("term-basis")
-        if not term_basis_enum:
-            return findings
+    def _validate_business_logic(self, xml_doc) -> list[Finding]:
+        """Validate business logic consistency."""
+        findings = []
 
-        valid_codes = {item.code for item in term_basis_enum}
-        valid_codes.update({alias for item in term_basis_enum for alias in item.aliases})
-
-        # Find all term basis values in the XML
-        term_basis_values = xml_doc.xpath("//*[local-name()='TermBasis']")
-
-        for elem in term_basis_values:
-            value = elem.text.strip() if elem.text else ""
-            if value and value not in valid_codes:
-                findings.append(
-                    Finding(
-                        level=FindingLevel.ERROR,
-                        code="SEMANTIC:INVALID_TERM_BASIS",
-                        message=f"Term basis '{value}' is not valid according to catalog",
-                        rule_ref="semantic://term-basis",
-                        location={"xpath": self._get_xpath(elem), "value": value},
-                    )
-                )
+        # Find all charge offer items
+        for item in xml_doc.iter(_ANY_NS_TAGS["ChargeOfferItem"]):
+            findings.extend(self._check_charge_item(item))
 
         return findings
 
-    def _validate_business_logic(self, xml_doc) -> list[Finding]:
-        """Validate business logic consistency."""
+    def _check_charge_item(self, item: etree._Element) -> list[Finding]:
+        """Check a single charge offer item for inconsistent settings."""
         findings = []
 
-        # Find all charge offer items
-        charge_items = xml_doc.xpath("//*[local-name()='ChargeOfferItem']")
+        # One pass over the item's descendants; the first of each field counts
+        values: dict[str, str] = {}
+        for child in item.iterdescendants(_CHARGE_CLASSIFICATION, _REQUIREMENT, _PAYMENT_FREQUENCY):
+            if child.tag not in values:
+                values[child.tag] = child.text.strip() if child.text else ""
+        charge_class = values.get(_CHARGE_CLASSIFICATION)
 
-        for item in charge_items:
-            # Check for rent charges that are optional (should typically be mandatory)
-            charge_class = item.find(
-                ".//{http://www.mits.org/schema/PropertyMarketing/ILS/5.0}ChargeClassification"
-            )
-            requirement = item.find(
-                ".//{http://www.mits.org/schema/PropertyMarketing/ILS/5.0}Requirement"
+        # Check for rent charges that are optional (should typically be mandatory)
+        if charge_class in ("Rent", "RENT") and values.get(_REQUIREMENT) == "Optional":
+            findings.append(
+                Finding(
+                    level=FindingLevel.WARNING,
+                    code="SEMANTIC:INCONSISTENT_RENT_REQUIREMENT",
+                    message="Rent charges should typically be Mandatory, not Optional",
+                    rule_ref="semantic://business-logic",
+                    location=Location(xpath=self._get_xpath(item)),
+                )
             )
 
-            if (
-                charge_class is not None
-                and charge_class.text
-                and charge_class.text.strip() in ["Rent", "RENT"]
-                and requirement is not None
-                and requirement.text
-                and requirement.text.strip() == "Optional"
-            ):
-                findings.append(
-                    Finding(
-                        level=FindingLevel.WARNING,
-                        code="SEMANTIC:INCONSISTENT_RENT_REQUIREMENT",
-                        message="Rent charges should typically be Mandatory, not Optional",
-                        rule_ref="semantic://business-logic",
-                        location={"xpath": self._get_xpath(item)},
-                    )
+        # Check for deposit charges that are not OneTime
+        payment_freq = values.get(_PAYMENT_FREQUENCY)
+        if (
+            charge_class in ("Deposit", "DEPOSIT")
+            and payment_freq
+            and payment_freq not in ("OneTime", "ONE_TIME")
+        ):
+            findings.append(
+                Finding(
+                    level=FindingLevel.WARNING,
+                    code="SEMANTIC:INCONSISTENT_DEPOSIT_FREQUENCY",
+                    message="Deposit charges should typically be OneTime payments",
+                    rule_ref="semantic://business-logic",
+                    location=Location(xpath=self._get_xpath(item)),
                 )
-
-            # Check for deposit charges that are not OneTime
-            payment_freq = item.find(
-                ".//{http://www.mits.org/schema/PropertyMarketing/ILS/5.0}PaymentFrequency"
             )
-            if (
-                charge_class is not None
-                and charge_class.text
-                and charge_class.text.strip() in ["Deposit", "DEPOSIT"]
-                and payment_freq is not None
-                and payment_freq.text
-                and payment_freq.text.strip() not in ["OneTime", "ONE_TIME"]
-            ):
-                findings.append(
-                    Finding(
-                        level=FindingLevel.WARNING,
-                        code="SEMANTIC:INCONSISTENT_DEPOSIT_FREQUENCY",
-                        message="Deposit charges should typically be OneTime payments",
-                        rule_ref="semantic://business-logic",
-                        location={"xpath": self._get_xpath(item)},
-                    )
-                )
 
         return findings
 
@@ -8,15 +8,19 @@ from pathlib import Path
 from lxml import etree
 
 from mits_validator.models import Finding, FindingLevel, ValidationResult
+from mits_validator.validation.parsing import get_document_parser
+from mits_validator.validation.xsd import load_schema, schema_lock
 
 
 class XSDValidator:
     """XSD validation level that validates XML against XSD schemas."""
 
-    def __init__(self, schema_path: Path | None = None) -> None:
+    def __init__(
+        self, schema_path: Path | None = None, schema: etree.XMLSchema | None = None
+    ) -> None:
         self.schema_path = schema_path
-        self._schema = None
-        self._schema_loaded = False
+        self._schema = schema
+        self._schema_loaded = schema is not None
 
     def _load_schema(self) -> bool:
         """Load XSD schema if available."""
@@ -28,24 +32,22 @@ class XSDValidator:
             return False
 
         try:
-            with open(self.schema_path, "rb") as f:
-                schema_doc = etree.parse(f)
-            self._schema = etree.XMLSchema(schema_doc)
+            self._schema = load_schema(self.schema_path)
             self._schema_loaded = True
             return True
         except (etree.XMLSyntaxError, etree.XMLSchemaParseError, FileNotFoundError):
             self._schema_loaded = True
             return False
 
-    def validate(self, content: bytes) -> ValidationResult:
-        """Validate XML content against XSD schema."""
-        start_time = time.time()
+    def validate(self, content: bytes, xml_doc: etree._Element | None = None) -> ValidationResult:
+        """Validate XML content against XSD schema, reusing xml_doc when already parsed."""
+        start_ns = time.perf_counter_ns()
         findings: list[Finding] = []
 
         # Load schema if not already loaded
-        schema_available = self._load_schema()
+        schema = self._schema if self._load_schema() else None
 
-        if not schema_available:
+        if schema is None:
             findings.append(
                 Finding(
                     level=FindingLevel.INFO,
@@ -57,10 +59,13 @@ class XSDValidator:
         else:
             try:
                 # Parse XML content
-                xml_doc = etree.fromstring(content)
+                if xml_doc is None:
+                    xml_doc = etree.fromstring(content, get_document_parser())
 
-                # Validate against schema
-                if not self._schema.validate(xml_doc):
+                # Validate against schema; it may be shared with other threads
+                with schema_lock(schema):
+                    valid = schema.validate(xml_doc)
+                if not valid:
                     # Schema validation failed
                     findings.append(
                         Finding(
@@ -100,7 +105,7 @@ class XSDValidator:
                     )
                 )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return ValidationResult(
             level="XSD",
             findings=findings,
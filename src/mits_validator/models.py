@@ -22,7 +22,7 @@ class ValidationLevel(str, Enum):
     SEMANTIC = "Semantic"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
     """Location information for a finding."""
 
@@ -31,7 +31,7 @@ class Location:
     xpath: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Finding:
     """A single validation finding."""
 
@@ -42,7 +42,7 @@ class Finding:
     rule_ref: str = "internal://WellFormed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a validation level execution."""
 
@@ -51,7 +51,7 @@ class ValidationResult:
     duration_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRequest:
     """Request for validation."""
 
@@ -55,6 +55,7 @@ class ProfileLoader:
             enabled_levels=data.get("enabled_levels", []),
             severity_overrides=severity_overrides,
             intake_limits=intake_limits,
+            stop_on_error=bool(data.get("stop_on_error", False)),
         )
 
     def get_available_profiles(self, version: str = "mits-5.0") -> list[str]:
@@ -17,6 +17,8 @@ class ProfileConfig:
     enabled_levels: list[str]
     severity_overrides: dict[str, FindingLevel]
     intake_limits: dict[str, Any] | None = None
+    # Skip Schematron and Semantic when XSD reports an error
+    stop_on_error: bool = False
 
 
 @dataclass
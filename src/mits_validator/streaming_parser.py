@@ -7,6 +7,8 @@ from typing import Any
 import structlog
 from lxml import etree
 
+from mits_validator.validation.xsd import schema_lock
+
 logger = structlog.get_logger(__name__)
 
 
@@ -100,7 +102,8 @@ class StreamingXMLParser:
                 # Validate element against schema if provided
                 if xsd_schema:
                     try:
-                        xsd_schema.assertValid(element)
+                        with schema_lock(xsd_schema):
+                            xsd_schema.assertValid(element)
                     except etree.DocumentInvalid as e:
                         findings.append(
                             {
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import socket
+import threading
+from collections import OrderedDict
+
 import httpx
 
 from mits_validator.models import Finding, FindingLevel
@@ -15,19 +19,43 @@ class URLFetcher:
         timeout: float = 30.0,
         max_size: int = 10 * 1024 * 1024,  # 10MB default
         allowed_content_types: list[str] | None = None,
+        cache_max_bytes: int = 16 * 1024 * 1024,  # 16MB of cached bodies
     ) -> None:
         self.timeout = timeout
         self.max_size = max_size
+        self.cache_max_bytes = cache_max_bytes
         self.allowed_content_types = allowed_content_types or [
             "application/xml",
             "text/xml",
             "application/octet-stream",
         ]
+        self._allowed = frozenset(ct.lower() for ct in self.allowed_content_types)
+        # url -> (etag, last_modified, content, findings), least recently used first;
+        # bounded by the total size of the cached bodies and shared between threads
+        self._cache: OrderedDict[str, tuple[str | None, str | None, bytes, list[Finding]]] = (
+            OrderedDict()
+        )
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
 
     def fetch(self, url: str) -> tuple[bytes, list[Finding]]:
         """Fetch content from URL with streaming and error handling."""
         findings: list[Finding] = []
         content = b""
+        headers = {
+            "User-Agent": "MITS-Validator/1.0",
+            "Accept": "application/xml, text/xml, application/octet-stream",
+        }
+
+        # Revalidate previously fetched feeds with a conditional GET
+        with self._cache_lock:
+            cached = self._cache.get(url)
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         try:
             with httpx.stream(
@@ -35,11 +63,15 @@ class URLFetcher:
                 url,
                 timeout=self.timeout,
                 follow_redirects=False,  # Conservative approach
-                headers={
-                    "User-Agent": "MITS-Validator/1.0",
-                    "Accept": "application/xml, text/xml, application/octet-stream",
-                },
+                headers=headers,
             ) as response:
+                # Feed unchanged since the cached copy was fetched
+                if response.status_code == 304 and cached is not None:
+                    with self._cache_lock:
+                        if url in self._cache:
+                            self._cache.move_to_end(url)
+                    return cached[2], list(cached[3])
+
                 # Check HTTP status
                 if response.status_code != 200:
                     findings.append(
@@ -53,8 +85,10 @@ class URLFetcher:
                     return content, findings
 
                 # Check content type
-                content_type = response.headers.get("content-type", "").split(";")[0].strip()
-                if content_type not in self.allowed_content_types:
+                content_type = (
+                    response.headers.get("content-type", "").split(";")[0].strip().lower()
+                )
+                if content_type not in self._allowed:
                     if content_type.startswith("image/") or content_type.startswith("video/"):
                         findings.append(
                             Finding(
@@ -75,7 +109,23 @@ class URLFetcher:
                         )
                     )
 
-                # Stream content with size limit
+                # Reject oversized bodies up front when the server advertises a length
+                content_length = response.headers.get("content-length", "")
+                if content_length.isdigit() and int(content_length) > self.max_size:
+                    findings.append(
+                        Finding(
+                            level=FindingLevel.ERROR,
+                            code="NETWORK:TOO_LARGE",
+                            message=(
+                                f"Content length {content_length} exceeds size limit of "
+                                f"{self.max_size} bytes"
+                            ),
+                            rule_ref="internal://URL",
+                        )
+                    )
+                    return content, findings
+
+                # Stream content with size limit (chunked responses carry no length)
                 for chunk in response.iter_bytes():
                     content += chunk
                     if len(content) > self.max_size:
@@ -89,6 +139,14 @@ class URLFetcher:
                         )
                         return content, findings
 
+                self._store(
+                    url,
+                    response.headers.get("etag"),
+                    response.headers.get("last-modified"),
+                    content,
+                    findings,
+                )
+
         except httpx.TimeoutException:
             findings.append(
                 Finding(
@@ -99,12 +157,7 @@ class URLFetcher:
                 )
             )
         except httpx.ConnectError as e:
-            error_str = str(e).lower()
-            if (
-                "name or service not known" in error_str
-                or "dns" in error_str
-                or "name resolution" in error_str
-            ):
+            if _is_dns_failure(e):
                 findings.append(
                     Finding(
                         level=FindingLevel.ERROR,
@@ -143,6 +196,41 @@ class URLFetcher:
 
         return content, findings
 
+    def _store(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content: bytes,
+        findings: list[Finding],
+    ) -> None:
+        """Remember a complete response so it can be revalidated later."""
+        with self._cache_lock:
+            stale = self._cache.pop(url, None)
+            if stale is not None:
+                self._cache_bytes -= len(stale[2])
+            # Without validators the server cannot answer 304, and a body over
+            # the whole budget would only evict everything else
+            if not (etag or last_modified) or len(content) > self.cache_max_bytes:
+                return
+
+            self._cache[url] = (etag, last_modified, content, list(findings))
+            self._cache_bytes += len(content)
+            while self._cache_bytes > self.cache_max_bytes:
+                _, (_, _, evicted, _) = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+
+def _is_dns_failure(error: BaseException) -> bool:
+    """Check whether a connection error was caused by name resolution."""
+    # httpx wraps the transport error, which in turn wraps the socket error
+    cause = error.__cause__ or error.__context__
+    while cause is not None:
+        if isinstance(cause, socket.gaierror):
+            return True
+        cause = cause.__cause__ or cause.__context__
+    return False
+
 
 # Global fetcher instance
 _url_fetcher: URLFetcher | None = None
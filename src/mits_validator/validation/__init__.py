@@ -1,11 +1,52 @@
 """Validation modules for MITS 5.0."""
 
-from .schematron import get_rules_info, validate_schematron
-from .xsd import get_schema_info, validate_xsd
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .schematron import (
+        CompiledSchematron,
+        clear_rules_cache,
+        get_rules_info,
+        load_rules,
+        validate_schematron,
+        validate_schematron_stream,
+    )
+    from .xsd import get_schema_info, load_schema, validate_xsd
+
+# Exported name -> submodule; submodules are imported on first attribute access
+# so that importing the XSD helpers does not pull in lxml.isoschematron
+_SUBMODULES = {
+    "validate_xsd": "xsd",
+    "get_schema_info": "xsd",
+    "load_schema": "xsd",
+    "validate_schematron": "schematron",
+    "validate_schematron_stream": "schematron",
+    "get_rules_info": "schematron",
+    "load_rules": "schematron",
+    "clear_rules_cache": "schematron",
+    "CompiledSchematron": "schematron",
+}
 
 __all__ = [
     "validate_xsd",
     "get_schema_info",
+    "load_schema",
     "validate_schematron",
+    "validate_schematron_stream",
     "get_rules_info",
+    "load_rules",
+    "clear_rules_cache",
+    "CompiledSchematron",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
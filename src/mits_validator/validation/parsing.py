@@ -0,0 +1,47 @@
+"""Shared XML parser for the standalone validators."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from lxml import etree
+
+# lxml parsers may be reused sequentially but not shared between threads
+_parser_local = threading.local()
+
+
+def get_document_parser() -> etree.XMLParser:
+    """Get this thread's parser for documents under validation."""
+    parser: etree.XMLParser | None = getattr(_parser_local, "parser", None)
+    if parser is None:
+        # Never fetch external resources or expand entities from untrusted input,
+        # and no rule looks elements up by ID, so skip building the ID table.
+        # Whitespace is kept: XSD, Schematron and reported positions see the
+        # document exactly as submitted
+        parser = etree.XMLParser(
+            no_network=True,
+            resolve_entities=False,
+            collect_ids=False,
+            huge_tree=False,
+        )
+        _parser_local.parser = parser
+    return parser
+
+
+def parse_document(
+    xml_content: str | bytes | bytearray | Path | etree._Element,
+) -> etree._Element | etree._ElementTree:
+    """Parse XML content for validation, passing an already parsed element through.
+
+    Text is encoded to UTF-8 once, because lxml refuses str input that carries
+    an encoding declaration; bytes reach the parser without a copy and paths
+    are read by libxml2 directly. Raises etree.XMLSyntaxError.
+    """
+    if isinstance(xml_content, etree._Element):
+        return xml_content
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8")
+    if isinstance(xml_content, bytes | bytearray):
+        return etree.fromstring(xml_content, parser=get_document_parser())
+    return etree.parse(str(xml_content), parser=get_document_parser())
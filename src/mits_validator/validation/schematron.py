@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import re
+import threading
 import time
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +15,7 @@ from lxml.etree import XMLSyntaxError
 from lxml.isoschematron import Schematron
 
 from mits_validator.models import Finding, FindingLevel, ValidationResult
+from mits_validator.validation.parsing import get_document_parser, parse_document
 
 
 class SchematronValidationError(Exception):
@@ -19,16 +24,377 @@ class SchematronValidationError(Exception):
     pass
 
 
+# Findings only read each result's id and test, so the SVRL report leaves out
+# fired-rule elements and location paths (XSLT parameters, hence the quoting)
+_SVRL_COMPILE_PARAMS = {"generate-fired-rule": "'false'", "generate-paths": "'false'"}
+
+
+class CompiledSchematron:
+    """Compiled Schematron rules that can be shared between threads.
+
+    Rules written in plain XPath 1.0 are checked directly with precompiled
+    XPath expressions, one walk over the document per pattern. Anything else
+    (phases, lets, abstract patterns, XSLT-only functions) goes through the
+    ISO Schematron XSLT pipeline, which is compiled only when first needed.
+
+    lxml keeps the last validation report on the Schematron instance, so the
+    report is read under the same lock as the validation that produced it.
+    """
+
+    def __init__(self, rules_doc: etree._Element) -> None:
+        self._rules_doc = rules_doc
+        self._patterns = _compile_patterns(rules_doc)
+        self._schematron: Schematron | None = None
+        self._lock = threading.Lock()
+        if self._patterns is None:
+            # Surface errors in the rules at load time, as before
+            self._schematron = self._compile_svrl()
+
+    def _compile_svrl(self) -> Schematron:
+        return Schematron(self._rules_doc, store_report=True, compile_params=_SVRL_COMPILE_PARAMS)
+
+    def validate(self, xml_doc: etree._Element | etree._ElementTree) -> tuple[bool, Any]:
+        """Validate a parsed document and return the result with its SVRL report."""
+        with self._lock:
+            if self._schematron is None:
+                self._schematron = self._compile_svrl()
+            is_valid = self._schematron.validate(xml_doc)
+            return is_valid, self._schematron.validation_report
+
+    def findings(
+        self, xml_doc: etree._Element | etree._ElementTree, short_circuit: bool = False
+    ) -> list[Finding]:
+        """Validate a parsed document and return a finding per failed assert or fired report.
+
+        With short_circuit, the first failed assert is the last finding
+        returned. Rules checked by XPath stop evaluating there; rules that need
+        the XSLT pipeline still build the whole report, which is then cut.
+        """
+        if self._patterns is not None:
+            try:
+                return _evaluate_patterns(self._patterns, xml_doc, short_circuit)
+            except _UnsupportedContext:
+                pass
+        is_valid, report = self.validate(xml_doc)
+        if is_valid:
+            return []
+        findings = findings_from_report(report)
+        if short_circuit:
+            # The XSLT pipeline always builds the whole report
+            for i, finding in enumerate(findings):
+                if finding.level == FindingLevel.ERROR:
+                    return findings[: i + 1]
+        return findings
+
+
+@dataclass(slots=True, frozen=True)
+class _Check:
+    """A compiled sch:assert (fires when its test is false) or sch:report (when true)."""
+
+    test: etree.XPath
+    fires_when: bool
+    level: FindingLevel
+    rule_id: str
+    source: str
+
+
+@dataclass(slots=True, frozen=True)
+class _Pattern:
+    """A compiled sch:pattern; each value pairs a rule's position with its checks.
+
+    Contexts naming a single element are looked up by tag during the walk over
+    the document; any other context is evaluated as an XPath beforehand.
+    """
+
+    by_tag: dict[str, tuple[int, tuple[_Check, ...]]]
+    by_local_name: dict[str, tuple[int, tuple[_Check, ...]]]
+    by_xpath: tuple[tuple[etree.XPath, int, tuple[_Check, ...]], ...]
+
+
+class _UnsupportedContext(Exception):
+    """A rule context selected something other than an element."""
+
+
+_ISO = "{http://purl.oclc.org/dsdl/schematron}"
+_SCH_SCHEMA = f"{_ISO}schema"
+_SCH_NS = f"{_ISO}ns"
+_SCH_PATTERN = f"{_ISO}pattern"
+_SCH_RULE = f"{_ISO}rule"
+_DOCUMENTATION_TAGS = frozenset({f"{_ISO}title", f"{_ISO}p"})
+_CHECK_LEVELS = {
+    f"{_ISO}assert": (False, FindingLevel.ERROR),
+    f"{_ISO}report": (True, FindingLevel.WARNING),
+}
+# Contexts of the form *[local-name()='Name'] and Name or prefix:Name
+_LOCAL_NAME_CONTEXT = re.compile(r"""\*\[local-name\(\)\s*=\s*(['"])([\w.-]+)\1\]""")
+_NAME_CONTEXT = re.compile(r"(?:([A-Za-z_][\w.-]*):)?([A-Za-z_][\w.-]*)")
+# Expressions are compiled as XPath, so they are evaluated once against a
+# bare element to reject variables and XSLT-only functions up front
+_PROBE = etree.Element("probe")
+
+
+def _compile_xpath(expression: str, namespaces: dict[str, str]) -> etree.XPath | None:
+    try:
+        xpath = etree.XPath(expression, namespaces=namespaces)
+        xpath(_PROBE)
+    except etree.XPathError:
+        return None
+    return xpath
+
+
+def _compile_checks(rule: etree._Element, namespaces: dict[str, str]) -> list[_Check] | None:
+    checks: list[_Check] = []
+    for check in rule.iterchildren(tag=etree.Element):
+        if check.tag in _DOCUMENTATION_TAGS:
+            continue
+        kind = _CHECK_LEVELS.get(check.tag)
+        test = check.get("test")
+        if kind is None or not test:
+            return None
+        test_xpath = _compile_xpath(f"boolean({test})", namespaces)
+        if test_xpath is None:
+            return None
+        checks.append(_Check(test_xpath, kind[0], kind[1], check.get("id", "unknown"), test))
+    return checks
+
+
+def _compile_pattern(pattern: etree._Element, namespaces: dict[str, str]) -> _Pattern | None:
+    by_tag: dict[str, tuple[int, tuple[_Check, ...]]] = {}
+    by_local_name: dict[str, tuple[int, tuple[_Check, ...]]] = {}
+    by_xpath: list[tuple[etree.XPath, int, tuple[_Check, ...]]] = []
+    for index, rule in enumerate(pattern.iterchildren(tag=etree.Element)):
+        if rule.tag in _DOCUMENTATION_TAGS:
+            continue
+        context = rule.get("context")
+        if rule.tag != _SCH_RULE or rule.get("abstract") or not context or "|" in context:
+            return None
+        checks = _compile_checks(rule, namespaces)
+        if checks is None:
+            return None
+        entry = (index, tuple(checks))
+
+        context = context.strip()
+        if match := _LOCAL_NAME_CONTEXT.fullmatch(context):
+            by_local_name.setdefault(match[2], entry)
+        elif (match := _NAME_CONTEXT.fullmatch(context)) and (
+            match[1] is None or match[1] in namespaces
+        ):
+            prefix, name = match.groups()
+            by_tag.setdefault(name if prefix is None else f"{{{namespaces[prefix]}}}{name}", entry)
+        else:
+            context_xpath = _compile_xpath(
+                context if context.startswith("/") else f"//{context}", namespaces
+            )
+            if context_xpath is None:
+                return None
+            by_xpath.append((context_xpath, *entry))
+    return _Pattern(by_tag, by_local_name, tuple(by_xpath))
+
+
+def _compile_patterns(rules_doc: etree._Element) -> list[_Pattern] | None:
+    """Compile each pattern's rules to XPath, or return None if any construct needs XSLT."""
+    if rules_doc.tag != _SCH_SCHEMA:
+        return None
+    if rules_doc.get("queryBinding", "xslt").lower() not in ("xslt", "xpath"):
+        return None
+
+    namespaces = {ns.get("prefix", ""): ns.get("uri", "") for ns in rules_doc.iterchildren(_SCH_NS)}
+    patterns: list[_Pattern] = []
+    for pattern in rules_doc.iterchildren(tag=etree.Element):
+        if pattern.tag in _DOCUMENTATION_TAGS or pattern.tag == _SCH_NS:
+            continue
+        if pattern.tag != _SCH_PATTERN or pattern.get("abstract") or pattern.get("is-a"):
+            return None
+        compiled = _compile_pattern(pattern, namespaces)
+        if compiled is None:
+            return None
+        patterns.append(compiled)
+
+    return patterns
+
+
+def _evaluate_patterns(
+    patterns: list[_Pattern],
+    xml_doc: etree._Element | etree._ElementTree,
+    short_circuit: bool = False,
+) -> list[Finding]:
+    """Check a document the way the SVRL pipeline does, reporting in document order.
+
+    Within a pattern each element is checked by the first rule whose context
+    selects it. An element that is not the root of its document is checked
+    as if it were, so only its own subtree is walked.
+    """
+    root = xml_doc.getroot() if isinstance(xml_doc, etree._ElementTree) else xml_doc
+    findings: list[Finding] = []
+    for pattern in patterns:
+        selected: dict[etree._Element, tuple[int, tuple[_Check, ...]]] = {}
+        for context, index, checks in pattern.by_xpath:
+            for node in context(root):
+                if not isinstance(node, etree._Element):
+                    raise _UnsupportedContext(context.path)
+                selected.setdefault(node, (index, checks))
+
+        for node in root.iter():
+            entry = selected.get(node)
+            tag = node.tag
+            if isinstance(tag, str):
+                for hit in (
+                    pattern.by_tag.get(tag),
+                    pattern.by_local_name.get(tag.rpartition("}")[2]),
+                ):
+                    if hit is not None and (entry is None or hit[0] < entry[0]):
+                        entry = hit
+            if entry is None:
+                continue
+            for check in entry[1]:
+                if check.test(node) is check.fires_when:
+                    findings.append(_rule_finding(check.level, check.rule_id, check.source))
+                    if short_circuit and check.level == FindingLevel.ERROR:
+                        return findings
+
+    return findings
+
+
+# Compiled queries for get_rules_info
+_NS = {"sch": "http://purl.oclc.org/dsdl/schematron"}
+_FIRST_TITLE = etree.XPath("(.//sch:title)[1]", namespaces=_NS)
+_FIRST_DESCRIPTION = etree.XPath("(.//sch:description)[1]", namespaces=_NS)
+_PATTERNS = etree.XPath(".//sch:pattern", namespaces=_NS)
+_PATTERN_TITLE = etree.XPath("sch:title[1]", namespaces=_NS)
+_RULES = etree.XPath(".//sch:rule", namespaces=_NS)
+_ASSERTS = etree.XPath(".//sch:assert", namespaces=_NS)
+
+# MITS 5.0 business rules shipped with the repository
+_DEFAULT_RULES_PATH = (
+    Path(__file__).parent.parent.parent.parent
+    / "rules"
+    / "schematron"
+    / "5.0"
+    / "business-rules.sch"
+)
+
+# Failed asserts and fired reports in an SVRL validation report
+_SVRL_NS = {"svrl": "http://purl.oclc.org/dsdl/svrl"}
+_SVRL_SUCCESSFUL_REPORT = "{http://purl.oclc.org/dsdl/svrl}successful-report"
+_SVRL_RESULTS = etree.XPath("//svrl:failed-assert | //svrl:successful-report", namespaces=_SVRL_NS)
+
+# Unit of work for validate_schematron_stream, matched in any namespace
+_ANY_PROPERTY = "{*}Property"
+
+# Compiled rules keyed by path, with the file's mtime_ns at compile time;
+# an edited file replaces its stale entry rather than adding another
+_SCH_CACHE: dict[str, tuple[int, CompiledSchematron]] = {}
+_SCH_CACHE_LOCK = threading.Lock()
+
+
+def load_rules(rules_path: Path) -> CompiledSchematron:
+    """Load and compile Schematron rules, reusing a cached compilation when possible."""
+    path = str(rules_path)
+    mtime_ns = rules_path.stat().st_mtime_ns
+    cached = _SCH_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        with _SCH_CACHE_LOCK:
+            cached = _SCH_CACHE.get(path)
+            if cached is None or cached[0] != mtime_ns:
+                with open(rules_path, "rb") as f:
+                    rules_doc = etree.fromstring(f.read(), parser=get_document_parser())
+                cached = (mtime_ns, CompiledSchematron(rules_doc))
+                _SCH_CACHE[path] = cached
+    return cached[1]
+
+
+def clear_rules_cache() -> None:
+    """Drop every cached Schematron compilation."""
+    with _SCH_CACHE_LOCK:
+        _SCH_CACHE.clear()
+
+
+def findings_from_report(report: Any) -> list[Finding]:
+    """Convert failed asserts and successful reports in an SVRL report to findings."""
+    findings: list[Finding] = []
+    if report is None:
+        return findings
+
+    for error in _SVRL_RESULTS(report):
+        # Extract rule information
+        rule_id = error.get("id", "unknown")
+        test = error.get("test", "")
+        message = error.text.strip() if error.text else _RULE_FAILED
+
+        # Determine severity based on rule type
+        level = FindingLevel.ERROR
+        if error.tag == _SVRL_SUCCESSFUL_REPORT:
+            level = FindingLevel.WARNING
+
+        findings.append(_rule_finding(level, rule_id, test, message))
+
+    return findings
+
+
+# SVRL puts assert text in a child element, so reports carry this message
+_RULE_FAILED = "Rule validation failed"
+
+
+def _rule_finding(
+    level: FindingLevel, rule_id: str, test: str, message: str = _RULE_FAILED
+) -> Finding:
+    return Finding(
+        level=level,
+        code="SCHEMATRON:RULE_FAILURE",
+        message=message,
+        rule_ref=f"schematron://{rule_id}",
+        location={
+            "xpath": test,
+            "rule_id": rule_id,
+        },
+    )
+
+
+def _no_rules_finding(rules_path: Path) -> Finding:
+    return Finding(
+        level=FindingLevel.INFO,
+        code="SCHEMATRON:NO_RULES_LOADED",
+        message=f"No Schematron rules found at {rules_path}",
+        rule_ref="internal://Schematron",
+    )
+
+
+def _load_rules_or_finding(rules_path: Path | None) -> CompiledSchematron | Finding:
+    """Load rules_path (the MITS 5.0 rules when None), or explain why it cannot be used."""
+    if rules_path is None:
+        rules_path = _DEFAULT_RULES_PATH
+
+    if not rules_path.exists():
+        return _no_rules_finding(rules_path)
+
+    try:
+        return load_rules(rules_path)
+    except etree.XMLSyntaxError as e:
+        return Finding(
+            level=FindingLevel.ERROR,
+            code="SCHEMATRON:RULES_PARSE_ERROR",
+            message=f"Failed to parse Schematron rules: {e}",
+            rule_ref="internal://Schematron",
+        )
+
+
 def validate_schematron(
-    xml_content: str | bytes | Path,
+    xml_content: str | bytes | Path | etree._Element,
     rules_path: Path | None = None,
+    schematron: CompiledSchematron | None = None,
+    *,
+    short_circuit: bool = False,
 ) -> ValidationResult:
     """
     Validate XML content against MITS 5.0 Schematron rules.
 
     Args:
-        xml_content: XML content to validate (string, bytes, or file path)
+        xml_content: XML content to validate (string, bytes, file path, or parsed element)
         rules_path: Path to Schematron rules file (defaults to MITS 5.0 rules)
+        schematron: Already compiled rules; when given, rules_path is not read
+        short_circuit: End the findings at the first failed assert, for callers
+            that only need to know whether the document passes; only rules
+            checked by XPath skip the remaining work
 
     Returns:
         ValidationResult with validation findings
@@ -36,68 +402,21 @@ def validate_schematron(
     Raises:
         SchematronValidationError: If rules loading fails
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     findings: list[Finding] = []
 
     try:
-        # Load Schematron rules
-        if rules_path is None:
-            rules_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "rules"
-                / "schematron"
-                / "5.0"
-                / "business-rules.sch"
-            )
-
-        if not rules_path.exists():
-            findings.append(
-                Finding(
-                    level=FindingLevel.INFO,
-                    code="SCHEMATRON:NO_RULES_LOADED",
-                    message=f"No Schematron rules found at {rules_path}",
-                    rule_ref="internal://Schematron",
-                )
-            )
+        if schematron is None and rules_path is not None and not rules_path.exists():
+            findings.append(_no_rules_finding(rules_path))
             return ValidationResult(
                 level="Schematron",
                 findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
-        # Parse Schematron rules
+        # Parse XML content unless the caller already holds the tree
         try:
-            with open(rules_path, "rb") as f:
-                rules_content = f.read()
-            rules_doc = etree.fromstring(rules_content)
-            schematron = Schematron(rules_doc, store_report=True)
-        except etree.XMLSyntaxError as e:
-            findings.append(
-                Finding(
-                    level=FindingLevel.ERROR,
-                    code="SCHEMATRON:RULES_PARSE_ERROR",
-                    message=f"Failed to parse Schematron rules: {e}",
-                    rule_ref="internal://Schematron",
-                )
-            )
-            return ValidationResult(
-                level="Schematron",
-                findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
-            )
-
-        # Parse XML content
-        try:
-            if isinstance(xml_content, str | bytes):
-                # Parse from string/bytes
-                parser = etree.XMLParser(no_network=True, resolve_entities=False)
-                if isinstance(xml_content, str):
-                    xml_content = xml_content.encode("utf-8")
-                xml_doc = etree.fromstring(xml_content, parser=parser)
-            else:
-                # Parse from file path
-                parser = etree.XMLParser(no_network=True, resolve_entities=False)
-                xml_doc = etree.parse(str(xml_content), parser=parser)
+            xml_doc = parse_document(xml_content)
         except XMLSyntaxError as e:
             findings.append(
                 Finding(
@@ -110,43 +429,25 @@ def validate_schematron(
             return ValidationResult(
                 level="Schematron",
                 findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
+        # Compile Schematron rules unless a compiled set was provided; this
+        # comes after parsing so malformed input never pays for compilation
+        if schematron is None:
+            rules = _load_rules_or_finding(rules_path)
+            if isinstance(rules, Finding):
+                findings.append(rules)
+                return ValidationResult(
+                    level="Schematron",
+                    findings=findings,
+                    duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                )
+            schematron = rules
+
         # Validate against Schematron rules
         try:
-            is_valid = schematron.validate(xml_doc)
-
-            if not is_valid:
-                # Parse validation report
-                report = schematron.validation_report
-                if report is not None:
-                    for error in report.iter():
-                        if str(error.tag).endswith("failed-assert") or str(error.tag).endswith(
-                            "successful-report"
-                        ):
-                            # Extract rule information
-                            rule_id = error.get("id", "unknown")
-                            test = error.get("test", "")
-                            message = error.text.strip() if error.text else "Rule validation failed"
-
-                            # Determine severity based on rule type
-                            level = FindingLevel.ERROR
-                            if str(error.tag).endswith("successful-report"):
-                                level = FindingLevel.WARNING
-
-                            findings.append(
-                                Finding(
-                                    level=level,
-                                    code="SCHEMATRON:RULE_FAILURE",
-                                    message=message,
-                                    rule_ref=f"schematron://{rule_id}",
-                                    location={
-                                        "xpath": test,
-                                        "rule_id": rule_id,
-                                    },
-                                )
-                            )
+            findings.extend(schematron.findings(xml_doc, short_circuit))
 
         except Exception as e:
             findings.append(
@@ -168,7 +469,85 @@ def validate_schematron(
             )
         )
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+    return ValidationResult(
+        level="Schematron",
+        findings=findings,
+        duration_ms=duration_ms,
+    )
+
+
+def validate_schematron_stream(
+    xml_content: bytes | Path,
+    rules_path: Path | None = None,
+    schematron: CompiledSchematron | None = None,
+) -> ValidationResult:
+    """
+    Validate XML content against MITS 5.0 Schematron rules one Property at a time.
+
+    Every MITS 5.0 business rule applies to a Property or to an element inside
+    one, so each Property is checked as soon as it has been parsed and then
+    discarded; memory stays bounded by the largest Property rather than the
+    document. Findings match validate_schematron for documents whose content
+    is all inside Property elements; anything outside a Property is not checked.
+
+    Args:
+        xml_content: XML content to validate (bytes or file path)
+        rules_path: Path to Schematron rules file (defaults to MITS 5.0 rules)
+        schematron: Already compiled rules; when given, rules_path is not read
+
+    Returns:
+        ValidationResult with validation findings
+    """
+    start_ns = time.perf_counter_ns()
+    findings: list[Finding] = []
+
+    if schematron is None:
+        rules = _load_rules_or_finding(rules_path)
+        if isinstance(rules, Finding):
+            return ValidationResult(
+                level="Schematron",
+                findings=[rules],
+                duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+            )
+        schematron = rules
+
+    source = BytesIO(xml_content) if isinstance(xml_content, bytes) else str(xml_content)
+    try:
+        for _, prop in etree.iterparse(
+            source,
+            events=("end",),
+            tag=_ANY_PROPERTY,
+            no_network=True,
+            resolve_entities=False,
+            huge_tree=False,
+        ):
+            findings.extend(schematron.findings(prop))
+            # Drop the checked Property and everything parsed before it
+            prop.clear()
+            parent = prop.getparent()
+            while prop.getprevious() is not None:
+                del parent[0]
+    except XMLSyntaxError as e:
+        findings.append(
+            Finding(
+                level=FindingLevel.ERROR,
+                code="SCHEMATRON:XML_PARSE_ERROR",
+                message=f"XML parsing failed: {e}",
+                rule_ref="internal://Schematron",
+            )
+        )
+    except Exception as e:
+        findings.append(
+            Finding(
+                level=FindingLevel.ERROR,
+                code="SCHEMATRON:VALIDATION_ERROR",
+                message=f"Schematron validation failed: {e}",
+                rule_ref="internal://Schematron",
+            )
+        )
+
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
     return ValidationResult(
         level="Schematron",
         findings=findings,
@@ -187,13 +566,7 @@ def get_rules_info(rules_path: Path | None = None) -> dict[str, Any]:
         Dictionary with rules information
     """
     if rules_path is None:
-        rules_path = (
-            Path(__file__).parent.parent.parent.parent
-            / "rules"
-            / "schematron"
-            / "5.0"
-            / "business-rules.sch"
-        )
+        rules_path = _DEFAULT_RULES_PATH
 
     info = {
         "rules_path": str(rules_path),
@@ -206,38 +579,31 @@ def get_rules_info(rules_path: Path | None = None) -> dict[str, Any]:
 
     if rules_path.exists():
         try:
-            rules_doc = etree.parse(str(rules_path))
+            rules_doc = etree.parse(str(rules_path), parser=get_document_parser())
             root = rules_doc.getroot()
 
             # Extract title and description
-            title_elem = root.find(".//{http://purl.oclc.org/dsdl/schematron}title")
-            if title_elem is not None:
+            for title_elem in _FIRST_TITLE(root):
                 info["title"] = title_elem.text
 
-            desc_elem = root.find(".//{http://purl.oclc.org/dsdl/schematron}description")
-            if desc_elem is not None:
+            for desc_elem in _FIRST_DESCRIPTION(root):
                 info["description"] = desc_elem.text
 
             # Extract patterns and rules
-            patterns = root.findall(".//{http://purl.oclc.org/dsdl/schematron}pattern")
-            for pattern in patterns:
-                pattern_title = pattern.find("{http://purl.oclc.org/dsdl/schematron}title")
+            for pattern in _PATTERNS(root):
+                pattern_title = _PATTERN_TITLE(pattern)
                 pattern_info = {
-                    "title": (
-                        pattern_title.text if pattern_title is not None else "Untitled Pattern"
-                    ),
+                    "title": pattern_title[0].text if pattern_title else "Untitled Pattern",
                     "rules": [],
                 }
 
-                rules = pattern.findall(".//{http://purl.oclc.org/dsdl/schematron}rule")
-                for rule in rules:
+                for rule in _RULES(pattern):
                     rule_info = {
                         "context": rule.get("context", ""),
                         "assertions": [],
                     }
 
-                    assertions = rule.findall(".//{http://purl.oclc.org/dsdl/schematron}assert")
-                    for assertion in assertions:
+                    for assertion in _ASSERTS(rule):
                         rule_info["assertions"].append(
                             {
                                 "test": assertion.get("test", ""),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -10,6 +11,7 @@ from lxml import etree
 from lxml.etree import XMLSchema, XMLSyntaxError
 
 from mits_validator.models import Finding, FindingLevel, ValidationResult
+from mits_validator.validation.parsing import parse_document
 
 
 class XSDValidationError(Exception):
@@ -18,16 +20,52 @@ class XSDValidationError(Exception):
     pass
 
 
+# Qualified tag of xs:element declarations
+_XS_ELEMENT = "{http://www.w3.org/2001/XMLSchema}element"
+
+# Compiled schemas keyed by path, with the file's mtime_ns at compile time;
+# an edited file replaces its stale entry rather than adding another
+_XSD_CACHE: dict[str, tuple[int, XMLSchema]] = {}
+_XSD_CACHE_LOCK = threading.Lock()
+
+# lxml keeps a single error_log on each XMLSchema, so validating with a shared
+# schema and reading that log must not overlap between threads. Locks are picked
+# by the schema's identity from a fixed set: any schema, cached or passed in,
+# always maps to the same lock without being kept alive by it
+_SCHEMA_LOCKS = tuple(threading.Lock() for _ in range(16))
+
+
+def schema_lock(schema: XMLSchema) -> threading.Lock:
+    """Get the lock to hold while validating with schema and reading its error_log."""
+    return _SCHEMA_LOCKS[hash(schema) % len(_SCHEMA_LOCKS)]
+
+
+def load_schema(schema_path: Path) -> XMLSchema:
+    """Load and compile an XSD schema, reusing a cached compilation when possible."""
+    path = str(schema_path)
+    mtime_ns = schema_path.stat().st_mtime_ns
+    cached = _XSD_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        with _XSD_CACHE_LOCK:
+            cached = _XSD_CACHE.get(path)
+            if cached is None or cached[0] != mtime_ns:
+                cached = (mtime_ns, XMLSchema(etree.parse(path)))
+                _XSD_CACHE[path] = cached
+    return cached[1]
+
+
 def validate_xsd(
-    xml_content: str | bytes | Path,
+    xml_content: str | bytes | Path | etree._Element,
     schema_path: Path | None = None,
+    schema: XMLSchema | None = None,
 ) -> ValidationResult:
     """
     Validate XML content against MITS 5.0 XSD schema.
 
     Args:
-        xml_content: XML content to validate (string, bytes, or file path)
+        xml_content: XML content to validate (string, bytes, file path, or parsed element)
         schema_path: Path to XSD schema file (defaults to MITS 5.0 schema)
+        schema: Already compiled schema; when given, schema_path is not read
 
     Returns:
         ValidationResult with validation findings
@@ -35,66 +73,57 @@ def validate_xsd(
     Raises:
         XSDValidationError: If schema loading fails
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     findings: list[Finding] = []
 
     try:
-        # Load schema
-        if schema_path is None:
-            schema_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "rules"
-                / "xsd"
-                / "5.0"
-                / "PropertyMarketing-ILS-5.0.xsd"
-            )
+        # Load schema unless a compiled one was provided
+        if schema is None:
+            if schema_path is None:
+                schema_path = (
+                    Path(__file__).parent.parent.parent.parent
+                    / "rules"
+                    / "xsd"
+                    / "5.0"
+                    / "PropertyMarketing-ILS-5.0.xsd"
+                )
 
-        if not schema_path.exists():
-            findings.append(
-                Finding(
-                    level=FindingLevel.ERROR,
-                    code="XSD:SCHEMA_MISSING",
-                    message=f"XSD schema not found at {schema_path}",
-                    rule_ref="internal://XSD",
+            if not schema_path.exists():
+                findings.append(
+                    Finding(
+                        level=FindingLevel.ERROR,
+                        code="XSD:SCHEMA_MISSING",
+                        message=f"XSD schema not found at {schema_path}",
+                        rule_ref="internal://XSD",
+                    )
+                )
+                return ValidationResult(
+                    level="XSD",
+                    findings=findings,
+                    duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
                 )
-            )
-            return ValidationResult(
-                level="XSD",
-                findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
-            )
 
-        # Parse schema
-        try:
-            schema_doc = etree.parse(str(schema_path))
-            schema = XMLSchema(schema_doc)
-        except etree.XMLSyntaxError as e:
-            findings.append(
-                Finding(
-                    level=FindingLevel.ERROR,
-                    code="XSD:SCHEMA_PARSE_ERROR",
-                    message=f"Failed to parse XSD schema: {e}",
-                    rule_ref="internal://XSD",
+            # Parse schema
+            try:
+                schema = load_schema(schema_path)
+            except etree.XMLSyntaxError as e:
+                findings.append(
+                    Finding(
+                        level=FindingLevel.ERROR,
+                        code="XSD:SCHEMA_PARSE_ERROR",
+                        message=f"Failed to parse XSD schema: {e}",
+                        rule_ref="internal://XSD",
+                    )
+                )
+                return ValidationResult(
+                    level="XSD",
+                    findings=findings,
+                    duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
                 )
-            )
-            return ValidationResult(
-                level="XSD",
-                findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
-            )
 
-        # Parse XML content
+        # Parse XML content unless the caller already holds the tree
         try:
-            if isinstance(xml_content, str | bytes):
-                # Parse from string/bytes
-                parser = etree.XMLParser(no_network=True, resolve_entities=False)
-                if isinstance(xml_content, str):
-                    xml_content = xml_content.encode("utf-8")
-                xml_doc = etree.fromstring(xml_content, parser=parser)
-            else:
-                # Parse from file path
-                parser = etree.XMLParser(no_network=True, resolve_entities=False)
-                xml_doc = etree.parse(str(xml_content), parser=parser)
+            xml_doc = parse_document(xml_content)
         except XMLSyntaxError as e:
             findings.append(
                 Finding(
@@ -107,15 +136,14 @@ def validate_xsd(
             return ValidationResult(
                 level="XSD",
                 findings=findings,
-                duration_ms=int((time.time() - start_time) * 1000),
+                duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
             )
 
         # Validate against schema
         try:
-            schema.assertValid(xml_doc)
-        except etree.DocumentInvalid:
-            # Parse validation errors
-            for error in schema.error_log:
+            with schema_lock(schema):
+                errors = [] if schema.validate(xml_doc) else list(schema.error_log)
+            for error in errors:
                 findings.append(
                     Finding(
                         level=FindingLevel.ERROR,
@@ -149,7 +177,7 @@ def validate_xsd(
             )
         )
 
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
     return ValidationResult(
         level="XSD",
         findings=findings,
@@ -208,14 +236,14 @@ def get_schema_info(schema_path: Path | None = None) -> dict[str, Any]:
                 info["namespace"] = root.nsmap.get(None, "")
 
             # Extract root element
-            for elem in root.iter():
-                if str(elem.tag).endswith("element") and elem.get("name"):
+            for elem in root.iter(_XS_ELEMENT):
+                if elem.get("name"):
                     info["root_element"] = elem.get("name")
                     break
 
             # If no root element found, try to get the first element
             if not info["root_element"]:
-                elements = root.findall(".//{http://www.w3.org/2001/XMLSchema}element")
+                elements = root.findall(f".//{_XS_ELEMENT}")
                 if elements:
                     info["root_element"] = elements[0].get("name")
 
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import operator
+import threading
 import time
 import uuid
-from datetime import UTC
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Protocol
-from xml.etree.ElementTree import ParseError
 
+import fastapi
+import lxml
 import lxml.etree as ET
 
 from mits_validator.levels import SchematronValidator, XSDValidator
@@ -15,18 +23,64 @@ from mits_validator.models import (
     Finding,
     FindingLevel,
     Location,
+    ValidationLevel,
     ValidationRequest,
     ValidationResult,
 )
 from mits_validator.profile_loader import get_profile_loader
 from mits_validator.profile_models import ProfileConfig
+from mits_validator.validation.parsing import get_document_parser
+
+# Engine versions never change at runtime, so resolve them once at import
+ENGINE_VERSIONS: dict[str, str] = {
+    "fastapi": fastapi.__version__,
+    "lxml": lxml.__version__,
+}
+
+# Number of recent validate() outputs kept by engines created with cache=True
+_RESULT_CACHE_SIZE = 32
+
+# Levels that need the whole document tree in memory
+_TREE_LEVELS = frozenset({"XSD", "Schematron"})
+
+# Rule-based levels that cannot pass once the document fails its schema
+_SKIPPED_AFTER_XSD_ERROR = frozenset({"Schematron", "Semantic"})
+
+# Content types that are accepted for validation but may not actually be XML
+_SUSPICIOUS_CONTENT_TYPES = frozenset({"application/octet-stream", "text/plain"})
+
+# lxml releases the GIL during schema and rule validation, so the independent
+# levels run in parallel on the shared tree. One pool serves every engine, so
+# engines dropped from get_engine's cache leave no idle workers behind; it is
+# started by the first request that needs it, which streaming requests never do.
+# WellFormed runs on the calling thread, so one worker per other level suffices.
+_LEVEL_POOL_SIZE = len(ValidationLevel) - 1
+_LEVEL_POOL: ThreadPoolExecutor | None = None
+_LEVEL_POOL_LOCK = threading.Lock()
+
+
+def _copy_results(results: list[ValidationResult]) -> list[ValidationResult]:
+    """Copy results and their findings lists; findings themselves are frozen."""
+    return [replace(result, findings=list(result.findings)) for result in results]
+
+
+def _level_pool() -> ThreadPoolExecutor:
+    """Get the pool that runs validation levels, starting it on first use."""
+    global _LEVEL_POOL
+    if _LEVEL_POOL is None:
+        with _LEVEL_POOL_LOCK:
+            if _LEVEL_POOL is None:
+                _LEVEL_POOL = ThreadPoolExecutor(
+                    max_workers=_LEVEL_POOL_SIZE, thread_name_prefix="mits-level"
+                )
+    return _LEVEL_POOL
 
 
 class ValidationLevelProtocol(Protocol):
     """Protocol for validation levels."""
 
-    def validate(self, content: bytes) -> ValidationResult:
-        """Validate content and return findings."""
+    def validate(self, content: bytes, xml_doc: ET._Element | None = None) -> ValidationResult:
+        """Validate content and return findings, reusing xml_doc when already parsed."""
         ...
 
     def get_name(self) -> str:
@@ -39,28 +93,36 @@ class WellFormedValidator:
 
     def validate(self, content: bytes, content_type: str | None = None) -> ValidationResult:
         """Validate XML well-formedness."""
-        start_time = time.time()
-        findings: list[Finding] = []
+        return self.check(content, content_type)[0]
 
-        # Check for suspicious content types
-        if content_type and content_type.lower() in ["application/octet-stream", "text/plain"]:
-            findings.append(
+    def content_type_findings(self, content_type: str | None) -> list[Finding]:
+        """Warn about declared content types that may not be XML."""
+        if content_type and content_type.lower() in _SUSPICIOUS_CONTENT_TYPES:
+            return [
                 Finding(
                     level=FindingLevel.WARNING,
                     code="WELLFORMED:SUSPICIOUS_CONTENT_TYPE",
                     message=f"Content type '{content_type}' may not be XML",
                     rule_ref="internal://WellFormed",
                 )
-            )
+            ]
+        return []
+
+    def check(
+        self, content: bytes, content_type: str | None = None
+    ) -> tuple[ValidationResult, ET._Element | None]:
+        """Validate XML well-formedness and return the parsed tree when it parses."""
+        start_ns = time.perf_counter_ns()
+        xml_doc: ET._Element | None = None
+        findings = self.content_type_findings(content_type)
 
         try:
             # Parse XML to check well-formedness
-            ET.fromstring(content)
+            xml_doc = ET.fromstring(content, get_document_parser())
 
-        except (ParseError, ET.XMLSyntaxError) as e:
-            # Extract line/column if available
-            line = getattr(e, "lineno", None)
-            column = getattr(e, "offset", None)
+        except ET.XMLSyntaxError as e:
+            line = e.lineno
+            column = e.offset
 
             findings.append(
                 Finding(
@@ -81,8 +143,9 @@ class WellFormedValidator:
                 )
             )
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        return ValidationResult(level="WellFormed", findings=findings, duration_ms=duration_ms)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        result = ValidationResult(level="WellFormed", findings=findings, duration_ms=duration_ms)
+        return result, xml_doc
 
     def get_name(self) -> str:
         """Get the name of this validation level."""
@@ -93,16 +156,28 @@ class ValidationEngine:
     """Main validation engine with level registry."""
 
     def __init__(
-        self, profile: str | None = None, rules_dir: Path | None = None, version: str = "mits-5.0"
+        self,
+        profile: str | None = None,
+        rules_dir: Path | None = None,
+        version: str = "mits-5.0",
+        cache: bool = False,
     ) -> None:
         self._levels: dict[str, ValidationLevelProtocol] = {}
+        self._wellformed = WellFormedValidator()
         self._rules_dir = rules_dir or Path("rules")
         self._version = version
         self._profile_name = profile or "default"
         self._profile_config: ProfileConfig | None = None
+        self._severity_overrides: dict[str, FindingLevel] = {}
         self._profile_loader = get_profile_loader(self._rules_dir)
         self._load_profile()
         self._register_levels()
+        # Opt-in LRU of recent outputs for re-submitted payloads; the engine's
+        # configuration is fixed, so entries never go stale
+        self._results: (
+            OrderedDict[tuple[bytes, tuple[str, ...], str | None], list[ValidationResult]] | None
+        ) = OrderedDict() if cache else None
+        self._results_lock = threading.Lock()
 
     def _load_profile(self) -> None:
         """Load profile configuration."""
@@ -121,20 +196,26 @@ class ValidationEngine:
                     severity_overrides={},
                 )
 
+        # Most profiles override nothing, which lets the per-result pass return early
+        self._severity_overrides = self._profile_config.severity_overrides
+
     def _register_levels(self) -> None:
         """Register validation levels based on profile."""
         # Always register WellFormed
-        self._levels["WellFormed"] = WellFormedValidator()
+        self._levels["WellFormed"] = self._wellformed
 
         if not self._profile_config:
             return
 
-        # Register XSD if in profile
+        # Register XSD if in profile; the schema is compiled once here and
+        # shared by every request handled by this engine
         if "XSD" in self._profile_config.enabled_levels:
             xsd_schema_path = self._rules_dir / "xsd" / "schema.xsd"
-            self._levels["XSD"] = XSDValidator(xsd_schema_path)
+            validator = XSDValidator(xsd_schema_path)
+            validator._load_schema()
+            self._levels["XSD"] = validator
 
-        # Register Schematron if in profile
+        # Register Schematron if in profile (rules are compiled on construction)
         if "Schematron" in self._profile_config.enabled_levels:
             self._levels["Schematron"] = SchematronValidator(self._rules_dir, self._version)
 
@@ -149,34 +230,102 @@ class ValidationEngine:
         if levels is None:
             levels = self._profile_config.enabled_levels if self._profile_config else []
 
-        results = []
+        if not levels:
+            return []
+
+        if self._results is None:
+            return self._run_levels(content, levels, content_type)
+
+        key = (hashlib.blake2b(content, digest_size=16).digest(), tuple(levels), content_type)
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return _copy_results(cached)
+
+        results = self._run_levels(content, levels, content_type)
+        # A crash may be transient, so only complete runs are remembered
+        if not any(f.code == "ENGINE:LEVEL_CRASH" for r in results for f in r.findings):
+            with self._results_lock:
+                self._results[key] = _copy_results(results)
+                if len(self._results) > _RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+        return results
+
+    def _run_levels(
+        self, content: bytes, levels: list[str], content_type: str | None
+    ) -> list[ValidationResult]:
+        """Run the requested levels over content."""
+        skipped: frozenset[str] = frozenset()
+        collected: dict[str, ValidationResult] = {}
+        semantic = self._levels.get("Semantic")
+        if (
+            "Semantic" in levels
+            and _TREE_LEVELS.isdisjoint(levels)
+            and isinstance(semantic, SemanticValidator)
+        ):
+            # Nothing needs the whole tree, so check semantics while streaming
+            wellformed_result, semantic_result = self._stream_validate(
+                semantic, content, content_type
+            )
+            if semantic_result is None:
+                return self._parse_failure(wellformed_result, levels)
+            collected["Semantic"] = semantic_result
+            xml_doc = None
+        else:
+            # Parse once; every later level validates the same tree
+            wellformed_result, xml_doc = self._wellformed.check(content, content_type)
+            if xml_doc is None:
+                # A document that does not parse cannot be checked any further
+                return self._parse_failure(wellformed_result, levels)
+
+        # With stop_on_error, XSD runs first so rule levels can be skipped on failure
+        if (
+            self._profile_config
+            and self._profile_config.stop_on_error
+            and "XSD" in levels
+            and "XSD" in self._levels
+        ):
+            xsd_future = _level_pool().submit(self._levels["XSD"].validate, content, xml_doc)
+            collected["XSD"] = self._collect("XSD", xsd_future)
+            if any(f.level == FindingLevel.ERROR for f in collected["XSD"].findings):
+                skipped = _SKIPPED_AFTER_XSD_ERROR
+
+        # Submit every other available level up front, then collect in request order
+        futures: dict[str, Future[ValidationResult]] = {}
         for level_name in levels:
+            done = level_name in collected or level_name in futures
+            if level_name == "WellFormed" or done or level_name in skipped:
+                continue
             if level_name in self._levels:
-                try:
-                    validator = self._levels[level_name]
-                    # Pass content_type to WellFormed validator
-                    if level_name == "WellFormed":
-                        result = validator.validate(content, content_type)
-                    else:
-                        result = validator.validate(content)
-                    # Apply severity overrides if configured
-                    self._apply_severity_overrides(result)
-                    results.append(result)
-                except Exception as e:
-                    # Defensive: capture level crashes as findings
-                    crash_result = ValidationResult(
-                        level=level_name,
-                        findings=[
-                            Finding(
-                                level=FindingLevel.ERROR,
-                                code="ENGINE:LEVEL_CRASH",
-                                message=f"Validation level {level_name} crashed: {str(e)}",
-                                rule_ref=f"internal://{level_name}",
-                            )
-                        ],
-                        duration_ms=0,
-                    )
-                    results.append(crash_result)
+                futures[level_name] = _level_pool().submit(
+                    self._levels[level_name].validate, content, xml_doc
+                )
+
+        results = []
+        for level_name in levels:
+            if level_name == "WellFormed":
+                self._apply_severity_overrides(wellformed_result)
+                results.append(wellformed_result)
+            elif level_name in collected:
+                results.append(collected[level_name])
+            elif level_name in futures:
+                results.append(self._collect(level_name, futures[level_name]))
+            elif level_name in skipped:
+                # stop_on_error - say why the level has no findings of its own
+                skipped_result = ValidationResult(
+                    level=level_name,
+                    findings=[
+                        Finding(
+                            level=FindingLevel.INFO,
+                            code="ENGINE:LEVEL_SKIPPED",
+                            message=f"Validation level {level_name} skipped after XSD errors",
+                            rule_ref=f"internal://{level_name}",
+                        )
+                    ],
+                    duration_ms=0,
+                )
+                results.append(skipped_result)
             else:
                 # Level not available - report as missing
                 missing_result = ValidationResult(
@@ -195,14 +344,94 @@ class ValidationEngine:
 
         return results
 
+    def _parse_failure(
+        self, wellformed_result: ValidationResult, levels: list[str]
+    ) -> list[ValidationResult]:
+        """Report a document that does not parse, under a level the caller requested.
+
+        Only requested levels are reported, so when WellFormed was not among
+        them the parse error is returned as the first requested level's result.
+        """
+        self._apply_severity_overrides(wellformed_result)
+        if "WellFormed" not in levels:
+            wellformed_result = ValidationResult(
+                level=levels[0],
+                findings=wellformed_result.findings,
+                duration_ms=wellformed_result.duration_ms,
+            )
+        return [wellformed_result]
+
+    def _stream_validate(
+        self, semantic: SemanticValidator, content: bytes, content_type: str | None
+    ) -> tuple[ValidationResult, ValidationResult | None]:
+        """Run Semantic over a single streaming parse that also proves well-formedness.
+
+        Returns the WellFormed result and the Semantic result, which is None
+        when the content does not parse.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            semantic_result = semantic.validate_stream(content)
+        except ET.XMLSyntaxError:
+            # Let the regular check describe the parse error
+            return self._wellformed.check(content, content_type)[0], None
+        except Exception as e:
+            semantic_result = ValidationResult(
+                level="Semantic",
+                findings=[
+                    Finding(
+                        level=FindingLevel.ERROR,
+                        code="ENGINE:LEVEL_CRASH",
+                        message=f"Validation level Semantic crashed: {str(e)}",
+                        rule_ref="internal://Semantic",
+                    )
+                ],
+                duration_ms=0,
+            )
+        else:
+            self._apply_severity_overrides(semantic_result)
+
+        wellformed_result = ValidationResult(
+            level="WellFormed",
+            findings=self._wellformed.content_type_findings(content_type),
+            duration_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+        )
+        return wellformed_result, semantic_result
+
+    def _collect(self, level_name: str, future: Future[ValidationResult]) -> ValidationResult:
+        """Wait for a level's result, applying overrides and capturing crashes."""
+        try:
+            result = future.result()
+            # Apply severity overrides if configured
+            self._apply_severity_overrides(result)
+            return result
+        except Exception as e:
+            # Defensive: capture level crashes as findings
+            return ValidationResult(
+                level=level_name,
+                findings=[
+                    Finding(
+                        level=FindingLevel.ERROR,
+                        code="ENGINE:LEVEL_CRASH",
+                        message=f"Validation level {level_name} crashed: {str(e)}",
+                        rule_ref=f"internal://{level_name}",
+                    )
+                ],
+                duration_ms=0,
+            )
+
     def _apply_severity_overrides(self, result: ValidationResult) -> None:
         """Apply severity overrides from profile configuration."""
-        if not self._profile_config or not self._profile_config.severity_overrides:
+        overrides = self._severity_overrides
+        if not overrides:
             return
 
-        for finding in result.findings:
-            if finding.code in self._profile_config.severity_overrides:
-                finding.level = self._profile_config.severity_overrides[finding.code]
+        # Findings are immutable, so overridden ones are swapped in place
+        findings = result.findings
+        for index, finding in enumerate(findings):
+            level = overrides.get(finding.code)
+            if level is not None:
+                findings[index] = replace(finding, level=level)
 
     def get_available_levels(self) -> list[str]:
         """Get list of available validation levels."""
@@ -234,52 +463,71 @@ class ValidationEngine:
         }
 
 
+def get_engine(
+    profile: str | None = None, rules_dir: Path | None = None, version: str = "mits-5.0"
+) -> ValidationEngine:
+    """Get the shared validation engine for a profile, building it on first use."""
+    return _get_engine(profile or "default", rules_dir or Path("rules"), version)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_engine(profile: str, rules_dir: Path, version: str) -> ValidationEngine:
+    return ValidationEngine(profile=profile, rules_dir=rules_dir, version=version)
+
+
+# Pulls the serialised fields of a Finding in a single C-level call
+_get_finding_fields = operator.attrgetter("level.value", "code", "message", "rule_ref", "location")
+_get_location_fields = operator.attrgetter("line", "column", "xpath")
+
+
+def _location_to_dict(location: Location | dict[str, Any]) -> dict[str, Any]:
+    """Flatten a Location object or location dict into the envelope shape."""
+    if isinstance(location, dict):
+        return {
+            "line": location.get("line"),
+            "column": location.get("column"),
+            "xpath": location.get("xpath"),
+        }
+    line, column, xpath = _get_location_fields(location)
+    return {"line": line, "column": column, "xpath": xpath}
+
+
 def build_v1_envelope(
     request: ValidationRequest,
     results: list[ValidationResult],
     profile_name: str = "default",
     duration_ms: int = 0,
+    request_id: str | None = None,
+    now: float | None = None,
 ) -> dict[str, Any]:
-    """Build a v1 response envelope from validation results."""
-    from datetime import datetime
-
-    import fastapi
-    import lxml
-
-    # Collect all findings
-    all_findings = []
-    levels_executed = []
+    """Build a v1 response envelope from validation results.
+
+    Callers that already hold a request id or a ``time.time()`` reading can
+    pass them in to avoid generating new ones.
+    """
+    # Collect all findings, counting errors and warnings in the same pass
+    all_findings: list[dict[str, Any]] = []
+    levels_executed = [result.level for result in results]
+    add_finding = all_findings.append
+    errors = 0
+    warnings = 0
 
     for result in results:
-        levels_executed.append(result.level)
         for finding in result.findings:
+            level, code, message, rule_ref, location = _get_finding_fields(finding)
+            if level == "error":
+                errors += 1
+            elif level == "warning":
+                warnings += 1
             finding_dict: dict[str, Any] = {
-                "level": finding.level.value,
-                "code": finding.code,
-                "message": finding.message,
-                "rule_ref": finding.rule_ref,
+                "level": level,
+                "code": code,
+                "message": message,
+                "rule_ref": rule_ref,
             }
-            if finding.location:
-                # Handle both Location objects and dicts
-                if hasattr(finding.location, "line"):
-                    # Location object
-                    finding_dict["location"] = {
-                        "line": finding.location.line,
-                        "column": finding.location.column,
-                        "xpath": finding.location.xpath,
-                    }
-                else:
-                    # Dict
-                    finding_dict["location"] = {
-                        "line": finding.location.get("line"),
-                        "column": finding.location.get("column"),
-                        "xpath": finding.location.get("xpath"),
-                    }
-            all_findings.append(finding_dict)
-
-    # Count errors and warnings
-    errors = sum(1 for f in all_findings if f["level"] == "error")
-    warnings = sum(1 for f in all_findings if f["level"] == "warning")
+            if location:
+                finding_dict["location"] = _location_to_dict(location)
+            add_finding(finding_dict)
 
     return {
         "api_version": "1.0",
@@ -306,11 +554,10 @@ def build_v1_envelope(
         "findings": all_findings,
         "derived": {},
         "metadata": {
-            "request_id": str(uuid.uuid4()),
-            "timestamp": datetime.now(UTC).isoformat(),
-            "engine": {
-                "fastapi": fastapi.__version__,
-                "lxml": lxml.__version__,
-            },
+            "request_id": request_id or str(uuid.uuid4()),
+            "timestamp": datetime.fromtimestamp(
+                time.time() if now is None else now, UTC
+            ).isoformat(),
+            "engine": dict(ENGINE_VERSIONS),
         },
     }
@@ -0,0 +1,14 @@
+"""Shared fixtures for performance benchmarks."""
+
+import pytest
+
+from mits_validator.validation_engine import ValidationEngine
+
+
+@pytest.fixture(scope="session")
+def validation_engine() -> ValidationEngine:
+    """Create one validation engine shared by every benchmark.
+
+    Schema and rule compilation happen once here instead of in each test.
+    """
+    return ValidationEngine()
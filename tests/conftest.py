@@ -0,0 +1,19 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def valid_property_xml_path() -> Path:
+    """Path to the valid MITS 5.0 property fixture."""
+    return FIXTURES / "mits5" / "valid-property.xml"
+
+
+@pytest.fixture(scope="session")
+def valid_property_xml_bytes(valid_property_xml_path: Path) -> bytes:
+    """Contents of the valid MITS 5.0 property fixture, read once per session."""
+    return valid_property_xml_path.read_bytes()
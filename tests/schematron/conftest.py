@@ -0,0 +1,15 @@
+"""Shared fixtures for Schematron tests."""
+
+import pytest
+
+from mits_validator.validation.schematron import _DEFAULT_RULES_PATH, load_rules
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _compiled_business_rules() -> None:
+    """Compile the shipped business rules once before any Schematron test runs.
+
+    validate_schematron then finds them in the load_rules cache, so each test
+    only pays for applying the rules to its document.
+    """
+    load_rules(_DEFAULT_RULES_PATH)
@@ -1,355 +1,131 @@
 """Test enhanced Schematron validation rules."""
 
+import pytest
+
 from mits_validator.models import FindingLevel
 from mits_validator.validation.schematron import validate_schematron
 
-
-class TestEnhancedSchematronValidation:
-    """Test enhanced Schematron validation rules."""
-
-    def test_validate_amount_validation(self):
-        """Test amount validation rules."""
-        # Test negative amount
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>-100.00</Amount>
-        <Description>Invalid negative amount</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_payment_frequency_validation(self):
-        """Test payment frequency validation."""
-        # Test invalid payment frequency
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>InvalidFrequency</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Invalid payment frequency</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_refundability_validation(self):
-        """Test refundability validation."""
-        # Test invalid refundability
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>InvalidRefundability</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Invalid refundability</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_term_basis_validation(self):
-        """Test term basis validation."""
-        # Test invalid term basis
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>InvalidTermBasis</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Invalid term basis</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_address_completeness(self):
-        """Test address completeness validation."""
-        # Test incomplete address
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+# One property with one charge; each test case overrides a few of DEFAULTS
+BASE_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
                    version="5.0"
                    timestamp="2025-01-15T10:30:00Z">
   <Property>
     <PropertyID>TEST-001</PropertyID>
     <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
+    <PropertyType>{property_type}</PropertyType>
     <Address>
-      <!-- Missing StreetAddress -->
+      <StreetAddress>{street_address}</StreetAddress>
       <City>TestCity</City>
       <State>TC</State>
       <PostalCode>12345</PostalCode>
     </Address>
     <ChargeOffer>
       <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Incomplete address</Description>
+        <ChargeClassification>{charge_classification}</ChargeClassification>
+        <Requirement>{requirement}</Requirement>
+        <PaymentFrequency>{payment_frequency}</PaymentFrequency>
+        <Refundability>{refundability}</Refundability>
+        <TermBasis>{term_basis}</TermBasis>
+        <Amount>{amount}</Amount>
+        <Description>Test charge</Description>
       </ChargeOfferItem>
     </ChargeOffer>
   </Property>
 </PropertyMarketing>"""
 
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
+# A valid rent charge
+DEFAULTS = {
+    "property_type": "Apartment",
+    "street_address": "123 Test St",
+    "charge_classification": "Rent",
+    "requirement": "Mandatory",
+    "payment_frequency": "Monthly",
+    "refundability": "NonRefundable",
+    "term_basis": "LeaseTerm",
+    "amount": "1500.00",
+}
 
-    def test_validate_property_type_validation(self):
-        """Test property type validation."""
-        # Test invalid property type
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>InvalidType</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Invalid property type</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
-        result = validate_schematron(xml_content)
-
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_business_logic_consistency(self):
-        """Test business logic consistency validation."""
-        # Test rent charge marked as optional (should be mandatory)
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Optional</Requirement>  <!-- Should be Mandatory -->
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Rent marked as optional</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
 
-        result = validate_schematron(xml_content)
+def build_xml(**overrides: str) -> bytes:
+    """Render BASE_XML with DEFAULTS replaced by overrides."""
+    return BASE_XML.format(**{**DEFAULTS, **overrides}).encode("utf-8")
 
-        assert result.level == "Schematron"
-        assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
 
-    def test_validate_deposit_frequency_consistency(self):
-        """Test deposit frequency consistency validation."""
-        # Test deposit charge with non-OneTime frequency
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>TEST-001</PropertyID>
-    <PropertyName>Test Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Test St</StreetAddress>
-      <City>TestCity</City>
-      <State>TC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Deposit</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>  <!-- Should be OneTime -->
-        <Refundability>Deposit</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Deposit with monthly frequency</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
+class TestEnhancedSchematronValidation:
+    """Test enhanced Schematron validation rules."""
 
+    @pytest.mark.parametrize(
+        ("xml_content", "expected_rule"),
+        [
+            pytest.param(
+                build_xml(amount="-100.00"),
+                "charge-item.amount-nonnegative",
+                id="negative-amount",
+            ),
+            pytest.param(
+                build_xml(payment_frequency="InvalidFrequency"),
+                "payment-frequency.enum",
+                id="payment-frequency",
+            ),
+            pytest.param(
+                build_xml(refundability="InvalidRefundability"),
+                "refundability.enum",
+                id="refundability",
+            ),
+            pytest.param(
+                build_xml(term_basis="InvalidTermBasis"),
+                "term-basis.enum",
+                id="term-basis",
+            ),
+            pytest.param(
+                build_xml(street_address=""),
+                "address.street-present",
+                id="incomplete-address",
+            ),
+            pytest.param(
+                build_xml(property_type="InvalidType"),
+                "property-type.enum",
+                id="property-type",
+            ),
+            pytest.param(
+                build_xml(requirement="Optional"),
+                "charge-item.rent-mandatory",
+                id="optional-rent",
+            ),
+            pytest.param(
+                build_xml(charge_classification="Deposit", refundability="Deposit"),
+                "charge-item.deposit-onetime",
+                id="recurring-deposit",
+            ),
+        ],
+    )
+    def test_rule_violation_reported(self, xml_content: bytes, expected_rule: str):
+        """Test that each rule violation is reported as an error for its rule."""
         result = validate_schematron(xml_content)
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
-        assert any("Rule validation failed" in finding.message for finding in result.findings)
-
-    def test_validate_valid_xml_passes(self):
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
+        rule_refs = {finding.rule_ref for finding in result.findings}
+        assert f"schematron://{expected_rule}" in rule_refs
+
+    @pytest.mark.parametrize(
+        "xml_content",
+        [
+            pytest.param(build_xml(), id="rent"),
+            pytest.param(
+                build_xml(
+                    charge_classification="Deposit",
+                    payment_frequency="OneTime",
+                    refundability="Deposit",
+                ),
+                id="deposit",
+            ),
+        ],
+    )
+    def test_validate_valid_xml_passes(self, xml_content: bytes):
         """Test that valid XML passes all enhanced rules."""
-        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
-                   version="5.0"
-                   timestamp="2025-01-15T10:30:00Z">
-  <Property>
-    <PropertyID>VALID-001</PropertyID>
-    <PropertyName>Valid Property</PropertyName>
-    <PropertyType>Apartment</PropertyType>
-    <Address>
-      <StreetAddress>123 Valid St</StreetAddress>
-      <City>ValidCity</City>
-      <State>VC</State>
-      <PostalCode>12345</PostalCode>
-    </Address>
-    <ChargeOffer>
-      <ChargeOfferItem>
-        <ChargeClassification>Rent</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>Monthly</PaymentFrequency>
-        <Refundability>NonRefundable</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Valid rent charge</Description>
-      </ChargeOfferItem>
-      <ChargeOfferItem>
-        <ChargeClassification>Deposit</ChargeClassification>
-        <Requirement>Mandatory</Requirement>
-        <PaymentFrequency>OneTime</PaymentFrequency>
-        <Refundability>Deposit</Refundability>
-        <TermBasis>LeaseTerm</TermBasis>
-        <Amount>1500.00</Amount>
-        <Description>Valid deposit charge</Description>
-      </ChargeOfferItem>
-    </ChargeOffer>
-  </Property>
-</PropertyMarketing>"""
-
         result = validate_schematron(xml_content)
 
         assert result.level == "Schematron"
@@ -78,7 +78,7 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("Rule validation failed" in finding.message for finding in result.findings)
 
     def test_validate_missing_payment_frequency(self):
@@ -114,7 +114,7 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("Rule validation failed" in finding.message for finding in result.findings)
 
     def test_validate_deposit_without_description(self):
@@ -150,7 +150,7 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("Rule validation failed" in finding.message for finding in result.findings)
 
     def test_validate_missing_rules(self):
@@ -186,21 +186,28 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("XML parsing failed" in finding.message for finding in result.findings)
 
-    def test_validate_from_file(self):
-        """Test validation from file path."""
-        fixture_path = (
-            Path(__file__).parent.parent.parent / "fixtures" / "mits5" / "valid-property.xml"
-        )
+    def test_malformed_xml_skips_rule_compilation(self, tmp_path: Path):
+        """Test that malformed input is reported before the rules are compiled."""
+        rules_path = tmp_path / "broken.sch"
+        rules_path.write_text("<sch:schema")
 
-        if fixture_path.exists():
-            result = validate_schematron(fixture_path)
+        result = validate_schematron(b"<PropertyMarketing>", rules_path=rules_path)
 
-            assert result.level == "Schematron"
-            # Should pass business rule validation
-            assert len(result.findings) == 0
+        assert [f.code for f in result.findings] == ["SCHEMATRON:XML_PARSE_ERROR"]
+
+    def test_validate_from_file(
+        self, valid_property_xml_path: Path, valid_property_xml_bytes: bytes
+    ):
+        """Test validation from file path."""
+        result = validate_schematron(valid_property_xml_path)
+
+        assert result.level == "Schematron"
+        # Should pass business rule validation
+        assert len(result.findings) == 0
+        assert validate_schematron(valid_property_xml_bytes).findings == result.findings
 
     def test_get_rules_info(self):
         """Test getting rules information."""
@@ -251,7 +258,7 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("Rule validation failed" in finding.message for finding in result.findings)
 
     def test_validate_property_completeness(self):
@@ -277,5 +284,275 @@ class TestSchematronValidation:
 
         assert result.level == "Schematron"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("Rule validation failed" in finding.message for finding in result.findings)
+
+    def test_compiled_rules_are_cached(self):
+        """Test that the compiled Schematron is reused until the file changes."""
+        from mits_validator.validation.schematron import clear_rules_cache, load_rules
+
+        rules_path = (
+            Path(__file__).parent.parent.parent
+            / "rules"
+            / "schematron"
+            / "5.0"
+            / "business-rules.sch"
+        )
+
+        compiled = load_rules(rules_path)
+        assert load_rules(rules_path) is compiled
+
+        # Clearing the cache forces a fresh compilation
+        clear_rules_cache()
+        assert load_rules(rules_path) is not compiled
+
+    def test_findings_from_report_levels(self):
+        """Test that failed asserts are errors and successful reports are warnings."""
+        from lxml import etree
+
+        from mits_validator.validation.schematron import findings_from_report
+
+        report = etree.fromstring(
+            b'<svrl:schematron-output xmlns:svrl="http://purl.oclc.org/dsdl/svrl">'
+            b'<svrl:fired-rule context="/"/>'
+            b'<svrl:failed-assert id="r1" test="a"/>'
+            b'<svrl:successful-report id="r2" test="b"/>'
+            b"</svrl:schematron-output>"
+        ).getroottree()
+
+        findings = findings_from_report(report)
+
+        assert [f.level for f in findings] == [FindingLevel.ERROR, FindingLevel.WARNING]
+        assert [f.rule_ref for f in findings] == ["schematron://r1", "schematron://r2"]
+
+    def test_validate_schematron_stream_matches_validate_schematron(self):
+        """Test that checking one Property at a time reports the same findings."""
+        from mits_validator.validation.schematron import validate_schematron_stream
+
+        properties = []
+        for i, property_type in enumerate(["Apartment", "Castle", "House", "Igloo"]):
+            properties.append(
+                f"""
+  <Property>
+    <PropertyID>STREAM-{i}</PropertyID>
+    <PropertyName>Streamed Property {i}</PropertyName>
+    <PropertyType>{property_type}</PropertyType>
+    <ChargeOffer>
+      <ChargeOfferItem>
+        <ChargeClassification>Rent</ChargeClassification>
+        <Requirement>Mandatory</Requirement>
+        <PaymentFrequency>Monthly</PaymentFrequency>
+        <Amount>{-i}</Amount>
+      </ChargeOfferItem>
+    </ChargeOffer>
+  </Property>"""
+            )
+        xml_content = (
+            '<PropertyMarketing xmlns="http://www.mits.org/schema/PropertyMarketing/ILS/5.0">'
+            + "".join(properties)
+            + "\n</PropertyMarketing>"
+        ).encode("utf-8")
+
+        expected = validate_schematron(xml_content)
+        result = validate_schematron_stream(xml_content)
+
+        assert result.level == "Schematron"
+        assert len(result.findings) > 0
+        assert result.findings == expected.findings
+
+        result = validate_schematron_stream(b"<PropertyMarketing><Property>")
+        assert [f.code for f in result.findings] == ["SCHEMATRON:XML_PARSE_ERROR"]
+
+    def test_xpath_rules_match_svrl_report(self):
+        """Test that rules checked directly report what the SVRL pipeline reports."""
+        from lxml import etree
+
+        from mits_validator.validation.schematron import CompiledSchematron, findings_from_report
+
+        rules_doc = etree.fromstring(
+            b'<sch:schema xmlns:sch="http://purl.oclc.org/dsdl/schematron">'
+            b'<sch:ns prefix="m" uri="urn:m"/>'
+            b"<sch:pattern>"
+            b'<sch:rule context="m:a/m:b"><sch:report id="r1" test="@x">x</sch:report></sch:rule>'
+            b'<sch:rule context="m:b"><sch:assert id="a1" test="@y">y</sch:assert></sch:rule>'
+            b"</sch:pattern>"
+            b"<sch:pattern>"
+            b"<sch:rule context=\"*[local-name()='b']\">"
+            b'<sch:assert id="a2" test="@z">z</sch:assert>'
+            b"</sch:rule>"
+            b"</sch:pattern>"
+            b"</sch:schema>"
+        )
+        xml_doc = etree.fromstring(b'<a xmlns="urn:m"><b x="1"/><c><b/></c><b y="1" z="1"/></a>')
+
+        compiled = CompiledSchematron(rules_doc)
+        _, report = compiled.validate(xml_doc)
+
+        findings = compiled.findings(xml_doc)
+        assert findings == findings_from_report(report)
+        assert [f.rule_ref for f in findings] == [
+            "schematron://r1",
+            "schematron://a1",
+            "schematron://a2",
+            "schematron://a2",
+        ]
+
+    def test_rules_needing_xslt_use_svrl(self):
+        """Test that rules using XSLT-only constructs are still checked."""
+        from lxml import etree
+
+        from mits_validator.validation.schematron import CompiledSchematron
+
+        rules_doc = etree.fromstring(
+            b'<sch:schema xmlns:sch="http://purl.oclc.org/dsdl/schematron">'
+            b'<sch:pattern><sch:rule context="item">'
+            b'<sch:let name="limit" value="10"/>'
+            b'<sch:assert id="item.limit" test=". &lt;= $limit">too big</sch:assert>'
+            b"</sch:rule></sch:pattern>"
+            b"</sch:schema>"
+        )
+
+        compiled = CompiledSchematron(rules_doc)
+        xml_doc = etree.fromstring(b"<items><item>5</item><item>50</item><item>60</item></items>")
+
+        findings = compiled.findings(xml_doc)
+        assert [f.rule_ref for f in findings] == ["schematron://item.limit"] * 2
+        assert compiled.findings(xml_doc, short_circuit=True) == findings[:1]
+
+    def test_short_circuit_stops_at_first_error(self):
+        """Test that short_circuit reports only up to the first failed assert."""
+        xml_content = b"""<PropertyMarketing>
+  <Property>
+    <PropertyType>Castle</PropertyType>
+    <ChargeOffer>
+      <ChargeOfferItem>
+        <ChargeClassification>Rent</ChargeClassification>
+        <Requirement>Mandatory</Requirement>
+        <PaymentFrequency>Monthly</PaymentFrequency>
+        <Amount>-1</Amount>
+      </ChargeOfferItem>
+    </ChargeOffer>
+  </Property>
+</PropertyMarketing>"""
+
+        full = validate_schematron(xml_content)
+        result = validate_schematron(xml_content, short_circuit=True)
+
+        assert len(full.findings) > 1
+        assert result.findings == full.findings[:1]
+        assert result.findings[0].level == FindingLevel.ERROR
+
+    def test_short_circuit_skips_remaining_xpath_checks(self):
+        """Test that rules checked by XPath are not evaluated past the first failed assert."""
+        from lxml import etree
+
+        from mits_validator.validation.schematron import CompiledSchematron
+
+        calls = []
+
+        def fail(context, node):
+            calls.append(node)
+            return False
+
+        functions = etree.FunctionNamespace("urn:test-calls")
+        functions["fail"] = fail
+        try:
+            rules_doc = etree.fromstring(
+                b'<sch:schema xmlns:sch="http://purl.oclc.org/dsdl/schematron">'
+                b'<sch:ns prefix="t" uri="urn:test-calls"/>'
+                b'<sch:pattern><sch:rule context="item">'
+                b'<sch:assert id="item.fail" test="t:fail(.)">fails</sch:assert>'
+                b"</sch:rule></sch:pattern>"
+                b"</sch:schema>"
+            )
+            xml_doc = etree.fromstring(b"<items><item/><item/><item/></items>")
+            compiled = CompiledSchematron(rules_doc)
+
+            calls.clear()
+            assert len(compiled.findings(xml_doc)) == 3
+            assert len(calls) == 3
+
+            calls.clear()
+            assert len(compiled.findings(xml_doc, short_circuit=True)) == 1
+            assert len(calls) == 1
+        finally:
+            del functions["fail"]
+
+    def test_xpath_rules_match_svrl_on_shipped_rules(self):
+        """Test that the shipped rules report the same findings on both paths.
+
+        Every fixture and a document breaking every business rule are checked
+        whole and one Property at a time, as validate_schematron_stream does.
+        """
+        from lxml import etree
+
+        from mits_validator.validation.schematron import CompiledSchematron, findings_from_report
+
+        repo_root = Path(__file__).parent.parent.parent
+        rules_doc = etree.parse(
+            str(repo_root / "rules" / "schematron" / "5.0" / "business-rules.sch")
+        ).getroot()
+        compiled = CompiledSchematron(rules_doc)
+        # The shipped rules must be checked without the XSLT pipeline
+        assert compiled._patterns is not None
+
+        documents = [path.read_bytes() for path in sorted(repo_root.glob("fixtures/**/*.xml"))]
+        documents.append(
+            b'<PropertyMarketing xmlns="urn:any"><Property>'
+            b"<PropertyID/><PropertyType>Castle</PropertyType>"
+            b"<Address><City>Anytown</City></Address>"
+            b"<ChargeOffer>"
+            b"<ChargeOfferItem><ChargeClassification>Bogus</ChargeClassification>"
+            b"<Requirement>Mandatory</Requirement><Refundability>Deposit</Refundability>"
+            b"</ChargeOfferItem>"
+            b"<ChargeOfferItem><ChargeClassification>Rent</ChargeClassification>"
+            b"<Requirement>Optional</Requirement><PaymentFrequency>OneTime</PaymentFrequency>"
+            b"<Refundability>Deposit</Refundability><TermBasis>Forever</TermBasis>"
+            b"</ChargeOfferItem>"
+            b"<ChargeOfferItem><ChargeClassification>Deposit</ChargeClassification>"
+            b"<PaymentFrequency>Yearly</PaymentFrequency><Refundability>Maybe</Refundability>"
+            b"<Amount>-5</Amount><Amount></Amount></ChargeOfferItem>"
+            b"</ChargeOffer></Property>"
+            b"<Property><PropertyName>Second</PropertyName><Address/></Property>"
+            b"</PropertyMarketing>"
+        )
+
+        rule_ids = set()
+        for document in documents:
+            xml_doc = etree.fromstring(document)
+            for node in (xml_doc, *xml_doc.iter("{*}Property")):
+                _, report = compiled.validate(node)
+                expected = findings_from_report(report)
+                assert compiled.findings(node) == expected
+                rule_ids.update(f.location["rule_id"] for f in expected)
+
+        # Every assert in the shipped rules fired at least once
+        assert len(rule_ids) == len(rules_doc.findall(".//{*}assert"))
+
+    def test_rules_falling_back_to_xslt_match_svrl(self):
+        """Test that rules the XPath compiler rejects report the SVRL findings."""
+        from lxml import etree
+
+        from mits_validator.validation.schematron import CompiledSchematron, findings_from_report
+
+        rules_doc = etree.fromstring(
+            b'<sch:schema xmlns:sch="http://purl.oclc.org/dsdl/schematron">'
+            b'<sch:pattern><sch:rule context="item | entry">'
+            b'<sch:let name="limit" value="10"/>'
+            b'<sch:assert id="item.limit" test=". &lt;= $limit">too big</sch:assert>'
+            b'<sch:report id="item.zero" test=". = 0">zero</sch:report>'
+            b"</sch:rule></sch:pattern>"
+            b"</sch:schema>"
+        )
+        xml_doc = etree.fromstring(b"<items><item>5</item><entry>50</entry><item>0</item></items>")
+
+        compiled = CompiledSchematron(rules_doc)
+        assert compiled._patterns is None
+        _, report = compiled.validate(xml_doc)
+
+        findings = compiled.findings(xml_doc)
+        assert findings == findings_from_report(report)
+        assert [f.rule_ref for f in findings] == [
+            "schematron://item.limit",
+            "schematron://item.zero",
+        ]
@@ -1,5 +1,8 @@
 """Tests for alerting functionality."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from mits_validator.alerting import (
     AlertManager,
@@ -56,7 +59,7 @@ class TestAlertManager:
 
         alerts = await manager.check_alerts(metrics)
         assert len(alerts) > 0
-        assert any(alert["alert_type"] == "HIGH_ERROR_RATE" for alert in alerts)
+        assert "HIGH_ERROR_RATE" in {alert["alert_type"] for alert in alerts}
 
     @pytest.mark.asyncio
     async def test_resolve_alert(self):
@@ -91,6 +94,19 @@ class TestAlertManager:
         history = manager.get_alert_history(limit=10)
         assert isinstance(history, list)
 
+    @pytest.mark.asyncio
+    async def test_alert_history_keeps_most_recent_alerts(self):
+        """Test that alert history is bounded and drops the oldest alerts first."""
+        with patch("mits_validator.alerting._ALERT_HISTORY_SIZE", 3):
+            manager = AlertManager()
+
+        for i in range(5):
+            await manager._create_alert(f"ALERT_{i}", "Test alert", "warning", {})
+
+        history = manager.get_alert_history(limit=10)
+        assert [alert["alert_type"] for alert in history] == ["ALERT_2", "ALERT_3", "ALERT_4"]
+        assert [a["alert_type"] for a in manager.get_alert_history(limit=1)] == ["ALERT_4"]
+
     def test_get_alert_stats(self):
         """Test getting alert statistics."""
         manager = AlertManager()
@@ -147,6 +163,32 @@ class TestAlertNotifier:
 
         assert handler_called
 
+    @pytest.mark.asyncio
+    async def test_send_notification_runs_handlers_concurrently(self):
+        """Test that handlers run together and one failure does not stop the rest."""
+        notifier = AlertNotifier()
+        both_started = asyncio.Event()
+        started = []
+        finished = []
+
+        async def waiting_handler(alert):
+            started.append(alert)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            finished.append(alert)
+
+        async def failing_handler(alert):
+            raise RuntimeError("handler down")
+
+        notifier.register_handler(waiting_handler)
+        notifier.register_handler(failing_handler)
+        notifier.register_handler(waiting_handler)
+
+        await notifier.send_notification({"alert_type": "TEST", "message": "Test alert"})
+
+        assert len(finished) == 2
+
     @pytest.mark.asyncio
     async def test_send_email_notification(self):
         """Test sending email notification."""
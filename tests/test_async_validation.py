@@ -1,6 +1,7 @@
 """Tests for async validation functionality."""
 
 import asyncio
+from unittest.mock import patch
 
 import pytest
 from mits_validator.async_validation import AsyncValidationEngine, get_async_validation_engine
@@ -14,7 +15,7 @@ class TestAsyncValidationEngine:
         """Test async validation engine initialization."""
         engine = AsyncValidationEngine(max_concurrent_validations=5)
         assert engine.max_concurrent_validations == 5
-        assert engine.semaphore._value == 5
+        assert engine.get_stats()["available_slots"] == 5
         assert len(engine.active_validations) == 0
 
     @pytest.mark.asyncio
@@ -98,6 +99,88 @@ class TestAsyncValidationEngine:
         assert "available_slots" in stats
         assert stats["max_concurrent_validations"] == 10
 
+    @pytest.mark.asyncio
+    async def test_raising_limit_admits_waiting_validation(self):
+        """Test that raising the limit lets a waiting validation start."""
+        engine = AsyncValidationEngine(max_concurrent_validations=1)
+        started = asyncio.Event()
+
+        async def second_validation():
+            async with engine._slot():
+                started.set()
+
+        async with engine._slot():
+            assert engine.get_stats()["available_slots"] == 0
+            waiter = asyncio.create_task(second_validation())
+            await asyncio.sleep(0)
+            assert not started.is_set()
+
+            await engine.set_max_concurrent_validations(2)
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+        await waiter
+        assert engine.get_stats()["available_slots"] == 2
+
+    @pytest.mark.asyncio
+    async def test_queued_validation_is_tracked_until_cancelled(self):
+        """Test that a validation waiting for a slot is tracked and can be cancelled."""
+        engine = AsyncValidationEngine(max_concurrent_validations=1)
+        request = ValidationRequest(
+            content=b'<?xml version="1.0"?><root/>',
+            content_type="application/xml",
+            source="file",
+        )
+
+        async with engine._slot():
+            task = asyncio.create_task(engine.validate_async(request, "queued", "default"))
+            await asyncio.sleep(0)
+            assert engine.get_active_validations() == ["queued"]
+
+            assert await engine.cancel_validation("queued")
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert engine.get_active_validations() == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_validation_frees_its_slot(self):
+        """Test that cancel_validation returns once the validation has released its slot."""
+        engine = AsyncValidationEngine(max_concurrent_validations=1)
+        request = ValidationRequest(
+            content=b'<?xml version="1.0"?><root/>',
+            content_type="application/xml",
+            source="file",
+        )
+        running = asyncio.Event()
+
+        async def blocked_levels(xml_doc, profile):
+            running.set()
+            await asyncio.Event().wait()
+
+        with patch.object(engine, "_run_validation_levels_async", blocked_levels):
+            task = asyncio.create_task(engine.validate_async(request, "running", "default"))
+            await asyncio.wait_for(running.wait(), timeout=1)
+            assert engine.get_stats()["available_slots"] == 0
+
+            assert await engine.cancel_validation("running")
+
+        assert task.done()
+        assert engine.get_stats()["available_slots"] == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_validation_is_no_longer_active(self):
+        """Test that a validation is removed from active validations when it finishes."""
+        engine = AsyncValidationEngine()
+        request = ValidationRequest(
+            content=b'<?xml version="1.0"?><root/>',
+            content_type="application/xml",
+            source="file",
+        )
+
+        await engine.validate_async(request, "finished", "default")
+
+        assert engine.get_active_validations() == []
+
 
 class TestGlobalFunctions:
     """Test global async validation functions."""
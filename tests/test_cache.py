@@ -1,11 +1,18 @@
 """Tests for caching functionality."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from lxml import etree
-from mits_validator.cache import CacheManager, SchemaCache, get_cache_manager, get_schema_cache
+from mits_validator.cache import (
+    CacheManager,
+    SchemaCache,
+    close_caches,
+    get_cache_manager,
+    get_schema_cache,
+)
 
 
 class TestCacheManager:
@@ -61,6 +68,59 @@ class TestCacheManager:
 
         await cache.close()
 
+    @pytest.mark.asyncio
+    async def test_memory_usage_tracks_overwrites_and_deletes(self):
+        """Test that overwriting or deleting an item releases its recorded size."""
+        cache = CacheManager()
+        await cache.initialize()
+
+        await cache.set("test", "key1", {"data": "value1"})
+        usage = cache.get_cache_stats()["memory_usage_mb"]
+
+        await cache.set("test", "key1", {"data": "value1"})
+        assert cache.get_cache_stats()["memory_usage_mb"] == usage
+
+        await cache.delete("test", "key1")
+        assert cache.get_cache_stats()["memory_usage_mb"] == 0
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_evicts_least_recently_used(self):
+        """Test that the memory cache evicts least recently used items until under its limit."""
+        cache = CacheManager(max_memory_mb=1)
+        await cache.initialize()
+        value = "x" * (400 * 1024)
+
+        await cache.set("test", "key1", value)
+        await cache.set("test", "key2", value)
+        await cache.get("test", "key1")
+        await cache.set("test", "key3", value)
+
+        assert await cache.get("test", "key2") is None
+        assert await cache.get("test", "key1") == value
+        assert await cache.get("test", "key3") == value
+
+        # An item larger than half the limit evicts both remaining items
+        await cache.set("test", "key4", "x" * (900 * 1024))
+        assert cache.get_cache_stats()["memory_items"] == 1
+        assert cache.get_cache_stats()["memory_usage_mb"] <= 1
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_set_many(self):
+        """Test setting several items at once."""
+        cache = CacheManager()
+        await cache.initialize()
+
+        await cache.set_many("test", {"key1": {"data": "value1"}, "key2": {"data": "value2"}})
+
+        assert await cache.get("test", "key1") == {"data": "value1"}
+        assert await cache.get("test", "key2") == {"data": "value2"}
+
+        await cache.close()
+
 
 class TestSchemaCache:
     """Test schema cache functionality."""
@@ -77,7 +137,7 @@ class TestSchemaCache:
         await cache_manager.close()
 
     @pytest.mark.asyncio
-    async def test_schema_key_generation(self):
+    async def test_schema_key_generation(self, tmp_path):
         """Test schema key generation."""
         cache_manager = CacheManager()
         await cache_manager.initialize()
@@ -85,28 +145,20 @@ class TestSchemaCache:
         schema_cache = SchemaCache(cache_manager)
 
         # Create a temporary file for testing
-        test_path = Path("test_schema.xsd")
+        test_path = tmp_path / "test_schema.xsd"
         test_path.write_text('<?xml version="1.0"?><schema></schema>')
 
-        try:
-            key1 = schema_cache._get_schema_key(test_path, "xsd")
-            key2 = schema_cache._get_schema_key(test_path, "xsd")
-
-            # Same file should generate same key
-            assert key1 == key2
+        key1 = schema_cache._get_schema_key(test_path, "xsd")
+        key2 = schema_cache._get_schema_key(test_path, "xsd")
 
-            # Different file should generate different key
-            test_path2 = Path("test_schema2.xsd")
-            test_path2.write_text('<?xml version="1.0"?><schema></schema>')
-            key3 = schema_cache._get_schema_key(test_path2, "xsd")
-            assert key1 != key3
+        # Same file should generate same key
+        assert key1 == key2
 
-        finally:
-            # Cleanup
-            if test_path.exists():
-                test_path.unlink()
-            if test_path2.exists():
-                test_path2.unlink()
+        # Different file should generate different key
+        test_path2 = tmp_path / "test_schema2.xsd"
+        test_path2.write_text('<?xml version="1.0"?><schema></schema>')
+        key3 = schema_cache._get_schema_key(test_path2, "xsd")
+        assert key1 != key3
 
         await cache_manager.close()
 
@@ -153,7 +205,8 @@ class TestSchemaCache:
             mock_redis.set.return_value = True
             mock_redis.delete.return_value = 1
             mock_redis.flushdb.return_value = True
-            mock_redis.scan_iter.return_value = []
+            mock_redis.scan_iter = MagicMock()
+            mock_redis.scan_iter.return_value.__aiter__.return_value = []
             mock_redis_class.return_value = mock_redis
 
             cache = CacheManager(redis_url="redis://localhost:6379")
@@ -171,6 +224,65 @@ class TestSchemaCache:
 
             await cache.close()
 
+    @pytest.mark.asyncio
+    async def test_clear_unlinks_scanned_keys_in_batches(self):
+        """Test that clearing a prefix scans for its keys and unlinks them in batches."""
+        with patch("redis.asyncio.from_url") as mock_redis_class:
+            mock_redis = AsyncMock()
+            mock_redis.ping.return_value = True
+            keys = [f"mits_validator:test:key{i}".encode() for i in range(5)]
+
+            async def scan_iter(**kwargs):
+                for key in keys:
+                    yield key
+
+            mock_redis.scan_iter = MagicMock(side_effect=scan_iter)
+            mock_redis_class.return_value = mock_redis
+
+            cache = CacheManager(redis_url="redis://localhost:6379")
+            await cache.initialize()
+
+            with patch("mits_validator.cache._UNLINK_BATCH", 2):
+                await cache.clear("test")
+
+            mock_redis.scan_iter.assert_called_once_with(match="mits_validator:test:*", count=500)
+            assert [c.args for c in mock_redis.unlink.await_args_list] == [
+                tuple(keys[0:2]),
+                tuple(keys[2:4]),
+                tuple(keys[4:5]),
+            ]
+            assert not mock_redis.keys.called
+
+            await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_set_many_uses_one_redis_pipeline(self):
+        """Test that set_many queues every write on one pipeline."""
+        with patch("redis.asyncio.from_url") as mock_redis_class:
+            mock_redis = AsyncMock()
+            mock_redis.ping.return_value = True
+            pipe = MagicMock()
+            pipe.execute = AsyncMock(return_value=[True, True])
+            mock_redis.pipeline = MagicMock(return_value=pipe)
+            pipe.__aenter__.return_value = pipe
+            mock_redis_class.return_value = mock_redis
+
+            cache = CacheManager(redis_url="redis://localhost:6379")
+            await cache.initialize()
+
+            await cache.set_many("test", {"key1": 1, "key2": 2}, ttl=60)
+
+            mock_redis.pipeline.assert_called_once_with(transaction=False)
+            assert [c.args for c in pipe.setex.call_args_list] == [
+                ("mits_validator:test:key1", 60, b"1"),
+                ("mits_validator:test:key2", 60, b"2"),
+            ]
+            pipe.execute.assert_awaited_once()
+            assert not mock_redis.setex.called
+            assert cache.get_cache_stats()["memory_items"] == 0
+
+            await cache.close()
+
     @pytest.mark.asyncio
     async def test_redis_operation_failures(self):
         """Test Redis operation failures."""
@@ -224,67 +336,103 @@ class TestSchemaCache:
         assert schema_cache.cache is cache_manager
 
     @pytest.mark.asyncio
-    async def test_xsd_schema_caching(self):
+    async def test_concurrent_first_calls_share_cache_manager(self):
+        """Test that concurrent first calls create a single cache manager."""
+        await close_caches()
+
+        managers = await asyncio.gather(*(get_cache_manager() for _ in range(5)))
+
+        assert all(manager is managers[0] for manager in managers)
+
+    def test_first_calls_contend_safely_on_each_event_loop(self):
+        """Test that contended first calls work under more than one event loop."""
+
+        async def slow_initialize(self):
+            await asyncio.sleep(0)
+
+        async def first_calls():
+            await close_caches()
+            managers = await asyncio.gather(*(get_cache_manager() for _ in range(5)))
+            assert all(manager is managers[0] for manager in managers)
+
+        with patch.object(CacheManager, "initialize", slow_initialize):
+            asyncio.run(first_calls())
+            asyncio.run(first_calls())
+
+    @pytest.mark.asyncio
+    async def test_xsd_schema_caching(self, tmp_path):
         """Test XSD schema caching."""
         cache_manager = CacheManager()
         await cache_manager.initialize()
         schema_cache = SchemaCache(cache_manager)
 
         # Create a temporary XSD file
-        test_path = Path("test_schema.xsd")
+        test_path = tmp_path / "test_schema.xsd"
         test_path.write_text(
             '<?xml version="1.0"?><xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
             '<xs:element name="test"/></xs:schema>'
         )
 
-        try:
-            # Parse schema
-            schema_doc = etree.parse(str(test_path))
-            schema = etree.XMLSchema(schema_doc)
+        # Parse schema
+        schema_doc = etree.parse(str(test_path))
+        schema = etree.XMLSchema(schema_doc)
+
+        # Cache schema
+        await schema_cache.set_xsd_schema(test_path, schema)
+
+        # Retrieve from cache
+        cached_schema = await schema_cache.get_xsd_schema(test_path)
+        assert cached_schema is schema
 
-            # Cache schema
-            await schema_cache.set_xsd_schema(test_path, schema)
+        # Another schema cache re-parses the stored source once, then reuses it
+        other_cache = SchemaCache(cache_manager)
+        reparsed = await other_cache.get_xsd_schema(test_path)
+        assert reparsed is not None and reparsed is not schema
+        assert await other_cache.get_xsd_schema(test_path) is reparsed
 
-            # Retrieve from cache
-            cached_schema = await schema_cache.get_xsd_schema(test_path)
-            assert cached_schema is not None
+        # Concurrent misses share a single re-parse, even when the store yields
+        third_cache = SchemaCache(cache_manager)
+        memory_get = cache_manager.get
 
-        finally:
-            if test_path.exists():
-                test_path.unlink()
-            await cache_manager.close()
+        async def slow_get(prefix, key):
+            await asyncio.sleep(0)
+            return await memory_get(prefix, key)
+
+        with patch.object(cache_manager, "get", slow_get):
+            schemas = await asyncio.gather(
+                *(third_cache.get_xsd_schema(test_path) for _ in range(3))
+            )
+        assert all(s is schemas[0] for s in schemas)
+
+        await cache_manager.close()
 
     @pytest.mark.asyncio
-    async def test_schematron_rules_caching(self):
+    async def test_schematron_rules_caching(self, tmp_path):
         """Test Schematron rules caching."""
         cache_manager = CacheManager()
         await cache_manager.initialize()
         schema_cache = SchemaCache(cache_manager)
 
         # Create a temporary Schematron file
-        test_path = Path("test_rules.sch")
+        test_path = tmp_path / "test_rules.sch"
         test_path.write_text(
             '<?xml version="1.0"?><xsl:stylesheet xmlns:xsl="http://www.w3.org/1999/XSL/Transform" '
             'version="1.0"><xsl:template match="/"><xsl:value-of select="."/></xsl:template>'
             "</xsl:stylesheet>"
         )
 
-        try:
-            # Parse and compile rules
-            rules_doc = etree.parse(str(test_path))
-            xslt = etree.XSLT(rules_doc)
+        # Parse and compile rules
+        rules_doc = etree.parse(str(test_path))
+        xslt = etree.XSLT(rules_doc)
 
-            # Cache rules
-            await schema_cache.set_schematron_rules(test_path, xslt)
+        # Cache rules
+        await schema_cache.set_schematron_rules(test_path, xslt)
 
-            # Retrieve from cache
-            cached_rules = await schema_cache.get_schematron_rules(test_path)
-            assert cached_rules is not None
+        # Retrieve from cache
+        cached_rules = await schema_cache.get_schematron_rules(test_path)
+        assert cached_rules is not None
 
-        finally:
-            if test_path.exists():
-                test_path.unlink()
-            await cache_manager.close()
+        await cache_manager.close()
 
     @pytest.mark.asyncio
     async def test_schema_cache_missing_file(self):
@@ -304,26 +452,22 @@ class TestSchemaCache:
         await cache_manager.close()
 
     @pytest.mark.asyncio
-    async def test_schema_cache_corrupted_data(self):
+    async def test_schema_cache_corrupted_data(self, tmp_path):
         """Test schema cache with corrupted cached data."""
         cache_manager = CacheManager()
         await cache_manager.initialize()
         schema_cache = SchemaCache(cache_manager)
 
         # Manually set corrupted data in cache
-        test_path = Path("test_schema.xsd")
+        test_path = tmp_path / "test_schema.xsd"
         test_path.write_text('<?xml version="1.0"?><schema></schema>')
 
-        try:
-            # Set corrupted data directly in memory cache
-            cache_key = schema_cache._get_schema_key(test_path, "xsd")
-            cache_manager._memory_cache[f"xsd_schema:{cache_key}"] = {"schema_xml": "invalid xml"}
-
-            # Try to get schema - should return None due to corruption
-            cached_schema = await schema_cache.get_xsd_schema(test_path)
-            assert cached_schema is None
-
-        finally:
-            if test_path.exists():
-                test_path.unlink()
-            await cache_manager.close()
+        # Set corrupted data directly in memory cache
+        cache_key = schema_cache._get_schema_key(test_path, "xsd")
+        cache_manager._memory_cache[f"xsd_schema:{cache_key}"] = {"schema_xml": "invalid xml"}
+
+        # Try to get schema - should return None due to corruption
+        cached_schema = await schema_cache.get_xsd_schema(test_path)
+        assert cached_schema is None
+
+        await cache_manager.close()
@@ -1,8 +1,13 @@
 """Tests for catalog loader functionality."""
 
 import json
+import os
 from pathlib import Path
 
+import pytest
+from jsonschema import Draft202012Validator
+
+from mits_validator import catalogs
 from mits_validator.catalog_loader import CatalogLoader, CatalogRegistry
 from mits_validator.models import FindingLevel
 
@@ -225,6 +230,72 @@ class TestCatalogLoader:
         assert len(error_findings) > 0
         assert any("CATALOG:SCHEMA_VALIDATION_ERROR" in f.code for f in error_findings)
 
+    def test_schema_validator_shared_between_loaders(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that loaders reuse the validator compiled for each schema."""
+        built = []
+
+        def counting_validator(schema):
+            built.append(schema)
+            return Draft202012Validator(schema)
+
+        monkeypatch.setattr(catalogs, "Draft202012Validator", counting_validator)
+        rules_dir = tmp_path / "rules"
+        version_dir = rules_dir / "mits-5.0"
+        enums_dir = version_dir / "catalogs" / "enums"
+        schemas_dir = version_dir / "schemas"
+        enums_dir.mkdir(parents=True)
+        schemas_dir.mkdir(parents=True)
+
+        for name in ("charge-requirement", "refundability"):
+            with open(enums_dir / f"{name}.json", "w") as f:
+                json.dump([{"code": "A", "name": "A"}, {"code": 1}], f)
+        with open(schemas_dir / "enum.schema.json", "w") as f:
+            json.dump({"type": "array", "items": {"required": ["code", "name"]}}, f)
+
+        _, findings = CatalogLoader(rules_dir).load_catalogs("mits-5.0")
+        _, findings_again = CatalogLoader(rules_dir).load_catalogs("mits-5.0")
+
+        assert len(built) == 1
+        for result in (findings, findings_again):
+            codes = [f.code for f in result if f.level == FindingLevel.ERROR]
+            assert codes.count("CATALOG:SCHEMA_VALIDATION_ERROR") == 2
+
+    def test_catalogs_schema_validator_rebuilt_only_when_schema_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that mits_validator.catalogs recompiles a schema only after it is edited."""
+        built = []
+
+        def counting_validator(schema):
+            built.append(schema)
+            return Draft202012Validator(schema)
+
+        monkeypatch.setattr(catalogs, "Draft202012Validator", counting_validator)
+        rules_dir = tmp_path / "rules"
+        version_dir = rules_dir / "mits-5.0"
+        catalog_file = version_dir / "catalogs" / "charge-classes.json"
+        schema_file = version_dir / "schemas" / "charge-classes.schema.json"
+        catalog_file.parent.mkdir(parents=True)
+        schema_file.parent.mkdir(parents=True)
+        catalog_file.write_text(json.dumps([{"code": "RENT", "name": "Rent"}]))
+        schema_file.write_text(json.dumps({"type": "array"}))
+
+        catalogs.CatalogLoader(rules_dir).load_catalogs("mits-5.0")
+        # A changed catalog is reloaded against the already compiled schema
+        os.utime(catalog_file, ns=(1, 1))
+        registry, _ = catalogs.CatalogLoader(rules_dir).load_catalogs("mits-5.0")
+        assert len(built) == 1
+        assert "RENT" in registry.charge_classes
+
+        schema_file.write_text(json.dumps({"type": "array", "maxItems": 0}))
+        os.utime(schema_file, ns=(2, 2))
+        _, findings = catalogs.CatalogLoader(rules_dir).load_catalogs("mits-5.0")
+        assert len(built) == 2
+        assert built[-1]["maxItems"] == 0
+        assert any(f.code == "CATALOG:SCHEMA_VALIDATION_ERROR" for f in findings)
+
     def test_get_catalog_loader_singleton(self) -> None:
         """Test that get_catalog_loader returns a singleton."""
         from mits_validator.catalog_loader import get_catalog_loader
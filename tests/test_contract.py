@@ -82,7 +82,7 @@ class TestResultEnvelopeContract:
         assert response_data["api_version"] == "1.0"
         assert response_data["summary"]["valid"] is False
         assert response_data["summary"]["errors"] >= 1
-        assert any(f["code"] == "INTAKE:BOTH_INPUTS" for f in response_data["findings"])
+        assert "INTAKE:BOTH_INPUTS" in {f["code"] for f in response_data["findings"]}
 
     def test_oversize_error_schema(self):
         """Test that oversize file errors conform to the schema."""
@@ -115,7 +115,7 @@ class TestResultEnvelopeContract:
         assert response_data["api_version"] == "1.0"
         assert response_data["summary"]["valid"] is False
         assert response_data["summary"]["errors"] >= 1
-        assert any(f["code"] == "INTAKE:UNSUPPORTED_MEDIA_TYPE" for f in response_data["findings"])
+        assert "INTAKE:UNSUPPORTED_MEDIA_TYPE" in {f["code"] for f in response_data["findings"]}
 
     def test_schema_field_types(self):
         """Test that all required fields have correct types."""
@@ -6,6 +6,16 @@ from pathlib import Path
 from mits_validator.levels.schematron import SchematronValidator
 from mits_validator.models import FindingLevel
 
+MINIMAL_RULES = """<?xml version="1.0"?>
+<schema xmlns="http://purl.oclc.org/dsdl/schematron">
+  <pattern>
+    <rule context="/root">
+      <assert test="test">root must contain a test element</assert>
+    </rule>
+  </pattern>
+</schema>
+"""
+
 
 class TestSchematronValidator:
     """Test Schematron validation level."""
@@ -45,8 +55,8 @@ class TestSchematronValidator:
             rules_dir = Path(temp_dir) / "rules" / "mits-5.0" / "schematron"
             rules_dir.mkdir(parents=True)
 
-            # Create a dummy .sch file
-            (rules_dir / "rules.sch").write_text('<?xml version="1.0"?><schema></schema>')
+            # Create a minimal .sch file
+            (rules_dir / "rules.sch").write_text(MINIMAL_RULES)
 
             validator = SchematronValidator(Path(temp_dir) / "rules", "mits-5.0")
             result = validator.validate(b'<?xml version="1.0"?><root><test>content</test></root>')
@@ -60,8 +70,8 @@ class TestSchematronValidator:
             rules_dir = Path(temp_dir) / "rules" / "mits-5.0" / "schematron"
             rules_dir.mkdir(parents=True)
 
-            # Create a dummy .sch file
-            (rules_dir / "rules.sch").write_text('<?xml version="1.0"?><schema></schema>')
+            # Create a minimal .sch file
+            (rules_dir / "rules.sch").write_text(MINIMAL_RULES)
 
             validator = SchematronValidator(Path(temp_dir) / "rules", "mits-5.0")
             result = validator.validate(b"<invalid xml content")
@@ -72,6 +82,37 @@ class TestSchematronValidator:
             assert result.findings[0].level == FindingLevel.ERROR
             assert "XML parsing failed" in result.findings[0].message
 
+    def test_rule_failure_reported(self):
+        """Test that failed asserts from compiled rules become findings."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_dir = Path(temp_dir) / "rules" / "mits-5.0" / "schematron"
+            rules_dir.mkdir(parents=True)
+            (rules_dir / "rules.sch").write_text(MINIMAL_RULES)
+
+            validator = SchematronValidator(Path(temp_dir) / "rules", "mits-5.0")
+            result = validator.validate(b'<?xml version="1.0"?><root><other/></root>')
+
+            assert len(result.findings) == 1
+            assert result.findings[0].level == FindingLevel.ERROR
+            assert result.findings[0].code == "SCHEMATRON:RULE_FAILURE"
+
+    def test_rules_load_failure_reported_on_each_validation(self):
+        """Test that rules that fail to compile are reported afresh on every validation."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_dir = Path(temp_dir) / "rules" / "mits-5.0" / "schematron"
+            rules_dir.mkdir(parents=True)
+            (rules_dir / "rules.sch").write_text("<schema")
+
+            validator = SchematronValidator(Path(temp_dir) / "rules", "mits-5.0")
+            first = validator.validate(b"<root/>")
+            second = validator.validate(b"<root/>")
+
+            for result in (first, second):
+                assert [f.code for f in result.findings] == ["ENGINE:LEVEL_CRASH"]
+                assert "Failed to load Schematron rules" in result.findings[0].message
+            assert first.findings[0] is not second.findings[0]
+            assert isinstance(validator._load_error, str)
+
     def test_resource_load_failure(self):
         """Test behavior when resource loading fails."""
         # Use a non-existent directory to trigger resource load failure
@@ -21,16 +21,12 @@ class TestSemanticValidator:
 
         assert result.level == "Semantic"
         assert len(result.findings) >= 1
-        assert any(
-            finding.code
-            in [
-                "CATALOG:VERSION_NOT_FOUND",
-                "ENGINE:RESOURCE_LOAD_FAILED",
-                "CATALOG:FILE_MISSING",
-                "CATALOG:DIRECTORY_MISSING",
-            ]
-            for finding in result.findings
-        )
+        assert {finding.code for finding in result.findings} & {
+            "CATALOG:VERSION_NOT_FOUND",
+            "ENGINE:RESOURCE_LOAD_FAILED",
+            "CATALOG:FILE_MISSING",
+            "CATALOG:DIRECTORY_MISSING",
+        }
         assert all(
             finding.level in [FindingLevel.WARNING, FindingLevel.INFO, FindingLevel.ERROR]
             for finding in result.findings
@@ -124,3 +120,27 @@ class TestSemanticValidator:
 
         assert result.duration_ms >= 0
         assert isinstance(result.duration_ms, int)
+
+    def test_catalogs_shared_until_changed(self):
+        """Test that validators for the same rules share one catalog load until a file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalogs_dir = Path(temp_dir) / "rules" / "mits-5.0" / "catalogs"
+            catalogs_dir.mkdir(parents=True)
+            charge_classes = catalogs_dir / "charge-classes.json"
+            charge_classes.write_text('[{"code": "RENT", "name": "Rent"}]')
+
+            first = SemanticValidator(Path(temp_dir) / "rules", "mits-5.0")
+            first.validate(b"<root/>")
+            second = SemanticValidator(Path(temp_dir) / "rules", "mits-5.0")
+            second.validate(b"<root/>")
+            assert second._catalog_registry is first._catalog_registry
+
+            # Replace the catalog with a newer file
+            updated = catalogs_dir / "charge-classes.json.new"
+            updated.write_text('[{"code": "PARKING", "name": "Parking"}]')
+            updated.replace(charge_classes)
+
+            third = SemanticValidator(Path(temp_dir) / "rules", "mits-5.0")
+            third.validate(b"<root/>")
+            assert third._catalog_registry is not first._catalog_registry
+            assert list(third._catalog_registry.charge_classes) == ["PARKING"]
@@ -1,6 +1,10 @@
 """Tests for streaming XML parser functionality."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from lxml import etree
 from mits_validator.streaming_parser import MemoryOptimizedValidator, StreamingXMLParser
 
 
@@ -53,6 +57,32 @@ class TestStreamingXMLParser:
 
         assert isinstance(findings, list)
 
+    def test_shared_schema_keeps_each_threads_errors(self):
+        """Test that threads streaming with one schema only see their own element errors."""
+        schema = etree.XMLSchema(
+            etree.fromstring(
+                b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                b'<xs:element name="root"/></xs:schema>'
+            )
+        )
+
+        def run(name):
+            parser = StreamingXMLParser()
+            content = f"<root>{f'<{name}/>' * 20}</root>"
+            for _ in range(200):
+                findings = asyncio.run(parser.validate_streaming(content, xsd_schema=schema))
+                element_errors = [f for f in findings if "'root'" not in f["message"]]
+                if len(element_errors) != 20 or not all(
+                    f"'{name}'" in f["message"] for f in element_errors
+                ):
+                    return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run, [f"item{i}" for i in range(8)]))
+
+        assert all(results)
+
     def test_get_memory_usage(self):
         """Test getting memory usage."""
         parser = StreamingXMLParser()
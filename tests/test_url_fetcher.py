@@ -1,5 +1,6 @@
 """Tests for URL fetcher functionality."""
 
+import socket
 from unittest.mock import patch
 
 import httpx
@@ -82,8 +83,11 @@ class TestURLFetcher:
         """Test URL fetching with DNS error."""
         fetcher = URLFetcher(timeout=5.0, max_size=1024)
 
+        dns_error = httpx.ConnectError("[Errno -2] Name or service not known")
+        dns_error.__cause__ = socket.gaierror(-2, "Name or service not known")
+
         with patch("httpx.stream") as mock_stream:
-            mock_stream.side_effect = httpx.ConnectError("Name or service not known")
+            mock_stream.side_effect = dns_error
 
             content, findings = fetcher.fetch("http://nonexistent.invalid/test.xml")
 
@@ -92,6 +96,22 @@ class TestURLFetcher:
             assert findings[0].code == "NETWORK:DNS_ERROR"
             assert findings[0].level == FindingLevel.ERROR
 
+    def test_fetch_dns_error_wrapped_by_transport(self) -> None:
+        """Test that DNS errors are detected through chained transport exceptions."""
+        fetcher = URLFetcher(timeout=5.0, max_size=1024)
+
+        transport_error = OSError("transport failure")
+        transport_error.__cause__ = socket.gaierror(-3, "Temporary failure in name resolution")
+        dns_error = httpx.ConnectError("Connection failed")
+        dns_error.__cause__ = transport_error
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.side_effect = dns_error
+
+            _, findings = fetcher.fetch("http://nonexistent.invalid/test.xml")
+
+            assert findings[0].code == "NETWORK:DNS_ERROR"
+
     def test_fetch_request_error(self) -> None:
         """Test URL fetching with request error."""
         fetcher = URLFetcher(timeout=5.0, max_size=1024)
@@ -155,11 +175,11 @@ class TestURLFetcher:
         fetcher = URLFetcher(timeout=5.0, max_size=10)  # Very small limit
 
         with patch("httpx.stream") as mock_stream:
-            # Mock response with large content
+            # Mock chunked response with large content (no Content-Length)
             mock_response = httpx.Response(
                 200,
                 headers={"content-type": "application/xml"},
-                content=b"x" * 20,  # Exceeds 10 byte limit
+                content=iter([b"x" * 20]),  # Exceeds 10 byte limit
             )
             mock_stream.return_value.__enter__.return_value = mock_response
             mock_stream.return_value.__exit__.return_value = None
@@ -171,6 +191,26 @@ class TestURLFetcher:
             assert findings[0].code == "NETWORK:TOO_LARGE_DURING_STREAM"
             assert findings[0].level == FindingLevel.ERROR
 
+    def test_fetch_content_length_exceeded(self) -> None:
+        """Test that an oversized Content-Length is rejected before streaming."""
+        fetcher = URLFetcher(timeout=5.0, max_size=10)
+
+        with patch("httpx.stream") as mock_stream:
+            mock_response = httpx.Response(
+                200,
+                headers={"content-type": "application/xml"},
+                content=b"x" * 20,  # Content-Length: 20
+            )
+            mock_stream.return_value.__enter__.return_value = mock_response
+            mock_stream.return_value.__exit__.return_value = None
+
+            content, findings = fetcher.fetch("http://example.com/large.xml")
+
+            assert content == b""
+            assert len(findings) == 1
+            assert findings[0].code == "NETWORK:TOO_LARGE"
+            assert findings[0].level == FindingLevel.ERROR
+
     def test_fetch_unexpected_error(self) -> None:
         """Test URL fetching with unexpected error."""
         fetcher = URLFetcher(timeout=5.0, max_size=1024)
@@ -187,6 +227,78 @@ class TestURLFetcher:
             assert findings[0].code == "NETWORK:FETCH_ERROR"
             assert findings[0].level == FindingLevel.ERROR
 
+    def test_fetch_revalidates_cached_response(self) -> None:
+        """Test that a 304 response reuses the cached feed content."""
+        fetcher = URLFetcher(timeout=5.0, max_size=1024)
+        body = b"<?xml version='1.0'?><root>test</root>"
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.return_value.__enter__.side_effect = [
+                httpx.Response(
+                    200,
+                    headers={"content-type": "application/xml", "etag": '"v1"'},
+                    content=body,
+                ),
+                httpx.Response(304, headers={"etag": '"v1"'}),
+            ]
+
+            first_content, _ = fetcher.fetch("http://example.com/feed.xml")
+            content, findings = fetcher.fetch("http://example.com/feed.xml")
+
+            assert first_content == body
+            assert content == body
+            assert findings == []
+            request_headers = mock_stream.call_args_list[1].kwargs["headers"]
+            assert request_headers["If-None-Match"] == '"v1"'
+
+    def test_fetch_cache_is_bounded(self) -> None:
+        """Test that the response cache evicts the least recently used URL."""
+        fetcher = URLFetcher(timeout=5.0, max_size=1024, cache_max_bytes=4)
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.return_value.__enter__.side_effect = [
+                httpx.Response(
+                    200,
+                    headers={"content-type": "application/xml", "last-modified": "Mon"},
+                    content=b"<a/>",
+                ),
+                httpx.Response(
+                    200,
+                    headers={"content-type": "application/xml", "last-modified": "Tue"},
+                    content=b"<b/>",
+                ),
+            ]
+
+            fetcher.fetch("http://example.com/a.xml")
+            fetcher.fetch("http://example.com/b.xml")
+
+            assert list(fetcher._cache) == ["http://example.com/b.xml"]
+
+    def test_fetch_cache_skips_bodies_over_budget(self) -> None:
+        """Test that a body larger than the whole cache budget is not cached."""
+        fetcher = URLFetcher(timeout=5.0, max_size=1024, cache_max_bytes=8)
+
+        with patch("httpx.stream") as mock_stream:
+            mock_stream.return_value.__enter__.side_effect = [
+                httpx.Response(
+                    200,
+                    headers={"content-type": "application/xml", "etag": '"a"'},
+                    content=b"<a/>",
+                ),
+                httpx.Response(
+                    200,
+                    headers={"content-type": "application/xml", "etag": '"big"'},
+                    content=b"<big></big>",
+                ),
+            ]
+
+            fetcher.fetch("http://example.com/a.xml")
+            content, _ = fetcher.fetch("http://example.com/big.xml")
+
+            assert content == b"<big></big>"
+            assert list(fetcher._cache) == ["http://example.com/a.xml"]
+            assert fetcher._cache_bytes == 4
+
     def test_get_url_fetcher_singleton(self) -> None:
         """Test that get_url_fetcher returns a singleton."""
         fetcher1 = get_url_fetcher()
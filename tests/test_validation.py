@@ -122,7 +122,7 @@ def test_validate_url_intake() -> None:
     if response.status_code == 200:
         assert result["findings"][0]["code"] == "URL:INTAKE_ACKNOWLEDGED"
     else:
-        assert any(f["code"] == "NETWORK:FETCH_ERROR" for f in result["findings"])
+        assert "NETWORK:FETCH_ERROR" in {f["code"] for f in result["findings"]}
 
 
 def test_validate_invalid_url_format() -> None:
@@ -202,6 +202,21 @@ def test_validate_content_type_warning() -> None:
     assert "may not be XML" in content_type_warning["message"]
 
 
+def test_validate_async_file() -> None:
+    """Test async validation returns the ValidationResponse shape."""
+    files = {"file": ("test.xml", b"<root>test</root>", "application/xml")}
+
+    response = client.post("/v1/validate/async", files=files)
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["api_version"] == "1.0"
+    assert result["summary"]["valid"] is True
+    assert result["summary"]["errors"] == 0
+    assert result["metadata"]["profile"] == "default"
+    assert result["metadata"]["validation_id"].startswith("async_")
+
+
 def test_response_headers() -> None:
     """Test response includes proper headers."""
     test_content = b"<root>test</root>"
@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+from mits_validator.models import FindingLevel, ValidationResult
 from mits_validator.validation_engine import ValidationEngine
 
 
@@ -257,3 +258,229 @@ class TestValidationEngineIntegration:
             # Should fall back to default
             assert profile_info["name"] == "default"
             assert profile_info["levels"] == ["WellFormed", "XSD"]
+
+    def test_results_follow_requested_level_order(self):
+        """Test that concurrently executed levels are reported in request order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = ValidationEngine(rules_dir=Path(temp_dir) / "rules")
+            levels = ["Semantic", "Schematron", "XSD", "WellFormed", "Unknown"]
+            results = engine.validate(b"<root/>", levels=levels)
+
+            assert [result.level for result in results] == levels
+            assert results[-1].findings[0].code == "ENGINE:RULES_MISSING"
+
+    def test_level_crash_is_reported_as_finding(self):
+        """Test that an exception raised in a worker thread becomes a finding."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = ValidationEngine(rules_dir=Path(temp_dir) / "rules")
+
+            class CrashingLevel:
+                def validate(self, content, xml_doc=None):
+                    raise RuntimeError("boom")
+
+                def get_name(self):
+                    return "XSD"
+
+            engine._levels["XSD"] = CrashingLevel()
+            results = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+
+            assert [result.level for result in results] == ["WellFormed", "XSD"]
+            assert results[1].findings[0].code == "ENGINE:LEVEL_CRASH"
+            assert "boom" in results[1].findings[0].message
+
+    def test_unparseable_document_stops_after_wellformed(self):
+        """Test that later levels are skipped when the document does not parse."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = ValidationEngine(rules_dir=Path(temp_dir) / "rules")
+            results = engine.validate(b"<root><unclosed>", levels=["WellFormed", "XSD"])
+
+            assert [result.level for result in results] == ["WellFormed"]
+            assert results[0].findings[0].code == "WELLFORMED:PARSE_ERROR"
+
+    def test_unparseable_document_reported_under_requested_level(self):
+        """Test that a parse error is reported only under levels the caller requested."""
+        engine = ValidationEngine()
+
+        for levels in (["XSD"], ["Semantic"], ["Schematron", "XSD"]):
+            results = engine.validate(b"<root><unclosed>", levels=levels)
+
+            assert [result.level for result in results] == levels[:1]
+            assert results[0].findings[0].code == "WELLFORMED:PARSE_ERROR"
+
+    def test_engines_share_one_level_pool(self):
+        """Test that engines run levels on one shared pool rather than one pool each."""
+        import threading
+
+        from mits_validator.validation_engine import _level_pool
+
+        for _ in range(20):
+            ValidationEngine().validate(b"<root/>", levels=["XSD", "Schematron"])
+
+        # One worker per level other than WellFormed, which runs inline
+        assert _level_pool()._max_workers == 3
+        workers = [t for t in threading.enumerate() if t.name.startswith("mits-level")]
+        assert len(workers) <= 3
+
+    def test_levels_share_parsed_tree(self):
+        """Test that every level receives the tree parsed by the engine."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = ValidationEngine(rules_dir=Path(temp_dir) / "rules")
+            seen = []
+
+            class RecordingLevel:
+                def validate(self, content, xml_doc=None):
+                    seen.append(xml_doc)
+                    return ValidationResult(level="XSD", findings=[], duration_ms=0)
+
+                def get_name(self):
+                    return "XSD"
+
+            engine._levels["XSD"] = RecordingLevel()
+            engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+
+            assert len(seen) == 1
+            assert seen[0].tag == "root"
+
+    def test_stop_on_error_skips_rule_levels_after_xsd_error(self):
+        """Test that stop_on_error profiles skip Schematron and Semantic after XSD errors."""
+        import yaml
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiles_dir = Path(temp_dir) / "rules" / "mits-5.0" / "profiles"
+            profiles_dir.mkdir(parents=True)
+            levels = ["WellFormed", "XSD", "Schematron", "Semantic"]
+
+            for name, stop_on_error in (("strict", True), ("lenient", False)):
+                profile_data = {
+                    "name": name,
+                    "description": "Missing schema is an error",
+                    "enabled_levels": levels,
+                    "severity_overrides": {"XSD:SCHEMA_MISSING": "error"},
+                    "stop_on_error": stop_on_error,
+                }
+                with open(profiles_dir / f"{name}.yaml", "w") as f:
+                    yaml.dump(profile_data, f)
+
+            strict = ValidationEngine(profile="strict", rules_dir=Path(temp_dir) / "rules")
+            results = strict.validate(b"<root/>")
+            assert [result.level for result in results] == levels
+            for result in results[2:]:
+                assert [finding.code for finding in result.findings] == ["ENGINE:LEVEL_SKIPPED"]
+                assert result.findings[0].level == FindingLevel.INFO
+
+            lenient = ValidationEngine(profile="lenient", rules_dir=Path(temp_dir) / "rules")
+            results = lenient.validate(b"<root/>")
+            assert [result.level for result in results] == levels
+
+    def test_semantic_only_requests_are_streamed(self):
+        """Test that Semantic runs over a streaming parse when no tree levels are requested."""
+        engine = ValidationEngine()
+        semantic = engine._levels["Semantic"]
+        calls = []
+        original = semantic.validate_stream
+
+        def recording_validate_stream(content):
+            calls.append(content)
+            return original(content)
+
+        semantic.validate_stream = recording_validate_stream
+
+        results = engine.validate(b"<root/>", levels=["WellFormed", "Semantic"])
+        assert [result.level for result in results] == ["WellFormed", "Semantic"]
+        assert len(calls) == 1
+
+        results = engine.validate(b"<root><unclosed>", levels=["WellFormed", "Semantic"])
+        assert [result.level for result in results] == ["WellFormed"]
+        assert results[0].findings[0].code == "WELLFORMED:PARSE_ERROR"
+
+    def test_envelope_uses_supplied_request_id_and_time(self):
+        """Test that build_v1_envelope reuses a caller's request id and timestamp."""
+        from mits_validator.models import ValidationRequest
+        from mits_validator.validation_engine import build_v1_envelope
+
+        request = ValidationRequest(
+            content=b"<root/>",
+            content_type="application/xml",
+            source="file",
+            url=None,
+            filename="test.xml",
+            size_bytes=7,
+        )
+        envelope = build_v1_envelope(request, [], request_id="req-1", now=0.0)
+
+        assert envelope["metadata"]["request_id"] == "req-1"
+        assert envelope["metadata"]["timestamp"] == "1970-01-01T00:00:00+00:00"
+
+    def test_envelope_engine_versions_are_a_copy(self):
+        """Test that editing one envelope's engine versions leaves the next envelope alone."""
+        from mits_validator.models import ValidationRequest
+        from mits_validator.validation_engine import ENGINE_VERSIONS, build_v1_envelope
+
+        request = ValidationRequest(
+            content=b"<root/>",
+            content_type="application/xml",
+            source="file",
+            url=None,
+            filename="test.xml",
+            size_bytes=7,
+        )
+        envelope = build_v1_envelope(request, [])
+        envelope["metadata"]["engine"]["lxml"] = "changed"
+
+        assert ENGINE_VERSIONS["lxml"] != "changed"
+        assert build_v1_envelope(request, [])["metadata"]["engine"] == ENGINE_VERSIONS
+
+    def test_get_engine_reuses_engine_per_profile(self):
+        """Test that get_engine builds each profile's engine once."""
+        from mits_validator.validation_engine import get_engine
+
+        assert get_engine() is get_engine("default")
+        assert get_engine("performance") is get_engine("performance")
+        assert get_engine("performance") is not get_engine("default")
+
+    def test_cached_engine_reuses_results_for_repeated_content(self):
+        """Test that cache=True engines only validate a repeated payload once."""
+        engine = ValidationEngine(cache=True)
+        calls = []
+        original = engine._wellformed.check
+
+        def recording_check(content, content_type):
+            calls.append(content)
+            return original(content, content_type)
+
+        engine._wellformed.check = recording_check
+
+        first = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        second = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        assert second == first
+        assert len(calls) == 1
+
+        # Different content or levels are validated again
+        engine.validate(b"<other/>", levels=["WellFormed", "XSD"])
+        engine.validate(b"<root/>", levels=["WellFormed"])
+        assert len(calls) == 3
+
+        # Engines are uncached unless asked
+        engine = ValidationEngine()
+        engine._wellformed.check = recording_check
+        engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        assert len(calls) == 5
+
+    def test_cached_results_are_not_shared_between_callers(self):
+        """Test that changing returned findings does not change later cached results."""
+        from mits_validator.models import Finding
+
+        engine = ValidationEngine(cache=True)
+        extra = Finding(level=FindingLevel.INFO, code="TEST:EXTRA", message="", rule_ref="")
+
+        first = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        expected = [list(result.findings) for result in first]
+        first[0].findings.append(extra)
+
+        second = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        assert [result.findings for result in second] == expected
+        second[1].findings.append(extra)
+
+        third = engine.validate(b"<root/>", levels=["WellFormed", "XSD"])
+        assert [result.findings for result in third] == expected
@@ -1,9 +1,12 @@
 """Tests for XSD validation level."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from mits_validator.levels.xsd import XSDValidator
 from mits_validator.models import FindingLevel
+from mits_validator.validation.xsd import load_schema, schema_lock
 
 
 class TestXSDValidator:
@@ -52,6 +55,23 @@ class TestXSDValidator:
         assert len(result.findings) == 0  # Should have no findings for valid XML
         assert result.duration_ms >= 0
 
+    def test_shared_schema_is_validated_under_its_lock(self, tmp_path: Path) -> None:
+        """Test that the level waits for the lock of a schema shared with other threads."""
+        schema_file = tmp_path / "schema.xsd"
+        schema_file.write_text(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="root"/></xs:schema>'
+        )
+        validator = XSDValidator(schema_file)
+        validator._load_schema()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with schema_lock(load_schema(schema_file)):
+                future = pool.submit(validator.validate, b"<root/>")
+                time.sleep(0.05)
+                assert not future.done()
+            assert future.result(timeout=1).findings == []
+
     def test_xsd_validation_without_schema(self) -> None:
         """Test XSD validation without a schema."""
         xml_content = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -57,7 +57,7 @@ class TestXSDValidation:
 
         assert result.level == "XSD"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
         assert any("PropertyName" in finding.message for finding in result.findings)
 
     def test_validate_invalid_enumeration(self):
@@ -83,7 +83,7 @@ class TestXSDValidation:
 
         assert result.level == "XSD"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
 
     def test_validate_missing_schema(self):
         """Test validation when schema file is missing."""
@@ -121,18 +121,16 @@ class TestXSDValidation:
         # but might fail schema validation
         assert result.duration_ms >= 0
 
-    def test_validate_from_file(self):
+    def test_validate_from_file(
+        self, valid_property_xml_path: Path, valid_property_xml_bytes: bytes
+    ):
         """Test validation from file path."""
-        fixture_path = (
-            Path(__file__).parent.parent.parent / "fixtures" / "mits5" / "valid-property.xml"
-        )
-
-        if fixture_path.exists():
-            result = validate_xsd(fixture_path)
+        result = validate_xsd(valid_property_xml_path)
 
-            assert result.level == "XSD"
-            # Should pass validation
-            assert len(result.findings) == 0
+        assert result.level == "XSD"
+        # Should pass validation
+        assert len(result.findings) == 0
+        assert validate_xsd(valid_property_xml_bytes).findings == result.findings
 
     def test_get_schema_info(self):
         """Test getting schema information."""
@@ -216,7 +214,7 @@ class TestXSDValidation:
 
         assert result.level == "XSD"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
 
     def test_validate_currency_format(self):
         """Test validation of currency format."""
@@ -251,4 +249,88 @@ class TestXSDValidation:
 
         assert result.level == "XSD"
         assert len(result.findings) > 0
-        assert any(finding.level == FindingLevel.ERROR for finding in result.findings)
+        assert FindingLevel.ERROR in {finding.level for finding in result.findings}
+
+    def test_compiled_schema_is_cached(self):
+        """Test that the compiled schema is reused until the file changes."""
+        from mits_validator.validation.xsd import load_schema
+
+        schema_path = (
+            Path(__file__).parent.parent.parent
+            / "rules"
+            / "xsd"
+            / "5.0"
+            / "PropertyMarketing-ILS-5.0.xsd"
+        )
+
+        assert load_schema(schema_path) is load_schema(schema_path)
+
+    def test_shared_schema_reports_each_documents_errors_across_threads(self):
+        """Test that threads validating with one cached schema get only their own errors."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from lxml import etree
+
+        from mits_validator.validation.xsd import load_schema
+
+        schema = load_schema(
+            Path(__file__).parent.parent.parent
+            / "rules"
+            / "xsd"
+            / "5.0"
+            / "PropertyMarketing-ILS-5.0.xsd"
+        )
+        ns = "http://www.mits.org/schema/PropertyMarketing/ILS/5.0"
+        valid = etree.fromstring(
+            f'<PropertyMarketing xmlns="{ns}" version="5.0" timestamp="2025-09-15T10:30:00Z">'
+            "<Property><PropertyID>P</PropertyID><PropertyName>N</PropertyName>"
+            "<PropertyType>Apartment</PropertyType><Address><StreetAddress>1 St</StreetAddress>"
+            "<City>C</City><State>CA</State><PostalCode>12345</PostalCode></Address>"
+            "</Property></PropertyMarketing>"
+        )
+        invalid = etree.fromstring(f'<PropertyMarketing xmlns="{ns}"><Bogus/></PropertyMarketing>')
+        expected = {
+            id(doc): len(validate_xsd(doc, schema=schema).findings) for doc in (valid, invalid)
+        }
+        assert expected[id(valid)] == 0
+        assert expected[id(invalid)] > 0
+
+        def run(doc):
+            return all(
+                len(validate_xsd(doc, schema=schema).findings) == expected[id(doc)]
+                for _ in range(250)
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run, [valid, invalid] * 4))
+
+        assert all(results)
+
+    def test_documents_keep_their_whitespace(self):
+        """Test that documents are validated with whitespace between elements intact."""
+        from mits_validator.validation.parsing import parse_document
+
+        root = parse_document(b"<root>\n  <a/>  <b/>\n</root>")
+
+        assert root.text == "\n  "
+        assert root[0].tail == "  "
+
+    def test_edited_schema_replaces_cached_entry(self, tmp_path):
+        """Test that recompiling an edited schema replaces its stale cache entry."""
+        import os
+
+        from mits_validator.validation.xsd import _XSD_CACHE, load_schema
+
+        schema_path = tmp_path / "schema.xsd"
+        schema_path.write_text(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="root"/></xs:schema>'
+        )
+        first = load_schema(schema_path)
+
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = load_schema(schema_path)
+
+        assert second is not first
+        assert _XSD_CACHE[str(schema_path)][1] is second